@@ -6,30 +6,98 @@ Main CLI entry point
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
 import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommandSpec(NamedTuple):
+    """Where a subcommand lives, plus what `cairn --help` shows without importing it."""
+
+    module: str
+    attr: str
+    help: str
+    hidden: bool = False
+
+
+# Subcommands are imported only when invoked, so `cairn --help` and light commands
+# don't pay for Textual, Rich progress, the writers or the icon mapping load.
+# `attr` is either a Typer sub-app (command group) or a plain command function.
+LAZY_COMMANDS: Dict[str, LazyCommandSpec] = {
+    "convert": LazyCommandSpec(
+        "cairn.commands.convert_cmd",
+        "convert",
+        "Convert between supported formats (advanced)",
+        hidden=True,
+    ),
+    "tui": LazyCommandSpec(
+        "cairn.commands.tui_cmd", "tui", "Launch full-screen TUI (CalTopo → OnX)"
+    ),
+    "config": LazyCommandSpec(
+        "cairn.commands.config_cmd", "app", "Manage configuration settings"
+    ),
+    "migrate": LazyCommandSpec(
+        "cairn.commands.migrate_cmd", "app", "Migration helpers (OnX ↔ CalTopo)"
+    ),
+    "catalog": LazyCommandSpec(
+        "cairn.commands.catalog_cmd", "app", "Maintain the observed icon catalog"
+    ),
+}
+
+
+class _LazyCommand(TyperCommand):
+    """Placeholder listed in help output; swapped for the real command on dispatch."""
+
+    def __init__(self, name: str, spec: LazyCommandSpec) -> None:
+        super().__init__(name=name, help=spec.help, hidden=spec.hidden)
+        self.spec = spec
+
+    def load(self) -> Any:
+        obj = getattr(import_module(self.spec.module), self.spec.attr)
+        if isinstance(obj, typer.Typer):
+            cmd = typer.main.get_group(obj)
+            cmd.help = cmd.help or self.spec.help
+        else:
+            sub = typer.Typer()
+            sub.command(name=self.name, help=self.spec.help, hidden=self.spec.hidden)(obj)
+            cmd = typer.main.get_command(sub)
+        cmd.name = self.name
+        cmd.hidden = self.spec.hidden
+        return cmd
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first use."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for name, spec in LAZY_COMMANDS.items():
+            self.commands.setdefault(name, _LazyCommand(name, spec))
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        # Help listings only need the placeholder's name/help.
+        return self.commands.get(cmd_name)
+
+    def resolve_command(
+        self, ctx: Any, args: List[str]
+    ) -> Tuple[Optional[str], Optional[Any], List[str]]:
+        name, cmd, rest = super().resolve_command(ctx, args)
+        if isinstance(cmd, _LazyCommand):
+            cmd = cmd.load()
+            self.commands[name] = cmd
+        return name, cmd, rest
 
-# Import command modules
-from cairn.commands import convert_cmd, config_cmd, migrate_cmd, tui_cmd
 
 app = typer.Typer(
     name="cairn",
     help="Migrate map data between OnX Backcountry and CalTopo",
+    cls=LazyGroup,
     no_args_is_help=True,
     add_completion=True,
 )
 
-# Register the convert command directly (not as a sub-app)
-app.command(
-    name="convert", help="Convert between supported formats (advanced)", hidden=True
-)(convert_cmd.convert)
-
-# Full-screen Textual TUI (opt-in)
-app.command(name="tui", help="Launch full-screen TUI (CalTopo → OnX)")(tui_cmd.tui)
-
-# Register command groups
-app.add_typer(config_cmd.app, name="config", help="Manage configuration settings")
-app.add_typer(migrate_cmd.app, name="migrate", help="Migration helpers (OnX ↔ CalTopo)")
-
 
 @app.callback()
 def callback() -> None:
@@ -44,6 +112,7 @@ def callback() -> None:
 
     Utilities:
       config                  - Manage configuration settings
+      catalog compact         - Fold pending icon catalog entries into the YAML
     """
     pass
 
@@ -1,5 +1,15 @@
-"""Command modules for Cairn CLI."""
+"""Command modules for Cairn CLI.
 
-from cairn.commands import convert_cmd, config_cmd, migrate_cmd
+Submodules are imported on first attribute access (see `cairn.cli.LAZY_COMMANDS`),
+so importing one command does not load the others.
+"""
 
-__all__ = ["convert_cmd", "config_cmd", "migrate_cmd"]
+from importlib import import_module
+
+__all__ = ["catalog_cmd", "convert_cmd", "config_cmd", "migrate_cmd", "tui_cmd"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,36 @@
+"""Icon catalog command for Cairn CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from cairn.core.icon_catalog import compact_catalog, default_catalog_path, journal_path
+
+app = typer.Typer()
+console = Console()
+
+
+@app.command("compact")
+def compact(
+    catalog: Optional[Path] = typer.Option(
+        None,
+        "--catalog",
+        help="Icon catalog YAML (default: cairn/data/icon_catalog.yaml)",
+    ),
+) -> None:
+    """Fold pending icon catalog journal entries into the YAML snapshot."""
+    path = catalog or default_catalog_path()
+    try:
+        folded = compact_catalog(path, wait=True)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/] Could not compact {path}: {e}")
+        raise typer.Exit(1)
+
+    if not folded:
+        console.print(f"[dim]Nothing to compact ({journal_path(path).name} is up to date)[/]")
+        return
+    console.print(f"[green]✓[/] Folded {folded} journal entr{'y' if folded == 1 else 'ies'} into {path}")
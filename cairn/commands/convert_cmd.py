@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import NamedTuple, Optional, List, Tuple
 import typer
 from enum import Enum
 from rich.console import Console
@@ -14,7 +17,14 @@ from rich.prompt import Prompt
 from rich.table import Table
 
 from cairn.core.parser import parse_geojson, get_file_summary, ParsedData
-from cairn.core.writers import write_kml_shapes, get_name_changes, clear_name_changes
+from cairn.core.precision import FULL_PRECISION, CoordinatePrecision, resolve_precision
+from cairn.core.writers import (
+    write_kml_shapes,
+    get_name_changes,
+    clear_name_changes,
+    capture_name_changes,
+    merge_name_changes,
+)
 from cairn.utils.utils import (
     chunk_data,
     sanitize_filename,
@@ -37,7 +47,11 @@ from cairn.core.preview import (
     interactive_edit_before_export,
     preview_sorted_order,
 )
-from cairn.core.icon_registry import IconRegistry, write_icon_report_markdown
+from cairn.core.icon_registry import (
+    OnxIconCollector,
+    get_icon_registry,
+    write_icon_report_markdown,
+)
 
 # New bidirectional adapters (OnX → CalTopo)
 from cairn.io.onx_gpx import read_onx_gpx
@@ -45,8 +59,14 @@ from cairn.io.onx_kml import read_onx_kml
 from cairn.core.merge import merge_onx_gpx_and_kml
 from cairn.core.dedup import apply_waypoint_dedup
 from cairn.core.shape_dedup import apply_shape_dedup
+from cairn.core.simplify import (
+    SimplifyReport,
+    apply_track_simplification,
+    normalize_simplify_method,
+    simplify_parsed_data,
+)
 from cairn.io.caltopo_geojson import write_caltopo_geojson
-from cairn.core.trace import TraceWriter
+from cairn.core.trace import TRACE_LEVELS, TraceWriter
 from cairn.core.diagnostics import document_inventory, dedup_inventory
 
 app = typer.Typer()
@@ -241,7 +261,9 @@ def handle_unmapped_symbols(
         )
 
         if selected_icon:
-            save_user_mapping(symbol, selected_icon, config_path=config_path)
+            save_user_mapping(
+                symbol, selected_icon, config_path=config_path, config=config
+            )
             console.print(
                 f"[green]✓[/] Mapped '[cyan]{symbol}[/]' → '[green]{selected_icon}[/]'"
             )
@@ -252,6 +274,152 @@ def handle_unmapped_symbols(
     return mappings_added
 
 
+def resolve_precision_option(
+    coord_decimals: Optional[int],
+    ele_decimals: Optional[int],
+    config: Optional[IconMappingConfig] = None,
+) -> CoordinatePrecision:
+    """`resolve_precision` for CLI flags; out-of-range values are usage errors."""
+    try:
+        return resolve_precision(coord_decimals, ele_decimals, config=config)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+
+
+def resolve_simplify_option(
+    tolerance_m: Optional[float], method: Optional[str]
+) -> Optional[Tuple[float, str]]:
+    """
+    Validate --simplify/--simplify-method.
+
+    Returns (tolerance_m, method), or None when simplification is off.
+    """
+    try:
+        method_norm = normalize_simplify_method(method)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    if tolerance_m is None or tolerance_m == 0:
+        return None
+    if tolerance_m < 0:
+        raise typer.BadParameter(
+            f"--simplify must be >= 0 metres (got {tolerance_m})"
+        )
+    return float(tolerance_m), method_norm
+
+
+def resolve_trace_options(level: Optional[str], sample: float) -> Tuple[str, float]:
+    """Validate --trace-level/--trace-sample; returns (level, sample)."""
+    level_norm = (level or "item").strip().lower()
+    if level_norm not in TRACE_LEVELS:
+        raise typer.BadParameter(
+            f"--trace-level must be one of {', '.join(TRACE_LEVELS)} (got {level!r})"
+        )
+    if not 0 < sample <= 1:
+        raise typer.BadParameter(f"--trace-sample must be in (0, 1] (got {sample})")
+    return level_norm, float(sample)
+
+
+def display_simplify_summary(report: SimplifyReport) -> None:
+    """Print the vertex reduction from track simplification."""
+    changed = sum(1 for t in report.tracks if t.removed)
+    console.print(
+        f"[dim]Simplified {changed}/{len(report.tracks)} track(s) "
+        f"({report.method}, {report.tolerance_m:g} m): "
+        f"{report.vertices_before:,} → {report.vertices_after:,} vertices "
+        f"(-{report.reduction:.1%})[/]"
+    )
+
+
+class _WriteJob(NamedTuple):
+    """One folder×type output (a GPX, possibly split into parts, or a KML)."""
+
+    kind: str  # "waypoints" | "tracks" | "shapes"
+    features: list
+    output_path: Path
+    folder_name: str
+
+
+def _run_write_job(
+    job: _WriteJob,
+    *,
+    config: Optional[IconMappingConfig],
+    split_gpx: bool,
+    max_gpx_bytes: int,
+    precision: CoordinatePrecision,
+) -> Tuple[list, dict]:
+    """
+    Write one job. Runs in the parent or in a pool worker.
+
+    Returns (manifest rows, name changes recorded while writing this job).
+    """
+    from cairn.core.writers import (
+        write_gpx_waypoints_maybe_split,
+        write_gpx_tracks_maybe_split,
+    )
+
+    with capture_name_changes() as changes:
+        if job.kind == "waypoints":
+            # Pass sort=False since items were already sorted for the preview
+            parts = write_gpx_waypoints_maybe_split(
+                job.features,
+                job.output_path,
+                job.folder_name,
+                sort=False,
+                config=config,
+                split=split_gpx,
+                max_bytes=max_gpx_bytes,
+                precision=precision,
+            )
+            rows = [(pth.name, "GPX (Waypoints)", cnt, sz) for pth, sz, cnt in parts]
+        elif job.kind == "tracks":
+            parts = write_gpx_tracks_maybe_split(
+                job.features,
+                job.output_path,
+                job.folder_name,
+                sort=False,
+                split=split_gpx,
+                max_bytes=max_gpx_bytes,
+                precision=precision,
+            )
+            rows = [(pth.name, "GPX (Tracks)", cnt, sz) for pth, sz, cnt in parts]
+        else:
+            file_size = write_kml_shapes(
+                job.features, job.output_path, job.folder_name, precision=precision
+            )
+            rows = [(job.output_path.name, "KML (Shapes)", len(job.features), file_size)]
+    return rows, changes
+
+
+def resolve_jobs_option(jobs: int) -> int:
+    """--jobs value to worker count (0 = one per CPU)."""
+    if jobs < 0:
+        raise typer.BadParameter(f"--jobs must be >= 0 (got {jobs})")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _execute_write_jobs(write_jobs: List[_WriteJob], jobs: int, **options) -> list:
+    """
+    Run write jobs, in a process pool when jobs > 1.
+
+    Manifest rows and name changes are merged in job order, so the result does
+    not depend on which worker finishes first.
+    """
+    run = partial(_run_write_job, **options)
+    if jobs <= 1 or len(write_jobs) <= 1:
+        results = [run(job) for job in write_jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(write_jobs))) as pool:
+            results = list(pool.map(run, write_jobs))
+
+    output_files = []
+    for rows, changes in results:
+        output_files.extend(rows)
+        merge_name_changes(changes)
+    return output_files
+
+
 def process_and_write_files(
     parsed_data: ParsedData,
     output_dir: Path,
@@ -262,30 +430,33 @@ def process_and_write_files(
     split_gpx: bool = True,
     max_gpx_bytes: Optional[int] = None,
     filename: Optional[str] = None,
+    precision: CoordinatePrecision = FULL_PRECISION,
+    jobs: int = 1,
 ) -> list:
     """
     Process folders and write output files.
 
+    Previews and confirmations run first, folder by folder; the confirmed
+    folder×type writes then run as independent jobs.
+
     Args:
         parsed_data: Parsed GeoJSON data
         output_dir: Output directory path
         sort: If True, sort items using natural sort order
         skip_confirmation: If True, skip the order confirmation prompt
         config: Icon mapping config for waypoint previews
+        precision: Coordinate decimals policy passed to every writer
+        jobs: Number of worker processes for writing (1 = in-process)
 
     Returns:
         List of (filename, format, count, size) tuples for the manifest
     """
-    output_files = []
+    write_jobs: List[_WriteJob] = []
 
     # Clear name changes tracker before processing
     clear_name_changes()
 
     from cairn.core.writers import DEFAULT_MAX_GPX_BYTES as _DEFAULT_MAX_GPX_BYTES
-    from cairn.core.writers import (
-        write_gpx_waypoints_maybe_split,
-        write_gpx_tracks_maybe_split,
-    )
 
     # Defensive: keep defaults even if caller didn't pass new args (older call sites).
     if max_gpx_bytes is None:
@@ -329,19 +500,11 @@ def process_and_write_files(
                 sorted_waypoints, "waypoints", folder_name, skip_confirmation, config
             ):
                 console.print("[yellow]Export cancelled by user.[/]")
-                return output_files
+                break
 
             # Write in sorted order - OnX displays items in the same order as the GPX file
             write_order_waypoints = sorted_waypoints
 
-            # Debug logging disabled (logger not configured)
-            # if logger.isEnabledFor(logging.DEBUG):
-            #     logger.debug(f"[DEBUG] Waypoint order before write ({folder_name}):")
-            #     for i, wp in enumerate(write_order_waypoints[:20], 1):
-            #         logger.debug(f"  {i}. {wp.title}")
-            #     if len(write_order_waypoints) > 20:
-            #         logger.debug(f"  ... and {len(write_order_waypoints) - 20} more waypoints")
-
             if total_waypoints > 2500:
                 console.print(
                     f"\n📂 Processing '[cyan]{folder_name}[/]' ({total_waypoints} waypoints)..."
@@ -353,35 +516,19 @@ def process_and_write_files(
                 for i, chunk in enumerate(chunks, 1):
                     part_name = f"{safe_name}_Waypoints_Part{i}"
                     output_path = output_dir / f"{part_name}.gpx"
-                    # Pass sort=False since we already sorted and reversed
-                    written_parts = write_gpx_waypoints_maybe_split(
-                        chunk,
-                        output_path,
-                        f"{folder_name} - Part {i}",
-                        sort=False,
-                        config=config,
-                        split=split_gpx,
-                        max_bytes=max_gpx_bytes,
+                    write_jobs.append(
+                        _WriteJob(
+                            "waypoints", chunk, output_path, f"{folder_name} - Part {i}"
+                        )
                     )
-                    for pth, sz, cnt in written_parts:
-                        output_files.append((pth.name, "GPX (Waypoints)", cnt, sz))
                     console.print(
                         f"       ├── 📄 [green]{output_path.name}[/] ({len(chunk)} items)"
                     )
             else:
                 output_path = output_dir / f"{safe_name}_Waypoints.gpx"
-                # Pass sort=False since we already sorted and reversed
-                written_parts = write_gpx_waypoints_maybe_split(
-                    write_order_waypoints,
-                    output_path,
-                    folder_name,
-                    sort=False,
-                    config=config,
-                    split=split_gpx,
-                    max_bytes=max_gpx_bytes,
+                write_jobs.append(
+                    _WriteJob("waypoints", write_order_waypoints, output_path, folder_name)
                 )
-                for pth, sz, cnt in written_parts:
-                    output_files.append((pth.name, "GPX (Waypoints)", cnt, sz))
 
         # Handle tracks
         if tracks:
@@ -398,7 +545,7 @@ def process_and_write_files(
                 sorted_tracks, "tracks", folder_name, skip_confirmation
             ):
                 console.print("[yellow]Export cancelled by user.[/]")
-                return output_files
+                break
 
             # Write in sorted order - OnX displays items in the same order as the GPX file
             write_order_tracks = sorted_tracks
@@ -414,33 +561,17 @@ def process_and_write_files(
                 for i, chunk in enumerate(chunks, 1):
                     part_name = f"{safe_name}_Tracks_Part{i}"
                     output_path = output_dir / f"{part_name}.gpx"
-                    # Pass sort=False since we already sorted and reversed
-                    written_parts = write_gpx_tracks_maybe_split(
-                        chunk,
-                        output_path,
-                        f"{folder_name} - Part {i}",
-                        sort=False,
-                        split=split_gpx,
-                        max_bytes=max_gpx_bytes,
+                    write_jobs.append(
+                        _WriteJob("tracks", chunk, output_path, f"{folder_name} - Part {i}")
                     )
-                    for pth, sz, cnt in written_parts:
-                        output_files.append((pth.name, "GPX (Tracks)", cnt, sz))
                     console.print(
                         f"       ├── 📄 [green]{output_path.name}[/] ({len(chunk)} items)"
                     )
             else:
                 output_path = output_dir / f"{safe_name}_Tracks.gpx"
-                # Pass sort=False since we already sorted and reversed
-                written_parts = write_gpx_tracks_maybe_split(
-                    write_order_tracks,
-                    output_path,
-                    folder_name,
-                    sort=False,
-                    split=split_gpx,
-                    max_bytes=max_gpx_bytes,
+                write_jobs.append(
+                    _WriteJob("tracks", write_order_tracks, output_path, folder_name)
                 )
-                for pth, sz, cnt in written_parts:
-                    output_files.append((pth.name, "GPX (Tracks)", cnt, sz))
 
         # Handle shapes (KML)
         if shapes:
@@ -457,7 +588,7 @@ def process_and_write_files(
                 sorted_shapes, "shapes", folder_name, skip_confirmation
             ):
                 console.print("[yellow]Export cancelled by user.[/]")
-                return output_files
+                break
 
             # Write in sorted order - OnX displays items in the same order as the file
             write_order_shapes = sorted_shapes
@@ -473,30 +604,27 @@ def process_and_write_files(
                 for i, chunk in enumerate(chunks, 1):
                     part_name = f"{safe_name}_Shapes_Part{i}"
                     output_path = output_dir / f"{part_name}.kml"
-                    file_size = write_kml_shapes(
-                        chunk, output_path, f"{folder_name} - Part {i}"
-                    )
-                    output_files.append(
-                        (f"{part_name}.kml", "KML (Shapes)", len(chunk), file_size)
+                    write_jobs.append(
+                        _WriteJob("shapes", chunk, output_path, f"{folder_name} - Part {i}")
                     )
                     console.print(
                         f"       ├── 📄 [green]{part_name}.kml[/] ({len(chunk)} items)"
                     )
             else:
                 output_path = output_dir / f"{safe_name}_Shapes.kml"
-                file_size = write_kml_shapes(
-                    write_order_shapes, output_path, folder_name
-                )
-                output_files.append(
-                    (
-                        f"{safe_name}_Shapes.kml",
-                        "KML (Shapes)",
-                        len(write_order_shapes),
-                        file_size,
-                    )
+                write_jobs.append(
+                    _WriteJob("shapes", write_order_shapes, output_path, folder_name)
                 )
 
-    return output_files
+    # Items confirmed before a cancellation are still written, as before.
+    return _execute_write_jobs(
+        write_jobs,
+        jobs,
+        config=config,
+        split_gpx=split_gpx,
+        max_gpx_bytes=max_gpx_bytes,
+        precision=precision,
+    )
 
 
 def display_manifest(output_files: list) -> None:
@@ -693,6 +821,12 @@ def convert(
         "--split-gpx/--no-split-gpx",
         help="Automatically split GPX files that exceed the max size into multiple numbered parts.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Write folder outputs in N parallel processes (0 = one per CPU).",
+    ),
     yes: bool = typer.Option(
         False,
         "--yes",
@@ -714,6 +848,43 @@ def convert(
         "--dedupe-shapes/--no-dedupe-shapes",
         help="Deduplicate shapes (polygons/lines) using fuzzy geometry match (default: enabled)",
     ),
+    dedupe_radius: Optional[float] = typer.Option(
+        None,
+        "--dedupe-radius",
+        min=0.0,
+        help="Treat same-name waypoints within this many metres as duplicates (default: exact 6-decimal match)",
+    ),
+    line_dedupe_tolerance: Optional[float] = typer.Option(
+        None,
+        "--line-dedupe-tolerance",
+        min=0.0,
+        help="Also drop same-name lines whose paths are within this many metres (re-recorded/resampled copies)",
+    ),
+    compact_geojson: bool = typer.Option(
+        False,
+        "--compact-geojson",
+        help="Write GeoJSON without indentation (much smaller files for dense tracks)",
+    ),
+    coord_decimals: Optional[int] = typer.Option(
+        None,
+        "--coord-decimals",
+        help="Decimals written for lat/lon (6 is ~0.1 m; smaller files, fewer GPX parts). Default: config `coordinate_decimals`, else full precision.",
+    ),
+    ele_decimals: Optional[int] = typer.Option(
+        None,
+        "--ele-decimals",
+        help="Decimals written for elevation (e.g. 1). Default: config `elevation_decimals`, else full precision.",
+    ),
+    simplify_tolerance: Optional[float] = typer.Option(
+        None,
+        "--simplify",
+        help="Simplify tracks (metres): drop vertices that move the line less than this many metres (e.g. 2). Elevation/time of kept points is preserved.",
+    ),
+    simplify_method: str = typer.Option(
+        "dp",
+        "--simplify-method",
+        help="Track simplification algorithm: dp (Douglas-Peucker, default) or vw (Visvalingam-Whyatt)",
+    ),
     description_mode: str = typer.Option(
         "notes-only",
         "--description-mode",
@@ -727,7 +898,17 @@ def convert(
     trace_path: Optional[Path] = typer.Option(
         None,
         "--trace",
-        help="Write JSONL trace log of transformation steps",
+        help="Write JSONL trace log of transformation steps (.gz/.zst paths are compressed)",
+    ),
+    trace_level: str = typer.Option(
+        "item",
+        "--trace-level",
+        help="Trace verbosity: run, stage, or item (default; one event per waypoint/feature)",
+    ),
+    trace_sample: float = typer.Option(
+        1.0,
+        "--trace-sample",
+        help="Fraction of per-item trace events to keep (0-1, default: 1)",
     ),
 ):
     """
@@ -764,6 +945,9 @@ def convert(
 
     Or edit the source GeoJSON file directly.
     """
+    # Load configuration (shared by both conversion paths)
+    config = load_config(config_file)
+
     # ---------------------------------------------------------------------
     # New path: OnX → CalTopo GeoJSON
     # ---------------------------------------------------------------------
@@ -783,8 +967,15 @@ def convert(
 
         if trace_path:
             trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_level, trace_sample = resolve_trace_options(trace_level, trace_sample)
 
-        trace_ctx = TraceWriter(trace_path) if trace_path else None
+        trace_ctx = (
+            TraceWriter(trace_path, level=trace_level, sample=trace_sample)
+            if trace_path
+            else None
+        )
+        # Raw source strings are only surfaced by tracing and debug descriptions.
+        lean_ingest = trace_ctx is None and (description_mode or "").strip().lower() != "debug"
         try:
             if trace_ctx:
                 trace_ctx.emit(
@@ -796,7 +987,9 @@ def convert(
                 )
 
             try:
-                gpx_doc = read_onx_gpx(input_file, trace=trace_ctx)
+                gpx_doc = read_onx_gpx(
+                    input_file, trace=trace_ctx, lean=lean_ingest
+                )
                 doc = gpx_doc
             except ValueError as e:
                 console.print("\n[bold red]❌ Error reading GPX file:[/]")
@@ -810,7 +1003,9 @@ def convert(
                     )
                     raise typer.Exit(1)
                 try:
-                    kml_doc = read_onx_kml(kml_file, trace=trace_ctx)
+                    kml_doc = read_onx_kml(
+                        kml_file, trace=trace_ctx, lean=lean_ingest
+                    )
                     doc = merge_onx_gpx_and_kml(doc, kml_doc, trace=trace_ctx)
                 except ValueError as e:
                     console.print("\n[bold red]❌ Error reading KML file:[/]")
@@ -824,7 +1019,9 @@ def convert(
 
             report = None
             if dedupe:
-                report = apply_waypoint_dedup(doc, trace=trace_ctx)
+                report = apply_waypoint_dedup(
+                    doc, trace=trace_ctx, radius_m=dedupe_radius
+                )
 
             if trace_ctx:
                 trace_ctx.emit(
@@ -839,7 +1036,16 @@ def convert(
 
             dropped_items: list = []
             if dedupe_shapes:
-                shape_report, dropped_items = apply_shape_dedup(doc, trace=trace_ctx)
+                shape_report, dropped_items = apply_shape_dedup(
+                    doc, trace=trace_ctx, line_tolerance_m=line_dedupe_tolerance
+                )
+
+            simplify = resolve_simplify_option(simplify_tolerance, simplify_method)
+            if simplify is not None:
+                simplify_report = apply_track_simplification(
+                    doc, simplify[0], method=simplify[1], trace=trace_ctx
+                )
+                display_simplify_summary(simplify_report)
 
             out_path.parent.mkdir(parents=True, exist_ok=True)
             desc_mode_norm = (description_mode or "").strip().lower().replace("-", "_")
@@ -860,19 +1066,26 @@ def convert(
                     "--route-color-strategy must be one of: palette, default-blue, none"
                 )
 
+            precision = resolve_precision_option(coord_decimals, ele_decimals, config)
+
             write_caltopo_geojson(
                 doc,
                 out_path,
                 trace=trace_ctx,
                 description_mode=desc_mode_norm,  # type: ignore[arg-type]
                 route_color_strategy=route_color_norm,  # type: ignore[arg-type]
+                compact=compact_geojson,
+                precision=precision,
             )
 
             # Icon report + catalog (best-effort; never fails conversion)
             try:
-                reg = IconRegistry()
-                inv = reg.collect_onx_icon_inventory(doc)
-                rows = reg.collect_onx_icon_mapping_rows(doc)
+                reg = get_icon_registry()
+                icons = OnxIconCollector()
+                for wp in doc.waypoints():
+                    icons.add_waypoint(wp)
+                inv = icons.inventory()
+                rows = icons.mapping_rows(reg)
                 icon_report_path = out_path.with_name(out_path.stem + "_ICON_REPORT.md")
                 write_icon_report_markdown(
                     output_path=icon_report_path,
@@ -909,6 +1122,8 @@ def convert(
                     trace=trace_ctx,
                     description_mode=desc_mode_norm,  # type: ignore[arg-type]
                     route_color_strategy=route_color_norm,  # type: ignore[arg-type]
+                    compact=compact_geojson,
+                    precision=precision,
                 )
 
             console.print(
@@ -938,9 +1153,6 @@ def convert(
                 trace_ctx.emit({"event": "run.end"})
                 trace_ctx.close()
 
-    # Load configuration
-    config = load_config(config_file)
-
     # Print header
     print_header()
 
@@ -1019,7 +1231,7 @@ def convert(
 
     # Icon report + catalog for CalTopo → OnX (best-effort; never fails conversion)
     try:
-        reg = IconRegistry()
+        reg = get_icon_registry()
         inventory = reg.collect_caltopo_symbol_inventory(parsed_data)
 
         from cairn.core.config import GENERIC_SYMBOLS
@@ -1088,6 +1300,12 @@ def convert(
     except Exception:
         pass
 
+    simplify = resolve_simplify_option(simplify_tolerance, simplify_method)
+    if simplify is not None:
+        display_simplify_summary(
+            simplify_parsed_data(parsed_data, simplify[0], method=simplify[1])
+        )
+
     # Process and write files with sorting and confirmation
     sort_enabled = not no_sort
     console.print(f"[bold white]Writing files to[/] [underline]{output_dir}[/]...\n")
@@ -1099,6 +1317,8 @@ def convert(
         config=config,
         split_gpx=split_gpx,
         max_gpx_bytes=int(max(0.0, float(max_gpx_mb)) * 1024 * 1024),
+        precision=resolve_precision_option(coord_decimals, ele_decimals, config),
+        jobs=resolve_jobs_option(jobs),
     )
 
     # Display manifest
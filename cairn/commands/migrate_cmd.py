@@ -30,13 +30,15 @@ from cairn.ui.interactive import InteractiveUI, is_interactive_tty
 
 from cairn.core.dedup import apply_waypoint_dedup
 from cairn.core.diagnostics import (
-    check_data_quality,
+    IngestCollector,
     dedup_inventory,
     document_inventory,
 )
-from cairn.core.icon_registry import IconRegistry, write_icon_report_markdown
+from cairn.core.icon_registry import get_icon_registry, write_icon_report_markdown
 from cairn.core.merge import merge_onx_gpx_and_kml
+from cairn.core.precision import FULL_PRECISION, CoordinatePrecision
 from cairn.core.shape_dedup import apply_shape_dedup
+from cairn.core.simplify import apply_track_simplification, simplify_parsed_data
 from cairn.core.trace import TraceWriter
 from cairn.io.caltopo_geojson import write_caltopo_geojson
 from cairn.io.onx_gpx import read_onx_gpx
@@ -141,6 +143,13 @@ def _run_onx_to_caltopo_pipeline(
     trace_path: Optional[Path],
     description_mode: str,
     route_color_strategy: str,
+    dedupe_radius: Optional[float] = None,
+    line_dedupe_tolerance: Optional[float] = None,
+    compact_geojson: bool = False,
+    precision: CoordinatePrecision = FULL_PRECISION,
+    simplify: Optional[Tuple[float, str]] = None,
+    trace_level: str = "item",
+    trace_sample: float = 1.0,
 ) -> None:
     primary_path = out_dir / f"{base}.json"
     dropped_shapes_path = out_dir / f"{base}_dropped_shapes.json"
@@ -154,7 +163,13 @@ def _run_onx_to_caltopo_pipeline(
     else:
         resolved_trace_path = out_dir / f"{base}_trace.jsonl"
 
-    trace_ctx = TraceWriter(resolved_trace_path) if resolved_trace_path else None
+    trace_ctx = (
+        TraceWriter(resolved_trace_path, level=trace_level, sample=trace_sample)
+        if resolved_trace_path
+        else None
+    )
+    # Raw source strings are only surfaced by tracing and debug descriptions.
+    lean_ingest = trace_ctx is None and (description_mode or "").strip().lower() != "debug"
     try:
         if trace_ctx:
             trace_ctx.emit({"event": "run.start", "command": "migrate.OnX-to-caltopo"})
@@ -171,7 +186,7 @@ def _run_onx_to_caltopo_pipeline(
 
             progress.update(task, description="Reading GPX")
             try:
-                doc = read_onx_gpx(gpx, trace=trace_ctx)
+                doc = read_onx_gpx(gpx, trace=trace_ctx, lean=lean_ingest)
             except ValueError as e:
                 progress.stop()
                 console.print("\n[bold red]❌ Error reading GPX file:[/]")
@@ -183,7 +198,7 @@ def _run_onx_to_caltopo_pipeline(
             if kml is not None:
                 progress.update(task, description="Reading KML")
                 try:
-                    kml_doc = read_onx_kml(kml, trace=trace_ctx)
+                    kml_doc = read_onx_kml(kml, trace=trace_ctx, lean=lean_ingest)
                 except ValueError as e:
                     progress.stop()
                     console.print("\n[bold red]❌ Error reading KML file:[/]")
@@ -199,27 +214,34 @@ def _run_onx_to_caltopo_pipeline(
                 doc = merge_onx_gpx_and_kml(doc, kml_doc, trace=trace_ctx)
             progress.advance(task)
 
+            # One pass over the merged document feeds the icon inventory, the
+            # mapping rows and the data-quality checks.
+            collected = IngestCollector.from_document(doc)
+
             # Icon inventory + mapping report (before dedup so it reflects incoming data)
             try:
-                registry = IconRegistry()
-                onx_icon_inventory = registry.collect_onx_icon_inventory(doc)
-                onx_icon_rows = registry.collect_onx_icon_mapping_rows(doc)
-
-                # Append to repo catalog (policy: append catalog only; no auto-mapping)
-                registry.append_onx_icon_inventory_to_catalog(onx_icon_inventory)
+                registry = get_icon_registry()
+                onx_icon_inventory = collected.icons.inventory()
+                onx_icon_rows = collected.icons.mapping_rows(registry)
 
                 icon_report_path = out_dir / f"{base}_ICON_REPORT.md"
                 write_icon_report_markdown(
                     output_path=icon_report_path,
-                    title="OnX → CalTopo icon report",
+                    title="OnX → CalTopo icon mapping report",
                     rows=onx_icon_rows,
                     inventories=onx_icon_inventory,
                     notes=(
+                        f"Input GPX: `{gpx.name}`",
+                        f"Input KML: `{kml.name if kml else 'None'}`",
+                        f"Output GeoJSON: `{primary_path.name}`",
                         f"Mappings source: `{registry.mappings_path}`",
                         f"Catalog updated: `{registry.catalog_path}`",
                         "Counts reflect input after GPX+KML merge and before dedup.",
                     ),
                 )
+
+                # Append to repo catalog (policy: append catalog only; no auto-mapping)
+                registry.append_onx_icon_inventory_to_catalog(onx_icon_inventory)
                 if trace_ctx:
                     trace_ctx.emit(
                         {
@@ -241,14 +263,16 @@ def _run_onx_to_caltopo_pipeline(
 
             # Check data quality and show warnings
             progress.update(task, description="Checking data quality")
-            quality_warnings = check_data_quality(doc)
+            quality_warnings = collected.quality.warnings()
             if trace_ctx:
                 trace_ctx.emit({"event": "data_quality.check", **quality_warnings})
 
             wp_report = None
             if dedupe_waypoints:
                 progress.update(task, description="Deduplicating waypoints")
-                wp_report = apply_waypoint_dedup(doc, trace=trace_ctx)
+                wp_report = apply_waypoint_dedup(
+                    doc, trace=trace_ctx, radius_m=dedupe_radius
+                )
                 if trace_ctx and wp_report is not None:
                     trace_ctx.emit(
                         {"event": "dedup.report", **dedup_inventory(wp_report)}
@@ -261,9 +285,18 @@ def _run_onx_to_caltopo_pipeline(
             shape_report = None
             dropped_items = []
             if dedupe_shapes:
-                shape_report, dropped_items = apply_shape_dedup(doc, trace=trace_ctx)
+                shape_report, dropped_items = apply_shape_dedup(
+                    doc, trace=trace_ctx, line_tolerance_m=line_dedupe_tolerance
+                )
             progress.advance(task)
 
+            simplify_report = None
+            if simplify is not None:
+                progress.update(task, description="Simplifying tracks")
+                simplify_report = apply_track_simplification(
+                    doc, simplify[0], method=simplify[1], trace=trace_ctx
+                )
+
             progress.update(task, description="Writing CalTopo GeoJSON")
             desc_mode_norm = (description_mode or "").strip().lower().replace("-", "_")
             if desc_mode_norm in ("notes_only", "notes"):
@@ -283,36 +316,14 @@ def _run_onx_to_caltopo_pipeline(
                     "--route-color-strategy must be one of: palette, default-blue, none"
                 )
 
-            # Icon report + catalog (best-effort; never fails the migration)
-            try:
-                reg = IconRegistry()
-                inventory = reg.collect_onx_icon_inventory(doc)
-                rows = reg.collect_onx_icon_mapping_rows(doc)
-                icon_report_path = out_dir / f"{base}_ICON_REPORT.md"
-                write_icon_report_markdown(
-                    output_path=icon_report_path,
-                    title="OnX → CalTopo icon mapping report",
-                    inventories=inventory,
-                    rows=rows,
-                    notes=(
-                        [
-                            f"Input GPX: `{gpx.name}`",
-                            f"Input KML: `{kml.name if kml else 'None'}`",
-                            f"Output GeoJSON: `{primary_path.name}`",
-                        ]
-                    ),
-                )
-                reg.append_onx_icon_inventory_to_catalog(inventory)
-            except Exception as e:
-                if trace_ctx:
-                    trace_ctx.emit({"event": "icon_report.error", "error": str(e)})
-
             write_caltopo_geojson(
                 doc,
                 primary_path,
                 trace=trace_ctx,
                 description_mode=desc_mode_norm,  # type: ignore[arg-type]
                 route_color_strategy=route_color_norm,  # type: ignore[arg-type]
+                compact=compact_geojson,
+                precision=precision,
             )
 
             # Validate output file was written successfully
@@ -350,6 +361,8 @@ def _run_onx_to_caltopo_pipeline(
                 trace=trace_ctx,
                 description_mode=desc_mode_norm,  # type: ignore[arg-type]
                 route_color_strategy=route_color_norm,  # type: ignore[arg-type]
+                compact=compact_geojson,
+                precision=precision,
             )
 
             # Validate secondary files were written
@@ -378,6 +391,12 @@ def _run_onx_to_caltopo_pipeline(
                     f"\n[yellow]⚠️  Found {len(quality_warnings['suspicious_coords'])} waypoint(s) with suspicious coordinates near (0,0)[/]"
                 )
 
+        if simplify_report is not None:
+            from cairn.commands.convert_cmd import display_simplify_summary
+
+            console.print()
+            display_simplify_summary(simplify_report)
+
         console.print("\n[bold]Created files:[/]")
 
         console.print("\nPrimary CalTopo-importable GeoJSON (deduped by default):")
@@ -673,6 +692,12 @@ def onx_to_caltopo(
         "-o",
         help="Output directory (defaults to <input-dir>/caltopo_ready)",
     ),
+    config_file: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Configuration file (coordinate_decimals / elevation_decimals defaults)",
+    ),
     name: Optional[str] = typer.Option(
         None,
         "--name",
@@ -688,6 +713,43 @@ def onx_to_caltopo(
         "--dedupe-shapes/--no-dedupe-shapes",
         help="Remove duplicate shapes (lines/polygons) with identical geometry",
     ),
+    dedupe_radius: Optional[float] = typer.Option(
+        None,
+        "--dedupe-radius",
+        min=0.0,
+        help="Treat same-name waypoints within this many metres as duplicates (default: exact 6-decimal match)",
+    ),
+    line_dedupe_tolerance: Optional[float] = typer.Option(
+        None,
+        "--line-dedupe-tolerance",
+        min=0.0,
+        help="Also drop same-name lines whose paths are within this many metres (re-recorded/resampled copies)",
+    ),
+    compact_geojson: bool = typer.Option(
+        False,
+        "--compact-geojson",
+        help="Write GeoJSON without indentation (much smaller files for dense tracks)",
+    ),
+    coord_decimals: Optional[int] = typer.Option(
+        None,
+        "--coord-decimals",
+        help="Decimals written for lat/lon (6 is ~0.1 m; smaller files, fewer GPX parts). Default: config `coordinate_decimals`, else full precision.",
+    ),
+    ele_decimals: Optional[int] = typer.Option(
+        None,
+        "--ele-decimals",
+        help="Decimals written for elevation (e.g. 1). Default: config `elevation_decimals`, else full precision.",
+    ),
+    simplify_tolerance: Optional[float] = typer.Option(
+        None,
+        "--simplify",
+        help="Simplify tracks (metres): drop vertices that move the line less than this many metres (e.g. 2). Elevation/time of kept points is preserved.",
+    ),
+    simplify_method: str = typer.Option(
+        "dp",
+        "--simplify-method",
+        help="Track simplification algorithm: dp (Douglas-Peucker, default) or vw (Visvalingam-Whyatt)",
+    ),
     trace: bool = typer.Option(
         True,
         "--trace/--no-trace",
@@ -696,7 +758,17 @@ def onx_to_caltopo(
     trace_path: Optional[Path] = typer.Option(
         None,
         "--trace-path",
-        help="Custom path for trace log (overrides default location)",
+        help="Custom path for trace log (overrides default location; .gz/.zst paths are compressed)",
+    ),
+    trace_level: str = typer.Option(
+        "item",
+        "--trace-level",
+        help="Trace verbosity: run, stage, or item (default; one event per waypoint/feature)",
+    ),
+    trace_sample: float = typer.Option(
+        1.0,
+        "--trace-sample",
+        help="Fraction of per-item trace events to keep (0-1, default: 1)",
     ),
     description_mode: str = typer.Option(
         "notes-only",
@@ -800,6 +872,15 @@ def onx_to_caltopo(
             console.print("[yellow]Migration cancelled[/]")
             raise typer.Exit(0)
 
+    from cairn.commands.convert_cmd import (
+        resolve_precision_option,
+        resolve_simplify_option,
+        resolve_trace_options,
+    )
+    from cairn.core.config import load_config
+
+    trace_level, trace_sample = resolve_trace_options(trace_level, trace_sample)
+
     _run_onx_to_caltopo_pipeline(
         gpx=gpx,
         kml=kml,
@@ -807,8 +888,17 @@ def onx_to_caltopo(
         base=base,
         dedupe_waypoints=dedupe_waypoints,
         dedupe_shapes=dedupe_shapes,
+        dedupe_radius=dedupe_radius,
+        line_dedupe_tolerance=line_dedupe_tolerance,
+        compact_geojson=compact_geojson,
+        precision=resolve_precision_option(
+            coord_decimals, ele_decimals, load_config(config_file)
+        ),
+        simplify=resolve_simplify_option(simplify_tolerance, simplify_method),
         trace=trace,
         trace_path=trace_path,
+        trace_level=trace_level,
+        trace_sample=trace_sample,
         description_mode=description_mode,
         route_color_strategy=route_color_strategy,
     )
@@ -826,6 +916,12 @@ def migrate_to_caltopo(
         "-o",
         help="Output directory (defaults to <input-dir>/caltopo_ready)",
     ),
+    config_file: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Configuration file (coordinate_decimals / elevation_decimals defaults)",
+    ),
     name: Optional[str] = typer.Option(
         None,
         "--name",
@@ -841,6 +937,43 @@ def migrate_to_caltopo(
         "--dedupe-shapes/--no-dedupe-shapes",
         help="Remove duplicate shapes (lines/polygons) with identical geometry",
     ),
+    dedupe_radius: Optional[float] = typer.Option(
+        None,
+        "--dedupe-radius",
+        min=0.0,
+        help="Treat same-name waypoints within this many metres as duplicates (default: exact 6-decimal match)",
+    ),
+    line_dedupe_tolerance: Optional[float] = typer.Option(
+        None,
+        "--line-dedupe-tolerance",
+        min=0.0,
+        help="Also drop same-name lines whose paths are within this many metres (re-recorded/resampled copies)",
+    ),
+    compact_geojson: bool = typer.Option(
+        False,
+        "--compact-geojson",
+        help="Write GeoJSON without indentation (much smaller files for dense tracks)",
+    ),
+    coord_decimals: Optional[int] = typer.Option(
+        None,
+        "--coord-decimals",
+        help="Decimals written for lat/lon (6 is ~0.1 m; smaller files, fewer GPX parts). Default: config `coordinate_decimals`, else full precision.",
+    ),
+    ele_decimals: Optional[int] = typer.Option(
+        None,
+        "--ele-decimals",
+        help="Decimals written for elevation (e.g. 1). Default: config `elevation_decimals`, else full precision.",
+    ),
+    simplify_tolerance: Optional[float] = typer.Option(
+        None,
+        "--simplify",
+        help="Simplify tracks (metres): drop vertices that move the line less than this many metres (e.g. 2). Elevation/time of kept points is preserved.",
+    ),
+    simplify_method: str = typer.Option(
+        "dp",
+        "--simplify-method",
+        help="Track simplification algorithm: dp (Douglas-Peucker, default) or vw (Visvalingam-Whyatt)",
+    ),
     trace: bool = typer.Option(
         True,
         "--trace/--no-trace",
@@ -849,7 +982,17 @@ def migrate_to_caltopo(
     trace_path: Optional[Path] = typer.Option(
         None,
         "--trace-path",
-        help="Custom path for trace log (overrides default location)",
+        help="Custom path for trace log (overrides default location; .gz/.zst paths are compressed)",
+    ),
+    trace_level: str = typer.Option(
+        "item",
+        "--trace-level",
+        help="Trace verbosity: run, stage, or item (default; one event per waypoint/feature)",
+    ),
+    trace_sample: float = typer.Option(
+        1.0,
+        "--trace-sample",
+        help="Fraction of per-item trace events to keep (0-1, default: 1)",
     ),
     description_mode: str = typer.Option(
         "notes-only",
@@ -942,6 +1085,15 @@ def migrate_to_caltopo(
         console.print("[yellow]Migration cancelled[/]")
         raise typer.Exit(0)
 
+    from cairn.commands.convert_cmd import (
+        resolve_precision_option,
+        resolve_simplify_option,
+        resolve_trace_options,
+    )
+    from cairn.core.config import load_config
+
+    trace_level, trace_sample = resolve_trace_options(trace_level, trace_sample)
+
     _run_onx_to_caltopo_pipeline(
         gpx=gpx,
         kml=kml,
@@ -949,8 +1101,17 @@ def migrate_to_caltopo(
         base=base,
         dedupe_waypoints=dedupe_waypoints,
         dedupe_shapes=dedupe_shapes,
+        dedupe_radius=dedupe_radius,
+        line_dedupe_tolerance=line_dedupe_tolerance,
+        compact_geojson=compact_geojson,
+        precision=resolve_precision_option(
+            coord_decimals, ele_decimals, load_config(config_file)
+        ),
+        simplify=resolve_simplify_option(simplify_tolerance, simplify_method),
         trace=trace,
         trace_path=trace_path,
+        trace_level=trace_level,
+        trace_sample=trace_sample,
         description_mode=description_mode,
         route_color_strategy=route_color_strategy,
     )
@@ -994,6 +1155,32 @@ def caltopo_to_onx(
         "--split-gpx/--no-split-gpx",
         help="Automatically split GPX files that exceed the max size into multiple numbered parts.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Write folder outputs in N parallel processes (0 = one per CPU).",
+    ),
+    coord_decimals: Optional[int] = typer.Option(
+        None,
+        "--coord-decimals",
+        help="Decimals written for lat/lon (6 is ~0.1 m; smaller files, fewer GPX parts). Default: config `coordinate_decimals`, else full precision.",
+    ),
+    ele_decimals: Optional[int] = typer.Option(
+        None,
+        "--ele-decimals",
+        help="Decimals written for elevation (e.g. 1). Default: config `elevation_decimals`, else full precision.",
+    ),
+    simplify_tolerance: Optional[float] = typer.Option(
+        None,
+        "--simplify",
+        help="Simplify tracks (metres): drop vertices that move the line less than this many metres (e.g. 2). Elevation/time of kept points is preserved.",
+    ),
+    simplify_method: str = typer.Option(
+        "dp",
+        "--simplify-method",
+        help="Track simplification algorithm: dp (Douglas-Peucker, default) or vw (Visvalingam-Whyatt)",
+    ),
     session_file: Optional[Path] = typer.Option(
         None,
         "--session",
@@ -1037,7 +1224,11 @@ def caltopo_to_onx(
         collect_unmapped_caltopo_symbols,
         display_unmapped_symbols,
         handle_unmapped_symbols,
+        display_simplify_summary,
         process_and_write_files,
+        resolve_jobs_option,
+        resolve_precision_option,
+        resolve_simplify_option,
     )
     from cairn.core.config import load_config
     from cairn.core.preview import (
@@ -1263,7 +1454,7 @@ def caltopo_to_onx(
 
     # Icon report + catalog for CalTopo → OnX (best-effort; never fails the migration)
     try:
-        registry = IconRegistry()
+        registry = get_icon_registry()
         inventory = registry.collect_caltopo_symbol_inventory(parsed_data)
         rows = registry.collect_caltopo_to_onx_mapping_rows_using_config(
             parsed_data, config
@@ -1289,6 +1480,12 @@ def caltopo_to_onx(
         # Migration should still succeed even if reporting fails.
         pass
 
+    simplify = resolve_simplify_option(simplify_tolerance, simplify_method)
+    if simplify is not None:
+        display_simplify_summary(
+            simplify_parsed_data(parsed_data, simplify[0], method=simplify[1])
+        )
+
     output_files = process_and_write_files(
         parsed_data,
         out_dir,
@@ -1297,6 +1494,8 @@ def caltopo_to_onx(
         config=config,
         split_gpx=split_gpx,
         max_gpx_bytes=int(max(0.0, float(max_gpx_mb)) * 1024 * 1024),
+        precision=resolve_precision_option(coord_decimals, ele_decimals, config),
+        jobs=resolve_jobs_option(jobs),
     )
 
     # Persist session one last time (best-effort) so users can resume even if export artifacts change later.
@@ -1353,6 +1552,32 @@ def migrate_to_onx(
         "--split-gpx/--no-split-gpx",
         help="Automatically split GPX files that exceed the max size into multiple numbered parts.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Write folder outputs in N parallel processes (0 = one per CPU).",
+    ),
+    coord_decimals: Optional[int] = typer.Option(
+        None,
+        "--coord-decimals",
+        help="Decimals written for lat/lon (6 is ~0.1 m; smaller files, fewer GPX parts). Default: config `coordinate_decimals`, else full precision.",
+    ),
+    ele_decimals: Optional[int] = typer.Option(
+        None,
+        "--ele-decimals",
+        help="Decimals written for elevation (e.g. 1). Default: config `elevation_decimals`, else full precision.",
+    ),
+    simplify_tolerance: Optional[float] = typer.Option(
+        None,
+        "--simplify",
+        help="Simplify tracks (metres): drop vertices that move the line less than this many metres (e.g. 2). Elevation/time of kept points is preserved.",
+    ),
+    simplify_method: str = typer.Option(
+        "dp",
+        "--simplify-method",
+        help="Track simplification algorithm: dp (Douglas-Peucker, default) or vw (Visvalingam-Whyatt)",
+    ),
     session_file: Optional[Path] = typer.Option(
         None,
         "--session",
@@ -1381,6 +1606,11 @@ def migrate_to_onx(
         no_sort=no_sort,
         max_gpx_mb=max_gpx_mb,
         split_gpx=split_gpx,
+        jobs=jobs,
+        coord_decimals=coord_decimals,
+        ele_decimals=ele_decimals,
+        simplify_tolerance=simplify_tolerance,
+        simplify_method=simplify_method,
         session_file=session_file,
         save_session=save_session,
         interactive=interactive,
@@ -12,7 +12,8 @@ This module provides explicit mapping functions for both, plus line style/weight
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import re
 
@@ -85,6 +86,9 @@ def stroke_width_to_weight(stroke_width) -> str:
 
 _RGB_REGEX = re.compile(r"rgba?\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)")
 
+# Bound on memoized raw color string → OnX RGBA entries (per palette).
+COLOR_CACHE_SIZE = 1024
+
 
 @dataclass(frozen=True)
 class _PaletteColor:
@@ -97,6 +101,69 @@ class _PaletteColor:
     rgba: str
 
 
+# Quantized RGB lookup: each channel is split into 2**_LUT_BITS bins (a 32×32×32 cube).
+_LUT_BITS = 5
+_LUT_SHIFT = 8 - _LUT_BITS
+_LUT_BINS = 1 << _LUT_BITS
+_LUT_CELL = 1 << _LUT_SHIFT
+
+
+class _PaletteLUT:
+    """
+    Quantized nearest-color table for one palette.
+
+    Each cell of the RGB cube stores the palette colors that can be nearest to
+    *some* point inside the cell (in palette order). Most cells resolve to a
+    single color; cells straddling a boundary fall back to an exact scan over
+    their few candidates, so results always match the exact nearest-color search
+    (including its first-in-palette tie-breaking). Cells are filled lazily on
+    first use, so building the table costs nothing up front.
+    """
+
+    __slots__ = ("palette", "_cells")
+
+    def __init__(self, palette: Tuple[_PaletteColor, ...]) -> None:
+        self.palette = palette
+        self._cells: List[Optional[Tuple[_PaletteColor, ...]]] = [None] * (
+            _LUT_BINS**3
+        )
+
+    def _candidates(self, ri: int, gi: int, bi: int) -> Tuple[_PaletteColor, ...]:
+        bounds = [(i * _LUT_CELL, i * _LUT_CELL + _LUT_CELL - 1) for i in (ri, gi, bi)]
+
+        def min_dist(p: _PaletteColor) -> int:
+            total = 0
+            for c, (lo, hi) in zip((p.r, p.g, p.b), bounds):
+                d = lo - c if c < lo else (c - hi if c > hi else 0)
+                total += d * d
+            return total
+
+        def max_dist(p: _PaletteColor) -> int:
+            total = 0
+            for c, (lo, hi) in zip((p.r, p.g, p.b), bounds):
+                d = max(c - lo, hi - c)
+                total += d * d
+            return total
+
+        # Any color whose closest approach to the cell is farther than the best
+        # worst-case distance can never win anywhere in the cell.
+        threshold = min(max_dist(p) for p in self.palette)
+        return tuple(p for p in self.palette if min_dist(p) <= threshold)
+
+    def nearest(self, r: int, g: int, b: int) -> _PaletteColor:
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            return ColorMapper._find_closest_in_palette(r, g, b, self.palette)
+        ri, gi, bi = r >> _LUT_SHIFT, g >> _LUT_SHIFT, b >> _LUT_SHIFT
+        idx = (ri * _LUT_BINS + gi) * _LUT_BINS + bi
+        cands = self._cells[idx]
+        if cands is None:
+            cands = self._candidates(ri, gi, bi)
+            self._cells[idx] = cands
+        if len(cands) == 1:
+            return cands[0]
+        return ColorMapper._find_closest_in_palette(r, g, b, cands)
+
+
 class ColorMapper:
     """
     Transform colors to OnX-supported values.
@@ -145,6 +212,9 @@ class ColorMapper:
     # Back-compat alias used in existing call sites
     DEFAULT_COLOR = DEFAULT_TRACK_COLOR
 
+    # Lazily-built lookup tables, keyed by palette identity.
+    _LUTS: Dict[int, _PaletteLUT] = {}
+
     @classmethod
     def _find_closest_in_palette(
         cls, r: int, g: int, b: int, palette: Iterable[_PaletteColor]
@@ -173,6 +243,17 @@ class ColorMapper:
 
         return best  # type: ignore[return-value]
 
+    @classmethod
+    def _lookup(
+        cls, r: int, g: int, b: int, palette: Tuple[_PaletteColor, ...]
+    ) -> _PaletteColor:
+        """Nearest palette color via the palette's quantized lookup table."""
+        lut = cls._LUTS.get(id(palette))
+        if lut is None or lut.palette is not palette:
+            lut = _PaletteLUT(palette)
+            cls._LUTS[id(palette)] = lut
+        return lut.nearest(r, g, b)
+
     @classmethod
     def find_closest_color(cls, r: int, g: int, b: int) -> str:
         """
@@ -192,9 +273,10 @@ class ColorMapper:
             >>> ColorMapper.find_closest_color(255, 0, 0)
             'rgba(255,0,0,1)'
         """
-        return cls._find_closest_in_palette(r, g, b, cls.TRACK_PALETTE).rgba
+        return cls._lookup(r, g, b, cls.TRACK_PALETTE).rgba
 
     @classmethod
+    @lru_cache(maxsize=COLOR_CACHE_SIZE)
     def map_track_color(cls, color_str: str) -> str:
         """
         Map a color to the closest OnX **track** palette color.
@@ -208,6 +290,8 @@ class ColorMapper:
         Returns:
             OnX track RGBA color string (e.g., "rgba(255,0,0,1)")
 
+        Results are memoized per raw string (palettes are immutable).
+
         Example:
             >>> ColorMapper.map_track_color("#FF0000")
             'rgba(255,0,0,1)'
@@ -215,10 +299,11 @@ class ColorMapper:
             'rgba(8,122,255,1)'
         """
         r, g, b = cls.parse_color(color_str)
-        chosen = cls._find_closest_in_palette(r, g, b, cls.TRACK_PALETTE)
+        chosen = cls._lookup(r, g, b, cls.TRACK_PALETTE)
         return chosen.rgba
 
     @classmethod
+    @lru_cache(maxsize=COLOR_CACHE_SIZE)
     def map_waypoint_color(cls, color_str: str) -> str:
         """
         Map a color to the closest OnX **waypoint** palette color.
@@ -242,10 +327,43 @@ class ColorMapper:
             Waypoints only support 10 colors (vs 11 for tracks). Fuchsia is track-only.
         """
         r, g, b = cls.parse_color(color_str)
-        chosen = cls._find_closest_in_palette(r, g, b, cls.WAYPOINT_PALETTE)
+        chosen = cls._lookup(r, g, b, cls.WAYPOINT_PALETTE)
         return chosen.rgba
 
     @classmethod
+    def map_track_colors(cls, color_strs: Iterable[str]) -> List[str]:
+        """
+        Map a whole column of colors to the OnX **track** palette.
+
+        Equivalent to calling `map_track_color()` on each value; each distinct
+        string is resolved once per call.
+        """
+        return cls._map_column(color_strs, cls.map_track_color)
+
+    @classmethod
+    def map_waypoint_colors(cls, color_strs: Iterable[str]) -> List[str]:
+        """
+        Map a whole column of colors to the OnX **waypoint** palette.
+
+        Equivalent to calling `map_waypoint_color()` on each value; each distinct
+        string is resolved once per call.
+        """
+        return cls._map_column(color_strs, cls.map_waypoint_color)
+
+    @staticmethod
+    def _map_column(color_strs: Iterable[str], map_one) -> List[str]:
+        resolved: Dict[str, str] = {}
+        out: List[str] = []
+        for raw in color_strs:
+            rgba = resolved.get(raw)
+            if rgba is None:
+                rgba = map_one(raw)
+                resolved[raw] = rgba
+            out.append(rgba)
+        return out
+
+    @classmethod
+    @lru_cache(maxsize=COLOR_CACHE_SIZE)
     def parse_color(cls, color_str: str) -> Tuple[int, int, int]:
         """
         Parse various color formats to RGB tuple.
@@ -261,6 +379,8 @@ class ColorMapper:
 
         Returns:
             RGB tuple (r, g, b) with values 0-255
+
+        Results are memoized per raw string.
         """
         if not color_str:
             # Default to OnX blue
@@ -12,6 +12,8 @@ from pathlib import Path
 import yaml
 from collections import defaultdict
 
+from cairn.core.icon_mapping_data import load_mappings_data
+
 
 # Generic CalTopo symbols that should NOT be mapped to specific icons.
 # These are default markers that don't convey semantic meaning.
@@ -447,7 +449,7 @@ def _try_load_repo_icon_mapping_defaults() -> Optional[
         data_path = Path(__file__).resolve().parents[1] / "data" / "icon_mappings.yaml"
         if not data_path.exists():
             return None
-        raw = yaml.safe_load(data_path.read_text(encoding="utf-8")) or {}
+        raw = load_mappings_data(data_path) or {}
         if not isinstance(raw, dict) or raw.get("version") != 1:
             return None
         c2o = raw.get("caltopo_to_onx") or {}
@@ -498,6 +500,8 @@ class IconMappingConfig:
         Args:
             config_file: Optional path to user config YAML file
         """
+        # Bumped whenever icon mappings change; icon decision caches key on it.
+        self.mapping_version = 0
         self.symbol_map = DEFAULT_SYMBOL_MAP.copy()
         self.keyword_map = DEFAULT_KEYWORD_MAP.copy()
         self.unmapped_symbols: Dict[str, List[str]] = defaultdict(list)
@@ -506,11 +510,61 @@ class IconMappingConfig:
         self.default_icon = "Location"
         self.default_color = "rgba(8,122,255,1)"
         self.default_path: Optional[str] = None  # TUI tree browser starting directory
+        # Output coordinate precision (None = full float precision); see cairn.core.precision
+        self.coordinate_decimals: Optional[int] = None
+        self.elevation_decimals: Optional[int] = None
 
         # Load user config if provided
         if config_file and config_file.exists():
             self.load_user_config(config_file)
 
+    # Reassigning a mapping attribute invalidates cached icon decisions.
+    # In-place edits (e.g. `config.symbol_map[k] = v`) must call
+    # `invalidate_mappings()` or use `set_symbol_mapping()`.
+    @property
+    def symbol_map(self) -> Dict[str, str]:
+        return self._symbol_map
+
+    @symbol_map.setter
+    def symbol_map(self, value: Dict[str, str]) -> None:
+        self._symbol_map = value
+        self.invalidate_mappings()
+
+    @property
+    def keyword_map(self) -> Dict[str, List[str]]:
+        return self._keyword_map
+
+    @keyword_map.setter
+    def keyword_map(self, value: Dict[str, List[str]]) -> None:
+        self._keyword_map = value
+        self.invalidate_mappings()
+
+    @property
+    def default_icon(self) -> str:
+        return self._default_icon
+
+    @default_icon.setter
+    def default_icon(self, value: str) -> None:
+        self._default_icon = value
+        self.invalidate_mappings()
+
+    def invalidate_mappings(self) -> None:
+        """Drop the cached icon resolver/decisions after a mapping change."""
+        self.mapping_version = getattr(self, "mapping_version", 0) + 1
+        self.__dict__.pop("_icon_resolver", None)
+
+    def set_symbol_mapping(self, symbol: str, icon: str) -> None:
+        """Map a CalTopo symbol to an OnX icon in memory (takes effect immediately)."""
+        self._symbol_map[(symbol or "").strip().lower()] = icon
+        self.unmapped_symbols.pop(symbol, None)
+        self.invalidate_mappings()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        # The cached resolver wraps an lru_cache; it is rebuilt lazily after unpickling.
+        state.pop("_icon_resolver", None)
+        return state
+
     def load_user_config(self, config_file: Path) -> None:
         """
         Load user configuration from YAML file.
@@ -551,6 +605,8 @@ class IconMappingConfig:
             if "keyword_mappings" in user_config:
                 self.keyword_map.update(user_config["keyword_mappings"])
 
+            self.invalidate_mappings()
+
             # Set icon name prefix behavior
             if "use_icon_name_prefix" in user_config:
                 self.use_icon_name_prefix = bool(user_config["use_icon_name_prefix"])
@@ -583,6 +639,16 @@ class IconMappingConfig:
             if "default_path" in user_config and user_config["default_path"]:
                 self.default_path = str(user_config["default_path"])
 
+            # Output coordinate precision
+            from cairn.core.precision import CoordinatePrecision
+
+            if "coordinate_decimals" in user_config:
+                self.coordinate_decimals = user_config["coordinate_decimals"]
+            if "elevation_decimals" in user_config:
+                self.elevation_decimals = user_config["elevation_decimals"]
+            # Validate eagerly so a bad value fails at load time, not mid-export.
+            CoordinatePrecision(self.coordinate_decimals, self.elevation_decimals)
+
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in config file: {e}")
         except Exception as e:
@@ -925,7 +991,11 @@ def get_all_onx_icons() -> List[str]:
 
 
 def save_user_mapping(
-    symbol: str, icon: str, config_path: Path = Path("cairn_config.yaml")
+    symbol: str,
+    icon: str,
+    config_path: Path = Path("cairn_config.yaml"),
+    *,
+    config: Optional[IconMappingConfig] = None,
 ):
     """
     Save user's manual mapping to config file.
@@ -934,29 +1004,34 @@ def save_user_mapping(
         symbol: CalTopo symbol to map
         icon: OnX icon name to map to
         config_path: Path to YAML config file
+        config: Loaded config to update in memory as well (invalidates its
+            cached icon decisions so the new mapping applies immediately)
     """
     if config_path.exists():
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            data = yaml.safe_load(f) or {}
     else:
-        config = {
+        data = {
             "use_icon_name_prefix": False,
             "enable_unmapped_detection": True,
             "symbol_mappings": {},
             "keyword_mappings": {},
         }
 
-    if "symbol_mappings" not in config:
-        config["symbol_mappings"] = {}
+    if "symbol_mappings" not in data:
+        data["symbol_mappings"] = {}
 
     symbol_key = (symbol or "").strip().lower()
     icon_canon = normalize_onx_icon_name(icon)
     if icon_canon is None:
         raise ValueError(f"Invalid OnX icon '{icon}' (must match canonical icon list)")
-    config["symbol_mappings"][symbol_key] = icon_canon
+    data["symbol_mappings"][symbol_key] = icon_canon
 
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+
+    if config is not None:
+        config.set_symbol_mapping(symbol_key, icon_canon)
 
 
 def remove_user_mapping(
@@ -8,8 +8,9 @@ same location/name.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from cairn.core.normalization import normalize_key
 from cairn.model import MapDocument, Waypoint
@@ -73,16 +74,97 @@ def _waypoint_score(wp: Waypoint) -> Tuple[int, int, int]:
     return (has_icon + has_color, has_icon, notes_len)
 
 
+_EARTH_RADIUS_M = 6371008.8
+_METERS_PER_DEG_LAT = math.pi * _EARTH_RADIUS_M / 180.0
+# Longitude cells are sized for the highest latitude present; clamp so cells
+# stay finite for waypoints at (or numerically near) the poles.
+_MAX_GRID_LAT = 89.0
+
+
+def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _group_exact(waypoints: List[Waypoint]) -> Dict[DedupKey, List[Waypoint]]:
+    groups: Dict[DedupKey, List[Waypoint]] = {}
+    for wp in waypoints:
+        k = waypoint_dedup_key(wp)
+        groups.setdefault(k, []).append(wp)
+    return groups
+
+
+def _group_by_radius(
+    waypoints: List[Waypoint], radius_m: float
+) -> Dict[DedupKey, List[Waypoint]]:
+    """
+    Group same-name waypoints lying within `radius_m` metres of a group anchor.
+
+    Each group is anchored at its first waypoint (in input order). Anchors are
+    bucketed in a uniform lat/lon grid whose cells are at least `radius_m`
+    across, so a waypoint only needs to be compared against anchors in the
+    3x3 neighbouring cells; joining the closest anchor in range keeps group
+    diameter bounded by 2 * radius_m (no single-linkage chaining).
+    """
+    if not waypoints:
+        return {}
+
+    max_abs_lat = min(_MAX_GRID_LAT, max(abs(float(wp.lat)) for wp in waypoints))
+    cell_lat = radius_m / _METERS_PER_DEG_LAT
+    cell_lon = radius_m / (_METERS_PER_DEG_LAT * math.cos(math.radians(max_abs_lat)))
+
+    groups: Dict[DedupKey, List[Waypoint]] = {}
+    # (name_key, row, col) -> anchors [(lat, lon, group key)]
+    grid: Dict[Tuple[str, int, int], List[Tuple[float, float, DedupKey]]] = {}
+    for wp in waypoints:
+        lat = float(wp.lat)
+        lon = float(wp.lon)
+        name_key = normalize_key(wp.name)
+        row = math.floor(lat / cell_lat)
+        col = math.floor(lon / cell_lon)
+
+        best_key: Optional[DedupKey] = None
+        best_dist = radius_m
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                for alat, alon, akey in grid.get((name_key, row + dr, col + dc), ()):
+                    d = _haversine_m(lat, lon, alat, alon)
+                    if d <= best_dist:
+                        best_dist = d
+                        best_key = akey
+
+        if best_key is not None:
+            groups[best_key].append(wp)
+            continue
+
+        key = waypoint_dedup_key(wp)
+        if key in groups:
+            # Identical rounded key to an existing anchor (only possible when
+            # the anchor is farther than radius_m, i.e. radius < rounding).
+            groups[key].append(wp)
+            continue
+        groups[key] = [wp]
+        grid.setdefault((name_key, row, col), []).append((lat, lon, key))
+    return groups
+
+
 def dedupe_waypoints(
     waypoints: List[Waypoint],
     *,
     trace: Any = None,
+    radius_m: Optional[float] = None,
 ) -> Tuple[List[Waypoint], List[Waypoint], DedupReport]:
     """
     Deduplicate waypoints by (rounded lat/lon + normalized name).
 
     Algorithm:
-    1. Group waypoints by normalized name + lat/lon rounded to 6 decimals (~0.1m precision)
+    1. Group waypoints by normalized name + lat/lon rounded to 6 decimals (~0.1m precision),
+       or, when `radius_m` is given, by normalized name within `radius_m` metres
+       (grid-indexed, near-linear; see `_group_by_radius`)
     2. For each group with duplicates, select the "best" waypoint using scoring:
        - Prefer waypoints with OnX icon + color (more complete metadata)
        - Prefer waypoints with longer notes
@@ -92,6 +174,8 @@ def dedupe_waypoints(
     Args:
         waypoints: List of waypoints to deduplicate
         trace: Optional trace context for debugging
+        radius_m: Optional tolerance in metres; enables radius-based matching.
+            Groups are keyed by their anchor (first) waypoint's DedupKey.
 
     Returns:
         Tuple of (kept_waypoints, dropped_waypoints, dedup_report)
@@ -106,10 +190,10 @@ def dedupe_waypoints(
         - Name matching is case-insensitive and removes special characters
         - Source IDs are preserved for forensic analysis
     """
-    groups: Dict[DedupKey, List[Waypoint]] = {}
-    for wp in waypoints:
-        k = waypoint_dedup_key(wp)
-        groups.setdefault(k, []).append(wp)
+    if radius_m is not None and radius_m > 0:
+        groups = _group_by_radius(waypoints, float(radius_m))
+    else:
+        groups = _group_exact(waypoints)
 
     kept: List[Waypoint] = []
     dropped: List[Waypoint] = []
@@ -190,24 +274,17 @@ def dedupe_waypoints(
     return kept, dropped, DedupReport(groups=reports)
 
 
-def apply_waypoint_dedup(doc: MapDocument, *, trace: Any = None) -> DedupReport:
+def apply_waypoint_dedup(
+    doc: MapDocument, *, trace: Any = None, radius_m: Optional[float] = None
+) -> DedupReport:
     """
     Deduplicate waypoints in-place on a MapDocument.
+
+    See `dedupe_waypoints` for `radius_m`.
     """
     wps = doc.waypoints()
-    kept, dropped, report = dedupe_waypoints(wps, trace=trace)
-    dropped_ids = {w.id for w in dropped}
-    doc.items = [
-        i for i in doc.items if not (isinstance(i, Waypoint) and i.id in dropped_ids)
-    ]
-    # Replace kept versions (which may now have merged source_ids)
-    # Ensure stable order: keep original order of appearance.
-    kept_map = {w.id: w for w in kept}
-    new_items = []
-    for i in doc.items:
-        if isinstance(i, Waypoint) and i.id in kept_map:
-            new_items.append(kept_map[i.id])
-        else:
-            new_items.append(i)
-    doc.items = new_items
+    kept, dropped, report = dedupe_waypoints(wps, trace=trace, radius_m=radius_m)
+    # Kept waypoints are updated in place (merged source_ids), so only the
+    # dropped ones need removing; order of appearance is preserved.
+    doc.remove_items({w.id for w in dropped}, kind=Waypoint)
     return report
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 
 from cairn.core.dedup import DedupReport
+from cairn.core.icon_registry import OnxIconCollector
 from cairn.model import MapDocument, Track, Waypoint
 
 
@@ -41,54 +42,39 @@ def dedup_inventory(report: DedupReport) -> Dict[str, Any]:
     }
 
 
-def check_data_quality(doc: MapDocument) -> Dict[str, Any]:
+class DataQualityCollector:
     """
-    Check data quality and return warnings.
+    Streaming form of `check_data_quality`: feed each item once with `add()`.
 
-    Returns a dict with:
-    - empty_names: list of (item_type, item_id, name) with empty/default names
-    - duplicate_names: list of (name, count, items) for names appearing multiple times
-    - suspicious_coords: list of (item_type, item_id, name, lat, lon, reason) with suspicious coordinates
+    `warnings()` returns the same dict as `check_data_quality`.
     """
-    warnings: Dict[str, Any] = {
-        "empty_names": [],
-        "duplicate_names": [],
-        "suspicious_coords": [],
-        "empty_tracks": [],
-    }
 
-    # Check for empty or default names
-    for item in doc.items:
+    def __init__(self) -> None:
+        self.empty_names: List[Tuple[str, str, str]] = []
+        self.suspicious_coords: List[Tuple[Any, ...]] = []
+        self.empty_tracks: List[Tuple[str, str]] = []
+        # name -> [(type, id)]
+        self._name_counts: Dict[str, List[Tuple[str, str]]] = {}
+
+    def add(self, item: Any) -> None:
+        item_type = type(item).__name__
+        item_id = getattr(item, "id", "unknown")
+
+        # Check for empty or default names
         name = getattr(item, "name", "")
         if not name or name.lower() in ["untitled", "unnamed", ""]:
-            item_type = type(item).__name__
-            item_id = getattr(item, "id", "unknown")
-            warnings["empty_names"].append((item_type, item_id, name or "(empty)"))
+            self.empty_names.append((item_type, item_id, name or "(empty)"))
 
-    # Check for duplicate names (potential duplicates before dedup)
-    name_counts: Dict[str, List[Tuple[str, str]]] = {}  # name -> [(type, id)]
-    for item in doc.items:
-        name = getattr(item, "name", "")
+        # Track names for duplicate detection (potential duplicates before dedup)
         if name:
-            item_type = type(item).__name__
-            item_id = getattr(item, "id", "unknown")
-            if name not in name_counts:
-                name_counts[name] = []
-            name_counts[name].append((item_type, item_id))
-
-    for name, items in name_counts.items():
-        if len(items) > 1:
-            warnings["duplicate_names"].append(
-                (name, len(items), items[:3])
-            )  # Show first 3
-
-    # Check for suspicious coordinates (e.g., exactly 0,0 or very close)
-    for item in doc.items:
+            self._name_counts.setdefault(name, []).append((item_type, item_id))
+
+        # Check for suspicious coordinates (e.g., exactly 0,0 or very close)
         if isinstance(item, Waypoint):
             lat, lon = item.lat, item.lon
             # Check for null island (0, 0) or very close
             if abs(lat) < 0.001 and abs(lon) < 0.001:
-                warnings["suspicious_coords"].append(
+                self.suspicious_coords.append(
                     (
                         "Waypoint",
                         item.id,
@@ -100,7 +86,7 @@ def check_data_quality(doc: MapDocument) -> Dict[str, Any]:
                 )
             # Check for out-of-range coordinates
             if not (-90 <= float(lat) <= 90) or not (-180 <= float(lon) <= 180):
-                warnings["suspicious_coords"].append(
+                self.suspicious_coords.append(
                     (
                         "Waypoint",
                         item.id,
@@ -112,6 +98,60 @@ def check_data_quality(doc: MapDocument) -> Dict[str, Any]:
                 )
         elif isinstance(item, Track):
             if not getattr(item, "points", None):
-                warnings["empty_tracks"].append((item.id, item.name))
+                self.empty_tracks.append((item.id, item.name))
+
+    def warnings(self) -> Dict[str, Any]:
+        duplicate_names = [
+            (name, len(items), items[:3])  # Show first 3
+            for name, items in self._name_counts.items()
+            if len(items) > 1
+        ]
+        return {
+            "empty_names": list(self.empty_names),
+            "duplicate_names": duplicate_names,
+            "suspicious_coords": list(self.suspicious_coords),
+            "empty_tracks": list(self.empty_tracks),
+        }
+
 
-    return warnings
+def check_data_quality(doc: MapDocument) -> Dict[str, Any]:
+    """
+    Check data quality and return warnings.
+
+    Returns a dict with:
+    - empty_names: list of (item_type, item_id, name) with empty/default names
+    - duplicate_names: list of (name, count, items) for names appearing multiple times
+    - suspicious_coords: list of (item_type, item_id, name, lat, lon, reason) with suspicious coordinates
+    """
+    collector = DataQualityCollector()
+    for item in doc.items:
+        collector.add(item)
+    return collector.warnings()
+
+
+class IngestCollector:
+    """
+    One-pass aggregation over a document's items for per-run reporting.
+
+    Produces the OnX icon inventory, the OnX → CalTopo mapping rows and the
+    data-quality warnings from a single walk, instead of each helper walking
+    the document separately.
+    """
+
+    def __init__(self, *, example_limit: int = 3, color_limit: int = 3) -> None:
+        self.icons = OnxIconCollector(
+            example_limit=example_limit, color_limit=color_limit
+        )
+        self.quality = DataQualityCollector()
+
+    def add(self, item: Any) -> None:
+        self.quality.add(item)
+        if isinstance(item, Waypoint):
+            self.icons.add_waypoint(item)
+
+    @classmethod
+    def from_document(cls, doc: MapDocument, **kwargs: int) -> "IngestCollector":
+        collector = cls(**kwargs)
+        for item in doc.items:
+            collector.add(item)
+        return collector
@@ -0,0 +1,287 @@
+"""
+Append-only icon catalog: YAML snapshot + JSONL journal.
+
+- writers append one JSON line per observed batch to `<stem>.journal.jsonl`
+  (a single `O_APPEND` write, so concurrent writers never lose each other's counts)
+- `read_catalog()` returns the snapshot with unfolded journal lines merged in memory
+- `compact_catalog()` folds new journal lines into the snapshot; it runs lazily
+  once the unfolded journal passes `COMPACT_THRESHOLD_BYTES`, or via
+  `cairn catalog compact`
+
+The snapshot records how many journal bytes it already contains
+(`journal_offset`) and which journal they came from (`journal_head`, a hash of
+the journal's first line), so compaction never truncates the journal and never
+races with writers. Only one compactor runs at a time (guarded by a lock file).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import yaml
+
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+LOCK_SUFFIX = ".lock"
+
+# Fold the journal into the snapshot once this many bytes are unfolded.
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+# A compaction lock older than this is assumed to be left over from a crash.
+STALE_LOCK_SECONDS = 300.0
+
+CatalogEntry = Tuple[str, int, Sequence[str]]
+
+# `journal_offset` is written near the top of the snapshot so writers can read it
+# without parsing the whole YAML.
+_OFFSET_RE = re.compile(rb"^journal_offset:\s*(\d+)\s*$", re.MULTILINE)
+_HEADER_BYTES = 512
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def default_catalog_path() -> Path:
+    # cairn/core/icon_catalog.py -> cairn/core -> cairn
+    return Path(__file__).resolve().parents[1] / "data" / "icon_catalog.yaml"
+
+
+def journal_path(catalog_path: Path) -> Path:
+    return catalog_path.with_name(catalog_path.stem + JOURNAL_SUFFIX)
+
+
+def _lock_path(catalog_path: Path) -> Path:
+    return catalog_path.with_name(catalog_path.name + LOCK_SUFFIX)
+
+
+def append_catalog_entries(
+    catalog_path: Path,
+    root_key: str,
+    entries: Iterable[CatalogEntry],
+    *,
+    auto_compact: bool = True,
+) -> None:
+    """Record one batch of observed labels as a single journal line."""
+    batch = [
+        [str(label), int(count), [str(ex) for ex in examples or ()]]
+        for label, count, examples in entries
+        if str(label)
+    ]
+    if not batch:
+        return
+
+    line = json.dumps(
+        {"at": _utc_now_iso(), "key": root_key, "entries": batch},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    data = (line + "\n").encode("utf-8")
+
+    path = journal_path(catalog_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):
+            written += os.write(fd, data[written:])
+        size = os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+    folded = _snapshot_offset(catalog_path)
+    unfolded = size - folded if size >= folded else size
+    if auto_compact and unfolded >= COMPACT_THRESHOLD_BYTES:
+        try:
+            compact_catalog(catalog_path)
+        except (OSError, ValueError, yaml.YAMLError):
+            # Best-effort: the journal already holds the batch.
+            pass
+
+
+def read_catalog(catalog_path: Path, *, example_limit: int = 3) -> Dict[str, Any]:
+    """Return the snapshot with any unfolded journal lines merged in (nothing is written)."""
+    raw = _load_snapshot(catalog_path)
+    lines, _, _ = _read_journal(catalog_path, raw)
+    for record in lines:
+        _fold_record(raw, record, example_limit=example_limit)
+    return raw
+
+
+def compact_catalog(
+    catalog_path: Path, *, example_limit: int = 3, wait: bool = False
+) -> Optional[int]:
+    """
+    Fold new journal lines into the YAML snapshot.
+
+    Returns the number of journal lines folded, or None if another compaction
+    holds the lock (and `wait` is False).
+    """
+    if not journal_path(catalog_path).exists():
+        return 0
+    lock = _lock_path(catalog_path)
+    if not _acquire_lock(lock, wait=wait):
+        return None
+    try:
+        raw = _load_snapshot(catalog_path)
+        lines, end, head = _read_journal(catalog_path, raw)
+        if not lines:
+            return 0
+        for record in lines:
+            _fold_record(raw, record, example_limit=example_limit)
+        out = {
+            "version": raw.pop("version"),
+            "updated_at": _utc_now_iso(),
+            "journal_offset": end,
+            "journal_head": head,
+        }
+        for key in ("updated_at", "journal_offset", "journal_head"):
+            raw.pop(key, None)
+        out.update(raw)
+
+        catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = catalog_path.with_name(f".{catalog_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            yaml.dump(out, sort_keys=False, allow_unicode=True), encoding="utf-8"
+        )
+        os.replace(tmp, catalog_path)
+        return len(lines)
+    finally:
+        try:
+            lock.unlink()
+        except OSError:
+            pass
+
+
+def _acquire_lock(lock: Path, *, wait: bool) -> bool:
+    while True:
+        try:
+            fd = os.open(lock, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime > STALE_LOCK_SECONDS:
+                    lock.unlink()
+                    continue
+            except OSError:
+                continue
+            if not wait:
+                return False
+            time.sleep(0.05)
+            continue
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        os.close(fd)
+        return True
+
+
+def _load_snapshot(catalog_path: Path) -> Dict[str, Any]:
+    if catalog_path.exists():
+        raw = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
+    else:
+        raw = {}
+    if not isinstance(raw, dict):
+        raw = {}
+
+    if raw.get("version") is None:
+        raw["version"] = 1
+    if raw.get("version") != 1:
+        raise ValueError(
+            f"Unsupported icon catalog version: {raw.get('version')!r} (expected 1)"
+        )
+    raw.setdefault("updated_at", _utc_now_iso())
+    return raw
+
+
+def _snapshot_offset(catalog_path: Path) -> int:
+    """Folded journal offset, read from the snapshot header only."""
+    try:
+        with open(catalog_path, "rb") as f:
+            head = f.read(_HEADER_BYTES)
+    except OSError:
+        return 0
+    m = _OFFSET_RE.search(head)
+    return int(m.group(1)) if m else 0
+
+
+def _read_journal(
+    catalog_path: Path, snapshot: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+    """
+    Read the complete journal lines not yet folded into `snapshot`.
+
+    Returns (records, end_offset, journal_head). A trailing partial line (a
+    writer mid-append) is left for next time. If the journal is not the one the
+    snapshot was folded from (different first line, e.g. a fresh checkout), it
+    is read from the start.
+    """
+    path = journal_path(catalog_path)
+    try:
+        with open(path, "rb") as f:
+            head = hashlib.sha256(f.readline()).hexdigest()[:16]
+            offset = int(snapshot.get("journal_offset") or 0)
+            if snapshot.get("journal_head") != head:
+                offset = 0
+            f.seek(offset)
+            chunk = f.read()
+    except FileNotFoundError:
+        return [], 0, None
+
+    complete = chunk[: chunk.rfind(b"\n") + 1]
+    records: List[Dict[str, Any]] = []
+    for raw_line in complete.splitlines():
+        try:
+            record = json.loads(raw_line.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records, offset + len(complete), head
+
+
+def _fold_record(raw: Dict[str, Any], record: Dict[str, Any], *, example_limit: int) -> None:
+    root_key = str(record.get("key") or "")
+    entries = record.get("entries")
+    if not root_key or not isinstance(entries, list):
+        return
+    root = raw.get(root_key)
+    if not isinstance(root, dict):
+        if root is not None:
+            raise ValueError(f"{root_key} must be a mapping/dict")
+        root = {}
+        raw[root_key] = root
+
+    for entry in entries:
+        if not isinstance(entry, list) or len(entry) != 3:
+            continue
+        label, count, examples = entry
+        label = str(label)
+        if not label:
+            continue
+        prev = root.get(label) or {}
+        if not isinstance(prev, dict):
+            prev = {}
+        prev_count = int(prev.get("count") or 0)
+        prev_examples = (
+            prev.get("examples") if isinstance(prev.get("examples"), list) else []
+        )
+
+        merged_examples: List[str] = []
+        for ex in prev_examples or []:
+            ex_s = str(ex).strip()
+            if ex_s and ex_s not in merged_examples:
+                merged_examples.append(ex_s)
+        for ex in examples or ():
+            ex_s = str(ex).strip()
+            if (
+                ex_s
+                and ex_s not in merged_examples
+                and len(merged_examples) < example_limit
+            ):
+                merged_examples.append(ex_s)
+
+        root[label] = {"count": prev_count + int(count), "examples": merged_examples}
@@ -0,0 +1,113 @@
+"""
+Cached loading of the icon mappings YAML.
+
+`cairn/data/icon_mappings.yaml` is read by the config defaults at import time and
+by every `IconRegistry`. Parsing it with `yaml.safe_load` is the slow part, so:
+
+- parsed data is cached per process, keyed on resolved path + (mtime, size)
+- a compiled JSON artifact next to the YAML (`<stem>.compiled.json`) stores the
+  parsed data with the YAML's SHA-256; it is used when the hash matches and is
+  rewritten (best-effort) whenever the YAML changes
+
+This module intentionally has no Cairn imports so `cairn.core.config` can use it.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+
+COMPILED_SUFFIX = ".compiled.json"
+_COMPILED_FORMAT = 1
+
+# resolved path -> ((mtime_ns, size), parsed data)
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def compiled_artifact_path(yaml_path: Path) -> Path:
+    """Path of the compiled JSON artifact for `yaml_path`."""
+    return yaml_path.with_name(yaml_path.stem + COMPILED_SUFFIX)
+
+
+def file_stamp(path: Path) -> Tuple[int, int]:
+    """Cheap change detector for `path`: (mtime_ns, size)."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_compiled(artifact: Path, digest: str) -> Any:
+    try:
+        payload = json.loads(artifact.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != _COMPILED_FORMAT
+        or payload.get("sha256") != digest
+    ):
+        return None
+    return payload.get("data")
+
+
+def _write_compiled(artifact: Path, digest: str, data: Any) -> None:
+    """Best-effort: skip silently if the data is not JSON-exact or the dir is read-only."""
+    try:
+        text = json.dumps(
+            {"format": _COMPILED_FORMAT, "sha256": digest, "data": data},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        if json.loads(text)["data"] != data:
+            return
+    except (TypeError, ValueError):
+        return
+
+    tmp = artifact.with_name(f".{artifact.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, artifact)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_mappings_data(path: Path, *, use_compiled: bool = True) -> Any:
+    """
+    Return the parsed contents of an icon mappings YAML file.
+
+    Callers get a private deep copy, so mutating the result never leaks into the
+    cache. Raises `OSError` if the file is missing and `yaml.YAMLError` on
+    invalid YAML (structure validation is left to the caller).
+    """
+    path = Path(path).resolve()
+    stamp = file_stamp(path)
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    raw_bytes = path.read_bytes()
+    digest = hashlib.sha256(raw_bytes).hexdigest()
+    artifact = compiled_artifact_path(path)
+
+    data = _read_compiled(artifact, digest) if use_compiled else None
+    if data is None:
+        data = yaml.safe_load(raw_bytes.decode("utf-8"))
+        if use_compiled:
+            _write_compiled(artifact, digest, data)
+
+    _CACHE[path] = (stamp, data)
+    return copy.deepcopy(data)
+
+
+def clear_cache() -> None:
+    """Forget all cached parses (compiled artifacts on disk are left alone)."""
+    _CACHE.clear()
@@ -14,13 +14,18 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import yaml
-
 from cairn.core.color_mapper import ColorMapper
 from cairn.core.config import GENERIC_SYMBOLS, IconMappingConfig, get_icon_color
+from cairn.core.icon_catalog import (
+    append_catalog_entries,
+    compact_catalog,
+    default_catalog_path,
+    read_catalog,
+)
+from cairn.core.icon_mapping_data import file_stamp, load_mappings_data
 from cairn.core.icon_resolver import IconDecision, IconResolver
 from cairn.core.matcher import FuzzyIconMatcher
-from cairn.model import MapDocument
+from cairn.model import MapDocument, Waypoint
 
 
 def _utc_now_iso() -> str:
@@ -37,10 +42,6 @@ def default_mappings_path() -> Path:
     return _repo_data_dir() / "icon_mappings.yaml"
 
 
-def default_catalog_path() -> Path:
-    return _repo_data_dir() / "icon_catalog.yaml"
-
-
 def _as_dict(value: Any, *, label: str) -> Dict[str, Any]:
     if value is None:
         return {}
@@ -78,6 +79,60 @@ class IconReportRow:
     colors: Tuple[str, ...] = ()
 
 
+class OnxIconCollector:
+    """
+    Streaming per-icon aggregation of OnX waypoints.
+
+    Feed each waypoint once with `add_waypoint()`; the icon inventory and the
+    OnX → CalTopo mapping rows are both derived from the same counters.
+    """
+
+    def __init__(self, *, example_limit: int = 3, color_limit: int = 3):
+        self.example_limit = example_limit
+        self.color_limit = color_limit
+        self.counts: Dict[str, int] = {}
+        self.examples: Dict[str, List[str]] = {}
+        self.colors: Dict[str, List[str]] = {}
+
+    def add_waypoint(self, wp: Waypoint) -> None:
+        icon = (wp.style.OnX_icon or "").strip() or "(missing)"
+        self.counts[icon] = self.counts.get(icon, 0) + 1
+        if wp.name and len(self.examples.get(icon, [])) < self.example_limit:
+            self.examples.setdefault(icon, []).append(wp.name)
+        c = (wp.style.OnX_color_rgba or "").strip()
+        if c:
+            cur = self.colors.setdefault(icon, [])
+            if c not in cur and len(cur) < self.color_limit:
+                cur.append(c)
+
+    def _ordered(self) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+    def inventory(self) -> List[InventoryEntry]:
+        return [
+            InventoryEntry(label=k, count=v, examples=tuple(self.examples.get(k, [])))
+            for k, v in self._ordered()
+        ]
+
+    def mapping_rows(self, registry: "IconRegistry") -> List[IconReportRow]:
+        rows: List[IconReportRow] = []
+        for icon, n in self._ordered():
+            mapped, src = registry.map_onx_icon_to_caltopo_symbol(
+                None if icon == "(missing)" else icon
+            )
+            rows.append(
+                IconReportRow(
+                    incoming=icon,
+                    mapped=mapped,
+                    mapping_source=src,
+                    count=n,
+                    examples=tuple(self.examples.get(icon, [])),
+                    colors=tuple(self.colors.get(icon, [])),
+                )
+            )
+        return rows
+
+
 class IconRegistry:
     """
     Load icon mappings from YAML and provide mapping/inventory helpers.
@@ -107,14 +162,17 @@ class IconRegistry:
 
         # Lazy/cache
         self._caltopo_resolver: Optional[IconResolver] = None
-        self._onx_matcher: Optional[FuzzyIconMatcher] = None
+        self._onx_matchers: Dict[Tuple[str, ...], FuzzyIconMatcher] = {}
+        # (mtime_ns, size) of the mappings file as of the last load().
+        self.mappings_stamp: Optional[Tuple[int, int]] = None
 
         self.load()
 
     def load(self) -> None:
         if not self.mappings_path.exists():
             raise ValueError(f"Icon mappings file not found: {self.mappings_path}")
-        raw = yaml.safe_load(self.mappings_path.read_text(encoding="utf-8")) or {}
+        self.mappings_stamp = file_stamp(self.mappings_path)
+        raw = load_mappings_data(self.mappings_path) or {}
         if not isinstance(raw, dict):
             raise ValueError("Icon mappings YAML must be a dict at the top level")
         self._raw = raw
@@ -186,7 +244,7 @@ class IconRegistry:
 
         # Clear lazy caches if reload happens.
         self._caltopo_resolver = None
-        self._onx_matcher = None
+        self._onx_matchers = {}
 
     def should_append_unknown_icon_to_description(self) -> bool:
         return (
@@ -235,9 +293,12 @@ class IconRegistry:
         Best-effort fuzzy suggestions for OnX icon -> CalTopo symbol.
         This is advisory only (we do not auto-map).
         """
-        if self._onx_matcher is None:
-            self._onx_matcher = FuzzyIconMatcher(list(valid_caltopo_symbols))
-        return self._onx_matcher.find_best_matches(onx_icon, top_n=top_n)
+        key = tuple(valid_caltopo_symbols)
+        matcher = self._onx_matchers.get(key)
+        if matcher is None:
+            matcher = FuzzyIconMatcher(list(key))
+            self._onx_matchers[key] = matcher
+        return matcher.find_best_matches(onx_icon, top_n=top_n)
 
     # ------------------------------------------------------------------
     # Inventories (for reporting + catalog)
@@ -245,18 +306,10 @@ class IconRegistry:
     def collect_onx_icon_inventory(
         self, doc: MapDocument, *, example_limit: int = 3
     ) -> List[InventoryEntry]:
-        counts: Dict[str, int] = {}
-        examples: Dict[str, List[str]] = {}
+        collector = OnxIconCollector(example_limit=example_limit)
         for wp in doc.waypoints():
-            icon = (wp.style.OnX_icon or "").strip() or "(missing)"
-            counts[icon] = counts.get(icon, 0) + 1
-            if wp.name and len(examples.get(icon, [])) < example_limit:
-                examples.setdefault(icon, []).append(wp.name)
-
-        return [
-            InventoryEntry(label=k, count=v, examples=tuple(examples.get(k, [])))
-            for k, v in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-        ]
+            collector.add_waypoint(wp)
+        return collector.inventory()
 
     def collect_onx_icon_mapping_rows(
         self,
@@ -266,36 +319,12 @@ class IconRegistry:
         color_limit: int = 3,
     ) -> List[IconReportRow]:
         # Aggregate per incoming icon
-        counts: Dict[str, int] = {}
-        examples: Dict[str, List[str]] = {}
-        colors: Dict[str, List[str]] = {}
+        collector = OnxIconCollector(
+            example_limit=example_limit, color_limit=color_limit
+        )
         for wp in doc.waypoints():
-            icon = (wp.style.OnX_icon or "").strip() or "(missing)"
-            counts[icon] = counts.get(icon, 0) + 1
-            if wp.name and len(examples.get(icon, [])) < example_limit:
-                examples.setdefault(icon, []).append(wp.name)
-            c = (wp.style.OnX_color_rgba or "").strip()
-            if c:
-                cur = colors.setdefault(icon, [])
-                if c not in cur and len(cur) < color_limit:
-                    cur.append(c)
-
-        rows: List[IconReportRow] = []
-        for icon, n in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
-            mapped, src = self.map_onx_icon_to_caltopo_symbol(
-                None if icon == "(missing)" else icon
-            )
-            rows.append(
-                IconReportRow(
-                    incoming=icon,
-                    mapped=mapped,
-                    mapping_source=src,
-                    count=n,
-                    examples=tuple(examples.get(icon, [])),
-                    colors=tuple(colors.get(icon, [])),
-                )
-            )
-        return rows
+            collector.add_waypoint(wp)
+        return collector.mapping_rows(self)
 
     def collect_caltopo_symbol_inventory(
         self, parsed_data: Any, *, example_limit: int = 3
@@ -451,62 +480,52 @@ class IconRegistry:
         self,
         root_key: str,
         entries: Iterable[InventoryEntry],
-        *,
-        example_limit: int = 3,
     ) -> None:
-        # Load existing
-        if self.catalog_path.exists():
-            raw = yaml.safe_load(self.catalog_path.read_text(encoding="utf-8")) or {}
-        else:
-            raw = {}
-        if not isinstance(raw, dict):
-            raw = {}
+        # Append-only: one journal line per batch; folded into the YAML lazily.
+        append_catalog_entries(
+            self.catalog_path,
+            root_key,
+            ((str(e.label), int(e.count), e.examples) for e in entries),
+        )
 
-        if raw.get("version") is None:
-            raw["version"] = 1
-        if raw.get("version") != 1:
-            raise ValueError(
-                f"Unsupported icon catalog version: {raw.get('version')!r} (expected 1)"
-            )
+    def read_catalog(self) -> Dict[str, Any]:
+        """Catalog snapshot with pending journal entries merged in."""
+        return read_catalog(self.catalog_path)
 
-        raw.setdefault("updated_at", _utc_now_iso())
-        raw[root_key] = _as_dict(raw.get(root_key), label=root_key)
+    def compact_catalog(self, *, wait: bool = True) -> Optional[int]:
+        """Fold pending journal entries into the YAML snapshot."""
+        return compact_catalog(self.catalog_path, wait=wait)
 
-        root = raw[root_key]
-        for e in entries:
-            label = str(e.label)
-            if not label:
-                continue
-            prev = root.get(label) or {}
-            if not isinstance(prev, dict):
-                prev = {}
-            prev_count = int(prev.get("count") or 0)
-            prev_examples = (
-                prev.get("examples") if isinstance(prev.get("examples"), list) else []
-            )
 
-            new_count = prev_count + int(e.count)
-            merged_examples: List[str] = []
-            for ex in prev_examples or []:
-                ex_s = str(ex).strip()
-                if ex_s and ex_s not in merged_examples:
-                    merged_examples.append(ex_s)
-            for ex in e.examples or ():
-                ex_s = str(ex).strip()
-                if (
-                    ex_s
-                    and ex_s not in merged_examples
-                    and len(merged_examples) < example_limit
-                ):
-                    merged_examples.append(ex_s)
-
-            root[label] = {"count": new_count, "examples": merged_examples}
-
-        raw["updated_at"] = _utc_now_iso()
-        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
-        self.catalog_path.write_text(
-            yaml.dump(raw, sort_keys=False, allow_unicode=True), encoding="utf-8"
-        )
+_SHARED_REGISTRIES: Dict[Tuple[Path, Path], IconRegistry] = {}
+
+
+def get_icon_registry(
+    *,
+    mappings_path: Optional[Path] = None,
+    catalog_path: Optional[Path] = None,
+) -> IconRegistry:
+    """
+    Process-wide shared `IconRegistry` for the given mappings/catalog paths.
+
+    The instance is rebuilt when the mappings file changes on disk (mtime/size),
+    so edits are picked up without restarting. Treat the returned registry as
+    read-only; construct `IconRegistry(...)` directly for a private instance.
+    """
+    key = (
+        (mappings_path or default_mappings_path()).resolve(),
+        (catalog_path or default_catalog_path()).resolve(),
+    )
+    reg = _SHARED_REGISTRIES.get(key)
+    if reg is not None:
+        try:
+            if file_stamp(key[0]) == reg.mappings_stamp:
+                return reg
+        except OSError:
+            pass
+    reg = IconRegistry(mappings_path=key[0], catalog_path=key[1])
+    _SHARED_REGISTRIES[key] = reg
+    return reg
 
 
 def write_icon_report_markdown(
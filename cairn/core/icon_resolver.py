@@ -13,7 +13,8 @@ deterministic and explainable by producing a structured decision.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Set, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Literal, Sequence, Set, Tuple
 
 import re
 
@@ -35,6 +36,64 @@ class IconDecision:
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
+class _SubstringAutomaton:
+    """
+    Aho–Corasick automaton reporting which of a fixed set of patterns occur in a text.
+
+    Built once; each scan is linear in the text length plus the number of hits,
+    independent of how many patterns there are.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[str]] = [[]]
+        for pattern in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pattern)
+
+        # Breadth-first failure links; outputs are merged along them.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def find(self, text: str) -> Set[str]:
+        """Return every pattern that occurs somewhere in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
 class IconResolver:
     """
     Resolve the best OnX icon for a waypoint.
@@ -45,6 +104,11 @@ class IconResolver:
 
     Determinism:
     - keyword ties break by the configured keyword map order, then alphabetically
+
+    The maps are compiled once at construction (a substring automaton over
+    symbol keys, a token → icon inverted index and a phrase automaton for
+    keywords), so later edits to the passed-in dicts are not picked up; build a
+    new resolver instead.
     """
 
     def __init__(
@@ -55,7 +119,7 @@ class IconResolver:
         default_icon: str = "Location",
         generic_symbols: Set[str] | None = None,
     ):
-        self._symbol_map = symbol_map
+        self._symbol_map = dict(symbol_map)
         self._keyword_map = keyword_map
         self._default_icon = default_icon
         self._generic_symbols = generic_symbols or set()
@@ -74,6 +138,25 @@ class IconResolver:
             normalized[icon] = tuple(cleaned)
         self._normalized_keywords = normalized
 
+        # Symbol keys, matched as substrings of the normalized symbol.
+        self._symbol_automaton = _SubstringAutomaton(self._symbol_map)
+
+        # Keyword → indexes (into the priority list) of icons listing it.
+        # Single-token keywords are looked up per text token; phrases are
+        # matched as substrings of the full text.
+        keyword_icons: Dict[str, List[int]] = {}
+        phrases: Set[str] = set()
+        for idx, icon in enumerate(self._keyword_priority):
+            for kw in normalized.get(icon, ()):
+                owners = keyword_icons.setdefault(kw, [])
+                if not owners or owners[-1] != idx:
+                    owners.append(idx)
+                if " " in kw:
+                    phrases.add(kw)
+        self._keyword_icons = keyword_icons
+        self._token_keywords = frozenset(kw for kw in keyword_icons if " " not in kw)
+        self._phrase_automaton = _SubstringAutomaton(sorted(phrases))
+
     def resolve(
         self, title: str, description: str = "", symbol: str = ""
     ) -> IconDecision:
@@ -97,13 +180,10 @@ class IconResolver:
                 )
 
             # Substring match: pick the most specific (longest key).
-            substring_matches: List[Tuple[int, str, str]] = []
-            for key, icon in self._symbol_map.items():
-                if key and key in symbol_norm:
-                    substring_matches.append((len(key), key, icon))
-            if substring_matches:
-                substring_matches.sort(key=lambda t: (t[0], t[1]), reverse=True)
-                _, key, icon = substring_matches[0]
+            found = self._symbol_automaton.find(symbol_norm)
+            if found:
+                key = max(found, key=lambda k: (len(k), k))
+                icon = self._symbol_map[key]
                 return IconDecision(
                     icon=icon,
                     score=0.9,
@@ -116,33 +196,23 @@ class IconResolver:
 
         # 2) Keyword scoring.
         text = f"{title} {description}".lower()
-        tokens = set(_TOKEN_RE.findall(text))
+        # Token match avoids false positives like 'th' in 'path'; phrases use substrings.
+        hits = self._token_keywords.intersection(_TOKEN_RE.findall(text))
+        hits |= self._phrase_automaton.find(text)
+
+        candidates: Set[int] = set()
+        for kw in hits:
+            candidates.update(self._keyword_icons[kw])
 
         best: IconDecision | None = None
         best_points: int = 0
         best_matches: Tuple[str, ...] = ()
 
-        for icon in self._keyword_priority:
-            kws = self._normalized_keywords.get(icon, ())
-            if not kws:
-                continue
-
-            matched: List[str] = []
-            points = 0
-            for kw in kws:
-                if " " in kw:
-                    # Phrase match: simple substring
-                    if kw in text:
-                        matched.append(kw)
-                        points += 1
-                else:
-                    # Token match: avoids false positives like 'th' in 'path'
-                    if kw in tokens:
-                        matched.append(kw)
-                        points += 1
-
-            if points <= 0:
-                continue
+        # Visit candidate icons in priority order so ties keep the first configured icon.
+        for idx in sorted(candidates):
+            icon = self._keyword_priority[idx]
+            matched = [kw for kw in self._normalized_keywords[icon] if kw in hits]
+            points = len(matched)
 
             # Construct decision; score is a stable, explainable "points" value.
             decision = IconDecision(
@@ -179,3 +249,21 @@ class IconResolver:
             source="default",
             reasons=(f"default icon '{self._default_icon}'",),
         )
+
+    def resolve_many(self, items: Iterable[Sequence[str]]) -> List[IconDecision]:
+        """
+        Resolve a batch of `(title, description, symbol)` tuples.
+
+        Equivalent to calling `resolve()` on each item; identical inputs within
+        the batch are resolved once.
+        """
+        seen: Dict[Tuple[str, ...], IconDecision] = {}
+        out: List[IconDecision] = []
+        for item in items:
+            key = tuple(v or "" for v in item)
+            decision = seen.get(key)
+            if decision is None:
+                decision = self.resolve(*key)
+                seen[key] = decision
+            out.append(decision)
+        return out
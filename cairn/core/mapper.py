@@ -7,10 +7,15 @@ to OnX Backcountry's specific icon IDs for better visual representation.
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from cairn.core.config import GENERIC_SYMBOLS, IconMappingConfig
-from cairn.core.icon_resolver import IconResolver
+from cairn.core.icon_resolver import IconDecision, IconResolver
+
+# Bound on memoized (title, description, symbol) → decision entries per config.
+# Exports repeat the same symbol/title values heavily, so hit rates are high.
+ICON_DECISION_CACHE_SIZE = 4096
 
 
 # Fallback keyword mapping (when no config provided)
@@ -43,6 +48,31 @@ _LEGACY_RESOLVER = IconResolver(
     default_icon="Location",
     generic_symbols=set(),
 )
+_legacy_resolve = lru_cache(maxsize=ICON_DECISION_CACHE_SIZE)(_LEGACY_RESOLVER.resolve)
+
+
+def config_icon_resolver(
+    config: IconMappingConfig,
+) -> Callable[[str, str, str], IconDecision]:
+    """
+    Memoized `IconResolver.resolve` for `config`.
+
+    The resolver and its LRU cache are stored on the config instance and are
+    dropped by `IconMappingConfig.invalidate_mappings()` (which also bumps
+    `config.mapping_version`), so cached decisions never outlive a mapping
+    change made through the config API.
+    """
+    resolve = getattr(config, "_icon_resolver", None)
+    if resolve is None:
+        resolver = IconResolver(
+            symbol_map=config.symbol_map,
+            keyword_map=config.keyword_map,
+            default_icon=config.default_icon,
+            generic_symbols=set(GENERIC_SYMBOLS),
+        )
+        resolve = lru_cache(maxsize=ICON_DECISION_CACHE_SIZE)(resolver.resolve)
+        setattr(config, "_icon_resolver", resolve)
+    return resolve
 
 
 def map_icon(
@@ -69,19 +99,11 @@ def map_icon(
         The OnX Backcountry icon ID (e.g., "Camp", "Water Source")
         Defaults to "Location" if no match is found.
     """
-    # Config-based mode (preferred): use an explainable resolver and cache it on the config instance.
+    # Config-based mode (preferred): use an explainable, memoized resolver cached on the config instance.
     if config is not None:
-        resolver = getattr(config, "_icon_resolver", None)
-        if resolver is None:
-            resolver = IconResolver(
-                symbol_map=config.symbol_map,
-                keyword_map=config.keyword_map,
-                default_icon=config.default_icon,
-                generic_symbols=set(GENERIC_SYMBOLS),
-            )
-            setattr(config, "_icon_resolver", resolver)
-
-        decision = resolver.resolve(title, description or "", caltopo_symbol or "")
+        decision = config_icon_resolver(config)(
+            title or "", description or "", caltopo_symbol or ""
+        )
 
         # Track unmapped symbols for reporting (even if keywords matched).
         symbol_norm = (caltopo_symbol or "").strip().lower()
@@ -95,7 +117,7 @@ def map_icon(
         return decision.icon
 
     # Legacy mode (no config): keep behavior close to the old keyword-only mapping.
-    return _LEGACY_RESOLVER.resolve(title, description or "", caltopo_symbol or "").icon
+    return _legacy_resolve(title or "", description or "", caltopo_symbol or "").icon
 
 
 def map_color(caltopo_color: str) -> str:
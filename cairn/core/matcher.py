@@ -7,11 +7,36 @@ and semantic keyword matching to suggest the best OnX icon for unmapped CalTopo
 
 from __future__ import annotations
 
+from collections import Counter
 from difflib import SequenceMatcher
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, FrozenSet, Optional
 import re
 
 
+class _IconProfile:
+    """Per-icon data precomputed once so each query only does cheap set/dict work."""
+
+    __slots__ = ("index", "name", "lower", "words", "chars", "reverse_terms")
+
+    def __init__(
+        self, index: int, name: str, synonyms: Dict[str, List[str]]
+    ) -> None:
+        lower = name.lower()
+        self.index = index
+        self.name = name
+        self.lower = lower
+        self.words: FrozenSet[str] = frozenset(lower.split())
+        self.chars: Dict[str, int] = dict(Counter(lower))
+        # Related terms of every synonym group this icon falls into
+        # (used by the reverse keyword check).
+        self.reverse_terms: Tuple[str, ...] = tuple(
+            term
+            for key, related in synonyms.items()
+            if key in lower or lower in key
+            for term in related
+        )
+
+
 class FuzzyIconMatcher:
     """Intelligent fuzzy matching for unmapped CalTopo symbols to OnX icons."""
 
@@ -24,6 +49,7 @@ class FuzzyIconMatcher:
         """
         self.valid_icons = valid_icons
         self.synonyms = self._build_synonym_map()
+        self._profiles: Optional[List[_IconProfile]] = None
 
     def find_best_matches(self, symbol: str, top_n: int = 3) -> List[Tuple[str, float]]:
         """
@@ -38,16 +64,97 @@ class FuzzyIconMatcher:
         """
         # Normalize input
         normalized = self._normalize_symbol(symbol)
-
-        # Calculate scores for all icons
-        scores = []
-        for icon in self.valid_icons:
-            score = self._calculate_similarity(normalized, icon)
-            scores.append((icon, score))
-
-        # Sort by score (descending) and return top N
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:top_n]
+        if top_n <= 0:
+            return []
+
+        # Cheap pass: exact/substring/keyword/word scores are computed outright;
+        # the (expensive) sequence ratio is replaced by its length-based upper
+        # bound, giving an upper bound on each icon's final score.
+        symbol_chars: Optional[List[Tuple[str, int]]] = None
+        symbol_words = set(normalized.split())
+        forward_terms = self._forward_terms(normalized)
+
+        scored: List[Tuple[float, int, str]] = []
+        pending: List[Tuple[float, _IconProfile, float, float]] = []
+        for prof in self._icon_profiles():
+            icon_lower = prof.lower
+            if normalized == icon_lower:
+                scored.append((1.0, prof.index, prof.name))
+                continue
+            if normalized in icon_lower:
+                scored.append((0.95, prof.index, prof.name))
+                continue
+            if icon_lower in normalized:
+                scored.append((0.9, prof.index, prof.name))
+                continue
+
+            if any(term in icon_lower for term in forward_terms):
+                keyword_score = 0.85
+            elif any(term in normalized for term in prof.reverse_terms):
+                keyword_score = 0.8
+            else:
+                keyword_score = 0.0
+
+            if symbol_words and prof.words:
+                word_score = len(symbol_words & prof.words) / len(
+                    symbol_words | prof.words
+                )
+            else:
+                word_score = 0.0
+
+            la, lb = len(normalized), len(icon_lower)
+            seq_bound = 2.0 * min(la, lb) / (la + lb) if la + lb else 1.0
+            bound = (seq_bound * 0.4) + (keyword_score * 0.4) + (word_score * 0.2)
+            pending.append((bound, prof, keyword_score, word_score))
+
+        # Exact pass: score icons in decreasing bound order and stop once no
+        # remaining icon can reach the current N-th best score. Before running
+        # SequenceMatcher, tighten the bound with shared character counts.
+        pending.sort(key=lambda t: (-t[0], t[1].index))
+        ranked = sorted(scored, key=lambda t: (-t[0], t[1]))
+        for bound, prof, keyword_score, word_score in pending:
+            full = len(ranked) >= top_n
+            if full and bound < ranked[top_n - 1][0]:
+                break
+            if full:
+                if symbol_chars is None:
+                    symbol_chars = list(Counter(normalized).items())
+                icon_chars = prof.chars
+                common = 0
+                for ch, n in symbol_chars:
+                    m = icon_chars.get(ch)
+                    if m:
+                        common += n if n < m else m
+                seq_bound = 2.0 * common / (len(normalized) + len(prof.lower))
+                tight = (seq_bound * 0.4) + (keyword_score * 0.4) + (word_score * 0.2)
+                if tight < ranked[top_n - 1][0]:
+                    continue
+            seq_score = SequenceMatcher(None, normalized, prof.lower).ratio()
+            score = (seq_score * 0.4) + (keyword_score * 0.4) + (word_score * 0.2)
+            ranked.append((score, prof.index, prof.name))
+            ranked.sort(key=lambda t: (-t[0], t[1]))
+            del ranked[top_n:]
+
+        # Ties keep `valid_icons` order, matching a stable sort over all icons.
+        return [(name, score) for score, _, name in ranked[:top_n]]
+
+    def _icon_profiles(self) -> List[_IconProfile]:
+        """Build (once) the per-icon profiles used by `find_best_matches`."""
+        if self._profiles is None:
+            self._profiles = [
+                _IconProfile(i, icon, self.synonyms)
+                for i, icon in enumerate(self.valid_icons)
+            ]
+        return self._profiles
+
+    def _forward_terms(self, symbol: str) -> Tuple[str, ...]:
+        """Related terms of every synonym group the normalized symbol falls into."""
+        return tuple(
+            term
+            for key, related in self.synonyms.items()
+            if key in symbol or symbol in key
+            for term in related
+        )
 
     def _normalize_symbol(self, symbol: str) -> str:
         """
@@ -79,6 +186,8 @@ class FuzzyIconMatcher:
         Calculate similarity score between symbol and icon.
 
         Uses multiple scoring methods and combines them with weights.
+        This is the reference scoring; `find_best_matches` computes the same
+        scores but skips icons that provably cannot reach the top N.
 
         Args:
             symbol: Normalized symbol string
@@ -181,61 +290,65 @@ class FuzzyIconMatcher:
         Returns:
             Dictionary mapping keywords to lists of related terms
         """
-        return {
-            # Climbing
-            "climb": ["climbing", "rappel", "caving", "ascent"],
-            # Camping
-            "camp": [
-                "campsite",
-                "campground",
-                "camping",
-                "camp area",
-                "camp backcountry",
-            ],
-            "tent": ["campsite", "camping", "camp"],
-            "bivy": ["camp backcountry", "bivouac"],
-            # Water
-            "water": ["creek", "stream", "lake", "river", "spring", "water source"],
-            "spring": ["water source", "water"],
-            "falls": ["waterfall"],
-            "hot": ["hot spring", "thermal", "geyser"],
-            # Winter sports
-            "ski": ["skiing", "xc skiing", "ski touring", "backcountry"],
-            "skin": ["ski touring", "skin track", "uptrack"],
-            "tour": ["ski touring", "touring"],
-            "snowboard": ["snowboarder", "boarding"],
-            "snow": ["snowmobile", "snowpark", "snow pit"],
-            # Hazards
-            "danger": ["hazard", "caution", "warning"],
-            "avy": ["avalanche", "hazard", "slide"],
-            "avalanche": ["hazard", "avy", "slide path"],
-            # Transportation
-            "car": ["parking", "vehicle", "lot"],
-            "parking": ["lot", "trailhead"],
-            "bike": ["bicycle", "mountain biking", "dirt bike"],
-            "atv": ["quad", "4x4"],
-            # Trails
-            "trail": ["trailhead", "hike", "path"],
-            "trailhead": ["trail head", "th", "parking"],
-            "hike": ["hiking", "backpacker", "mountaineer"],
-            # Peaks
-            "peak": ["summit", "mountain", "top"],
-            "summit": ["peak", "top", "mountain"],
-            # Observation
-            "view": ["viewpoint", "vista", "overlook", "lookout"],
-            "camera": ["photo", "picture"],
-            "lookout": ["observation", "tower", "view"],
-            # Shelters
-            "cabin": ["hut", "yurt", "shelter"],
-            "shelter": ["refuge", "cabin", "house"],
-            # Water activities
-            "boat": ["canoe", "kayak", "raft"],
-            "paddle": ["canoe", "kayak"],
-            "raft": ["rafting", "put in", "take out"],
-            # Wildlife
-            "bird": ["eagle"],
-            "fish": ["fishing"],
-            # Facilities
-            "food": ["restaurant", "food source", "aid station"],
-            "emergency": ["phone", "sos", "rescue"],
-        }
+        return {key: list(related) for key, related in _SYNONYMS.items()}
+
+
+# Semantic synonyms and related terms, shared by all matchers.
+_SYNONYMS: Dict[str, List[str]] = {
+    # Climbing
+    "climb": ["climbing", "rappel", "caving", "ascent"],
+    # Camping
+    "camp": [
+        "campsite",
+        "campground",
+        "camping",
+        "camp area",
+        "camp backcountry",
+    ],
+    "tent": ["campsite", "camping", "camp"],
+    "bivy": ["camp backcountry", "bivouac"],
+    # Water
+    "water": ["creek", "stream", "lake", "river", "spring", "water source"],
+    "spring": ["water source", "water"],
+    "falls": ["waterfall"],
+    "hot": ["hot spring", "thermal", "geyser"],
+    # Winter sports
+    "ski": ["skiing", "xc skiing", "ski touring", "backcountry"],
+    "skin": ["ski touring", "skin track", "uptrack"],
+    "tour": ["ski touring", "touring"],
+    "snowboard": ["snowboarder", "boarding"],
+    "snow": ["snowmobile", "snowpark", "snow pit"],
+    # Hazards
+    "danger": ["hazard", "caution", "warning"],
+    "avy": ["avalanche", "hazard", "slide"],
+    "avalanche": ["hazard", "avy", "slide path"],
+    # Transportation
+    "car": ["parking", "vehicle", "lot"],
+    "parking": ["lot", "trailhead"],
+    "bike": ["bicycle", "mountain biking", "dirt bike"],
+    "atv": ["quad", "4x4"],
+    # Trails
+    "trail": ["trailhead", "hike", "path"],
+    "trailhead": ["trail head", "th", "parking"],
+    "hike": ["hiking", "backpacker", "mountaineer"],
+    # Peaks
+    "peak": ["summit", "mountain", "top"],
+    "summit": ["peak", "top", "mountain"],
+    # Observation
+    "view": ["viewpoint", "vista", "overlook", "lookout"],
+    "camera": ["photo", "picture"],
+    "lookout": ["observation", "tower", "view"],
+    # Shelters
+    "cabin": ["hut", "yurt", "shelter"],
+    "shelter": ["refuge", "cabin", "house"],
+    # Water activities
+    "boat": ["canoe", "kayak", "raft"],
+    "paddle": ["canoe", "kayak"],
+    "raft": ["rafting", "put in", "take out"],
+    # Wildlife
+    "bird": ["eagle"],
+    "fish": ["fishing"],
+    # Facilities
+    "food": ["restaurant", "food source", "aid station"],
+    "emergency": ["phone", "sos", "rescue"],
+}
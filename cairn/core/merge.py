@@ -47,7 +47,7 @@ def merge_onx_gpx_and_kml(
             getattr(item, "style", None) and getattr(item.style, "OnX_id", None)
         ) or None
         if not oid:
-            out.items.append(item)
+            out.add_item(item)
             if trace is not None:
                 trace.emit(
                     {
@@ -60,7 +60,7 @@ def merge_onx_gpx_and_kml(
 
         existing = by_onx_id.get(oid)
         if existing is None:
-            out.items.append(item)
+            out.add_item(item)
             by_onx_id[oid] = item
             if trace is not None:
                 trace.emit(
@@ -114,12 +114,11 @@ def merge_onx_gpx_and_kml(
 
                 # Ensure kept shape is present in output items.
                 if keep_shape is item:
-                    out.items.append(keep_shape)
+                    out.add_item(keep_shape)
                     by_onx_id[oid] = keep_shape
 
                 # Remove the dropped item from output if it was already present.
-                if drop_item in out.items:
-                    out.items = [x for x in out.items if x is not drop_item]
+                out.discard_items([drop_item])
 
                 # Record decision in extras.
                 keep_shape.extra.setdefault("merge_decisions", []).append(
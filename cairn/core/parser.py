@@ -7,12 +7,22 @@ features by folder and geometry type.
 
 from __future__ import annotations
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, TextIO, Tuple
 from pathlib import Path
 import json
+import re
 from cairn.utils.utils import strip_html
 
 
+# Files at or above this size are parsed with the streaming reader by default.
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Read size for the streaming reader (characters per read()).
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
 class ParsedFeature:
     """Represents a parsed CalTopo feature."""
 
@@ -129,65 +139,248 @@ class ParsedData:
         return [(fid, data["name"]) for fid, data in self.folders.items()]
 
 
-def parse_geojson(filepath: Path) -> ParsedData:
+class _FeatureCollectionStream:
     """
-    Parse a CalTopo GeoJSON export file.
+    Incremental reader for a top-level GeoJSON FeatureCollection.
 
-    CalTopo exports have a specific structure:
-    - Features with class="Folder" and geometry=null represent folders
-    - Other features belong to folders (though the linking mechanism varies)
-    - Features have class="Marker", "Line", or "Shape"
+    Only one member value (or one element of `features`) is decoded at a time, so
+    peak memory is bounded by the largest single feature rather than the file size.
+    """
 
-    Args:
-        filepath: Path to the GeoJSON file
+    def __init__(self, fh: TextIO, *, chunk_size: int = _STREAM_CHUNK_SIZE):
+        self._fh = fh
+        self._chunk_size = max(1, int(chunk_size))
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # absolute character offset of self._buf[0]
+        self._eof = False
+
+    def _error(self, msg: str, pos: Optional[int] = None) -> ValueError:
+        at = self._offset + (self._pos if pos is None else pos)
+        return ValueError(f"{msg} (char {at})")
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Drop the consumed prefix and read more input. Returns False at EOF."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._offset += self._pos
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        chunk = self._fh.read(max(self._chunk_size, min_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _consume(self, expected: str) -> None:
+        if self._peek() != expected:
+            raise self._error(f"Expecting {expected!r} delimiter")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        if not self._peek():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                error = self._error(e.msg, e.pos)
+                # Most likely the value straddles the buffer end; grow geometrically
+                # so retries stay linear in the size of the value.
+                if self._fill(len(self._buf)):
+                    continue
+                raise error
+            # A bare number/literal can be cut short at a chunk boundary.
+            if end >= len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def events(self) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Yield ("member", key, value) for top-level members other than a `features`
+        array, and ("feature", index, value) for each element of that array.
+        """
+        if self._peek() != "{":
+            # Surface a JSON syntax error if there is one; otherwise it's valid JSON
+            # that simply isn't an object.
+            self._value()
+            raise _NotAnObject()
+        self._pos += 1
+
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                key = self._value()
+                if not isinstance(key, str):
+                    raise self._error("Expecting property name enclosed in double quotes")
+                self._consume(":")
+
+                if key == "features" and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        idx = 0
+                        while True:
+                            yield "feature", idx, self._value()
+                            idx += 1
+                            c = self._peek()
+                            self._pos += 1
+                            if c == "]":
+                                break
+                            if c != ",":
+                                self._pos -= 1
+                                raise self._error("Expecting ',' delimiter")
+                    yield "member", key, []
+                else:
+                    yield "member", key, self._value()
+
+                c = self._peek()
+                self._pos += 1
+                if c == "}":
+                    break
+                if c != ",":
+                    self._pos -= 1
+                    raise self._error("Expecting ',' delimiter")
+
+        if self._peek():
+            raise self._error("Extra data")
+
+
+class _NotAnObject(Exception):
+    """Raised by the streaming reader when the top-level JSON value isn't an object."""
+
+
+def _check_geojson_file(filepath: Path) -> None:
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
 
-    Returns:
-        ParsedData object with organized features
+    # Validate file is not empty
+    if filepath.stat().st_size == 0:
+        raise ValueError(f"GeoJSON file is empty: {filepath}")
+
+
+def _json_parse_error(e: Any, filepath: Path) -> ValueError:
+    return ValueError(
+        f"Invalid GeoJSON file (JSON parse error): {e}\n"
+        f"File: {filepath}\n"
+        f"Tip: Check that the file is valid JSON format"
+    )
+
+
+def _not_object_error(filepath: Path) -> ValueError:
+    return ValueError(
+        f"Invalid GeoJSON file: expected a JSON object at the top level\n"
+        f"File: {filepath}"
+    )
+
+
+def _not_feature_collection_error(filepath: Path) -> ValueError:
+    return ValueError(
+        f"Invalid GeoJSON file: expected type='FeatureCollection'\n"
+        f"File: {filepath}\n"
+        f"Tip: Make sure this is a CalTopo export GeoJSON"
+    )
+
+
+def _features_not_list_error(filepath: Path) -> ValueError:
+    return ValueError(
+        f"Invalid GeoJSON file: expected 'features' to be a list\nFile: {filepath}"
+    )
+
+
+def iter_geojson_features(
+    filepath: Path, *, chunk_size: int = _STREAM_CHUNK_SIZE
+) -> Iterator[ParsedFeature]:
+    """
+    Stream `ParsedFeature`s from a CalTopo GeoJSON export without loading the whole file.
+
+    Features are yielded in file order as soon as each one has been decoded. Validation
+    that depends on the whole document (top-level `type`, a non-empty `features` list)
+    happens once the stream has been consumed, so callers see those errors at the end.
 
     Raises:
         FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file isn't valid JSON
+        ValueError: If the file is empty, isn't valid JSON, or isn't a FeatureCollection
     """
     filepath = Path(filepath)
+    _check_geojson_file(filepath)
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    doc_type: Any = None
+    saw_features = False
+    feature_count = 0
 
-    # Validate file is not empty
-    if filepath.stat().st_size == 0:
-        raise ValueError(f"GeoJSON file is empty: {filepath}")
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            stream = _FeatureCollectionStream(f, chunk_size=chunk_size)
+            for kind, key, value in stream.events():
+                if kind == "feature":
+                    feature_count += 1
+                    if isinstance(value, dict):
+                        yield ParsedFeature(value)
+                    continue
+                if key == "type":
+                    doc_type = value
+                elif key == "features":
+                    saw_features = True
+                    if not isinstance(value, list):
+                        raise _features_not_list_error(filepath)
+                    # A non-streamed `features` value can only be an empty list here.
+    except _NotAnObject:
+        raise _not_object_error(filepath)
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Failed to read GeoJSON file: {e}\nFile: {filepath}")
+    except ValueError as e:
+        if str(e).startswith("Invalid GeoJSON file"):
+            raise
+        raise _json_parse_error(e, filepath)
+    except OSError as e:
+        raise ValueError(f"Failed to read GeoJSON file: {e}\nFile: {filepath}")
 
+    if (doc_type or "") != "FeatureCollection":
+        raise _not_feature_collection_error(filepath)
+
+    if not saw_features or feature_count == 0:
+        raise ValueError(
+            f"No features found in GeoJSON file: {filepath}\n"
+            f"Tip: Make sure this is a CalTopo export with at least one feature"
+        )
+
+
+def _load_geojson_features(filepath: Path) -> List[Dict[str, Any]]:
+    """Load and validate a whole GeoJSON file, returning its raw `features` list."""
     # Load the GeoJSON with error handling
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             data = json.load(f)
     except json.JSONDecodeError as e:
-        raise ValueError(
-            f"Invalid GeoJSON file (JSON parse error): {e}\n"
-            f"File: {filepath}\n"
-            f"Tip: Check that the file is valid JSON format"
-        )
+        raise _json_parse_error(e, filepath)
     except Exception as e:
         raise ValueError(f"Failed to read GeoJSON file: {e}\nFile: {filepath}")
 
     if not isinstance(data, dict):
-        raise ValueError(
-            f"Invalid GeoJSON file: expected a JSON object at the top level\n"
-            f"File: {filepath}"
-        )
+        raise _not_object_error(filepath)
 
     if (data.get("type") or "") != "FeatureCollection":
-        raise ValueError(
-            f"Invalid GeoJSON file: expected type='FeatureCollection'\n"
-            f"File: {filepath}\n"
-            f"Tip: Make sure this is a CalTopo export GeoJSON"
-        )
+        raise _not_feature_collection_error(filepath)
 
     features = data.get("features", [])
     if not isinstance(features, list):
-        raise ValueError(
-            f"Invalid GeoJSON file: expected 'features' to be a list\nFile: {filepath}"
-        )
+        raise _features_not_list_error(filepath)
 
     if not features:
         raise ValueError(
@@ -195,17 +388,23 @@ def parse_geojson(filepath: Path) -> ParsedData:
             f"Tip: Make sure this is a CalTopo export with at least one feature"
         )
 
+    return features
+
+
+def _build_parsed_data(features: Iterable[ParsedFeature], filepath: Path) -> ParsedData:
+    """
+    Organize features into folders.
+
+    The first pass registers folders and keeps the remaining features in file order;
+    the second pass only looks at each feature's `folderId` to place it.
+    """
     parsed_data = ParsedData()
 
     # First pass: identify folders
     folder_features = []
     non_folder_features = []
 
-    for feature_dict in features:
-        if not isinstance(feature_dict, dict):
-            continue
-        feature = ParsedFeature(feature_dict)
-
+    for feature in features:
         if feature.is_folder():
             folder_features.append(feature)
             parsed_data.add_folder(feature.id, feature.title)
@@ -250,6 +449,42 @@ def parse_geojson(filepath: Path) -> ParsedData:
     return parsed_data
 
 
+def parse_geojson(filepath: Path, *, streaming: Optional[bool] = None) -> ParsedData:
+    """
+    Parse a CalTopo GeoJSON export file.
+
+    CalTopo exports have a specific structure:
+    - Features with class="Folder" and geometry=null represent folders
+    - Other features belong to folders (though the linking mechanism varies)
+    - Features have class="Marker", "Line", or "Shape"
+
+    Args:
+        filepath: Path to the GeoJSON file
+        streaming: Decode `features` incrementally instead of loading the whole JSON
+            tree. Defaults to on for files of at least `STREAMING_THRESHOLD_BYTES`.
+
+    Returns:
+        ParsedData object with organized features
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file isn't valid JSON or isn't a CalTopo FeatureCollection
+    """
+    filepath = Path(filepath)
+    _check_geojson_file(filepath)
+
+    if streaming is None:
+        streaming = filepath.stat().st_size >= STREAMING_THRESHOLD_BYTES
+
+    if streaming:
+        return _build_parsed_data(iter_geojson_features(filepath), filepath)
+
+    features = _load_geojson_features(filepath)
+    return _build_parsed_data(
+        (ParsedFeature(f) for f in features if isinstance(f, dict)), filepath
+    )
+
+
 def get_file_summary(parsed_data: ParsedData) -> Dict[str, Any]:
     """
     Get a summary of the parsed data.
@@ -0,0 +1,128 @@
+"""
+Coordinate precision policy for output writers.
+
+By default every writer emits Python's shortest round-trip float repr, which is
+up to 17 significant digits per number. GPS fixes are nowhere near that precise,
+so a fixed number of decimals shrinks GPX/KML/GeoJSON output substantially
+(and with it the number of GPX parts needed under the OnX import cap):
+
+- 6 decimals of latitude/longitude is ~0.11 m at the equator
+- 7 decimals is ~1 cm
+- 1 decimal of elevation is 10 cm
+
+The policy is set from `--coord-decimals` / `--ele-decimals` or the config keys
+`coordinate_decimals` / `elevation_decimals` (flags win).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+
+# Suggested values when users opt in (see module docstring).
+RECOMMENDED_COORD_DECIMALS = 6
+RECOMMENDED_ELE_DECIMALS = 1
+
+_MAX_DECIMALS = 15
+
+
+def _validate_decimals(name: str, value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(
+            f"{name} must be an integer between 0 and {_MAX_DECIMALS} (got {value!r})"
+        )
+    if not (0 <= value <= _MAX_DECIMALS):
+        raise ValueError(f"{name} must be between 0 and {_MAX_DECIMALS} (got {value})")
+    return value
+
+
+def _repr_number(x: Any) -> str:
+    return f"{x}"
+
+
+def _fixed_formatter(decimals: int) -> Callable[[Any], str]:
+    """
+    Build a fixed-point formatter that drops redundant trailing zeros.
+
+    `-105.1234567` -> `-105.123457` and `40.25` -> `40.25` (6 decimals). A
+    value that rounds to a whole number keeps one decimal (`40.0`), matching
+    float repr. Non-numeric input falls back to str().
+    """
+    spec = f".{decimals}f"
+
+    def fmt(x: Any) -> str:
+        try:
+            s = format(x, spec)
+        except (TypeError, ValueError):
+            return f"{x}"
+        if "." in s:
+            s = s.rstrip("0")
+            if s[-1] == ".":
+                s += "0"
+        return s
+
+    return fmt
+
+
+@dataclass(frozen=True)
+class CoordinatePrecision:
+    """
+    Number of decimals written for lon/lat and elevation (None = full precision).
+
+    `format_coord(x)` / `format_ele(x)` return the text written for one value.
+    """
+
+    coord_decimals: Optional[int] = None
+    ele_decimals: Optional[int] = None
+    format_coord: Callable[[Any], str] = field(init=False, repr=False, compare=False)
+    format_ele: Callable[[Any], str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _validate_decimals("coord_decimals", self.coord_decimals)
+        _validate_decimals("ele_decimals", self.ele_decimals)
+        # Formatters are resolved once; writers call them per coordinate.
+        for attr, decimals in (
+            ("format_coord", self.coord_decimals),
+            ("format_ele", self.ele_decimals),
+        ):
+            fmt = _repr_number if decimals is None else _fixed_formatter(decimals)
+            object.__setattr__(self, attr, fmt)
+
+    def __reduce__(self):
+        # Formatters are closures; rebuild them instead of pickling (process pools).
+        return (type(self), (self.coord_decimals, self.ele_decimals))
+
+    @property
+    def is_full(self) -> bool:
+        return self.coord_decimals is None and self.ele_decimals is None
+
+    def round_coord(self, x: float) -> float:
+        """Round for numeric (JSON) output; identity at full precision."""
+        return x if self.coord_decimals is None else round(x, self.coord_decimals)
+
+    def round_ele(self, x: float) -> float:
+        return x if self.ele_decimals is None else round(x, self.ele_decimals)
+
+
+FULL_PRECISION = CoordinatePrecision()
+
+
+def resolve_precision(
+    coord_decimals: Optional[int] = None,
+    ele_decimals: Optional[int] = None,
+    *,
+    config: Any = None,
+) -> CoordinatePrecision:
+    """
+    Build the effective policy: explicit values (CLI flags) override config.
+    """
+    if coord_decimals is None:
+        coord_decimals = getattr(config, "coordinate_decimals", None)
+    if ele_decimals is None:
+        ele_decimals = getattr(config, "elevation_decimals", None)
+    if coord_decimals is None and ele_decimals is None:
+        return FULL_PRECISION
+    return CoordinatePrecision(coord_decimals=coord_decimals, ele_decimals=ele_decimals)
@@ -1696,7 +1696,7 @@ def interactive_review(
                     ]
                     if symbols:
                         most_common = max(set(symbols), key=symbols.count)
-                        save_user_mapping(most_common, new_icon)
+                        save_user_mapping(most_common, new_icon, config=config)
                         console.print(
                             f"[green]✓[/] Updated mapping: {most_common} → {new_icon}"
                         )
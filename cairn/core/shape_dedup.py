@@ -9,10 +9,14 @@ We keep the dropped features in a separate output and write a human-readable sum
 
 from __future__ import annotations
 
+import bisect
+import hashlib
+import math
+import struct
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from cairn.model import MapDocument, Shape, Track
+from cairn.model import MapDocument, RingPoints, Shape, Track, as_track_points
 
 
 def _round6(x: float) -> float:
@@ -30,20 +34,59 @@ def _strip_closing_point(ring: List[Tuple[float, float]]) -> List[Tuple[float, f
     return ring
 
 
+def _least_rotation_index(seq: List[Tuple[float, float]]) -> int:
+    """
+    Start index of the lexicographically smallest rotation (Booth's algorithm).
+
+    Runs in O(n) comparisons using a KMP-style failure function over the
+    doubled sequence.
+    """
+    n = len(seq)
+    s = seq + seq
+    fail = [-1] * (2 * n)
+    k = 0
+    for j in range(1, 2 * n):
+        sj = s[j]
+        i = fail[j - k - 1]
+        while i != -1 and sj != s[k + i + 1]:
+            if sj < s[k + i + 1]:
+                k = j - i - 1
+            i = fail[i]
+        if sj != s[k + i + 1]:  # i == -1
+            if sj < s[k]:
+                k = j
+            fail[j - k] = -1
+        else:
+            fail[j - k] = i + 1
+    return k
+
+
 def _min_rotation(seq: List[Tuple[float, float]]) -> Tuple[Tuple[float, float], ...]:
     """
-    Return lexicographically smallest rotation.
-    O(n^2) but rings are small enough for our typical datasets.
+    Return lexicographically smallest rotation in linear time.
     """
     if not seq:
         return tuple()
-    best = None
-    n = len(seq)
-    for i in range(n):
-        rot = tuple(seq[i:] + seq[:i])
-        if best is None or rot < best:
-            best = rot
-    return best or tuple()
+    k = _least_rotation_index(seq)
+    return tuple(seq[k:] + seq[:k])
+
+
+def signature_digest(sig: Tuple) -> bytes:
+    """
+    Compact fixed-size (16-byte) digest of a `polygon_signature`/`line_signature`.
+
+    Two signatures compare equal iff their digests match (barring a BLAKE2b
+    collision), so the digest can replace the nested coordinate tuples as a
+    grouping key without memory scaling with vertex count.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(sig[0].encode("utf-8"))
+    for part in sig[1:]:
+        # Length prefix keeps the encoding unambiguous across parts; `+ 0.0`
+        # folds -0.0 into 0.0 so equal tuples always produce equal bytes.
+        flat = [c + 0.0 for pt in part for c in pt]
+        h.update(struct.pack(f"<Q{len(flat)}d", len(part), *flat))
+    return h.digest()
 
 
 def polygon_signature(shape: Shape) -> Optional[Tuple]:
@@ -67,7 +110,11 @@ def polygon_signature(shape: Shape) -> Optional[Tuple]:
     """
     if not shape.rings:
         return None
-    ring0 = [_norm_point2(p) for p in shape.rings[0]]
+    ring = shape.rings[0]
+    if isinstance(ring, RingPoints):
+        ring0 = list(zip(map(_round6, ring.lon), map(_round6, ring.lat)))
+    else:
+        ring0 = [_norm_point2(p) for p in ring]
     ring0 = _strip_closing_point(ring0)
     if len(ring0) < 3:
         return None
@@ -96,7 +143,8 @@ def line_signature(track: Track) -> Optional[Tuple]:
     """
     if not track.points:
         return None
-    pts = [(_round6(p[0]), _round6(p[1])) for p in track.points]
+    cols = as_track_points(track.points)
+    pts = list(zip(map(_round6, cols.lon), map(_round6, cols.lat)))
     if len(pts) < 2:
         return None
     fwd = tuple(pts)
@@ -122,10 +170,206 @@ class ShapeDedupReport:
         return sum(len(g.dropped_ids) for g in self.groups)
 
 
+# ---------------------------------------------------------------------------
+# Fuzzy (tolerance-based) line matching
+# ---------------------------------------------------------------------------
+
+_METERS_PER_DEG = math.pi * 6371008.8 / 180.0
+# Vertices per track after arc-length resampling for the Fréchet check.
+_FUZZY_SAMPLES = 64
+
+
+class _FuzzyLine:
+    """
+    Bounding box plus (lazily) arc-length resampled vertices for one track.
+
+    Resampling is deferred until the track survives the bbox prefilter, so
+    tracks with no candidate neighbours cost only a min/max scan.
+    """
+
+    __slots__ = ("item", "minlon", "minlat", "maxlon", "maxlat", "_pts", "_samples")
+
+    def __init__(self, item: Track) -> None:
+        pts = as_track_points(item.points)
+        self.item = item
+        self.minlon = min(pts.lon)
+        self.maxlon = max(pts.lon)
+        self.minlat = min(pts.lat)
+        self.maxlat = max(pts.lat)
+        self._pts = pts
+        self._samples: Optional[Tuple[List[float], List[float]]] = None
+
+    def samples(self) -> Tuple[List[float], List[float]]:
+        if self._samples is None:
+            cos_lat = math.cos(math.radians((self.minlat + self.maxlat) / 2))
+            self._samples = _resample_by_arc_length(
+                self._pts.lon, self._pts.lat, _FUZZY_SAMPLES, cos_lat
+            )
+        return self._samples
+
+
+def _resample_by_arc_length(
+    lon: Sequence[float], lat: Sequence[float], n: int, cos_lat: float
+) -> Tuple[List[float], List[float]]:
+    """
+    Resample a polyline to `n` points evenly spaced along its length.
+
+    Resampling both tracks to the same fractional positions lets differently
+    sampled recordings of one route line up vertex-for-vertex.
+    """
+    cum = [0.0]
+    for i in range(1, len(lon)):
+        dx = (lon[i] - lon[i - 1]) * cos_lat
+        dy = lat[i] - lat[i - 1]
+        cum.append(cum[-1] + math.hypot(dx, dy))
+    total = cum[-1]
+    if total == 0.0:
+        return [lon[0]] * n, [lat[0]] * n
+
+    out_lon: List[float] = []
+    out_lat: List[float] = []
+    seg = 1
+    for k in range(n):
+        target = total * k / (n - 1)
+        while seg < len(cum) - 1 and cum[seg] < target:
+            seg += 1
+        span = cum[seg] - cum[seg - 1]
+        t = (target - cum[seg - 1]) / span if span > 0 else 0.0
+        out_lon.append(lon[seg - 1] + (lon[seg] - lon[seg - 1]) * t)
+        out_lat.append(lat[seg - 1] + (lat[seg] - lat[seg - 1]) * t)
+    return out_lon, out_lat
+
+
+def _frechet_within(
+    alon: List[float],
+    alat: List[float],
+    blon: List[float],
+    blat: List[float],
+    cos_lat: float,
+    tol2: float,
+) -> bool:
+    """
+    Decide whether the discrete Fréchet distance between two vertex sequences
+    is within tolerance (`tol2` is the squared tolerance in degrees of latitude).
+
+    Row-by-row reachability DP; bails out as soon as a row is unreachable.
+    """
+    n, m = len(alon), len(blon)
+    for i, j in ((0, 0), (n - 1, m - 1)):
+        dx = (alon[i] - blon[j]) * cos_lat
+        dy = alat[i] - blat[j]
+        if dx * dx + dy * dy > tol2:
+            return False
+
+    prev = [False] * m
+    for i in range(n):
+        ax = alon[i]
+        ay = alat[i]
+        cur = [False] * m
+        left = False
+        for j in range(m):
+            if left or prev[j] or (j > 0 and prev[j - 1]) or (i == 0 and j == 0):
+                dx = (ax - blon[j]) * cos_lat
+                dy = ay - blat[j]
+                left = dx * dx + dy * dy <= tol2
+                cur[j] = left
+            else:
+                left = False
+        if not any(cur):
+            return False
+        prev = cur
+    return prev[-1]
+
+
+def _lines_match(a: _FuzzyLine, b: _FuzzyLine, tolerance_m: float) -> bool:
+    cos_lat = math.cos(math.radians((a.minlat + a.maxlat + b.minlat + b.maxlat) / 4))
+    tol2 = (tolerance_m / _METERS_PER_DEG) ** 2
+    alon, alat = a.samples()
+    blon, blat = b.samples()
+    if _frechet_within(alon, alat, blon, blat, cos_lat, tol2):
+        return True
+    # Direction invariant: the same route may have been recorded backwards.
+    return _frechet_within(alon, alat, blon[::-1], blat[::-1], cos_lat, tol2)
+
+
+def _fuzzy_line_groups(tracks: List[Track], tolerance_m: float) -> List[List[Track]]:
+    """
+    Group same-title tracks whose paths are within `tolerance_m` metres.
+
+    Candidates are found with a bounding-box prefilter: two lines within
+    Hausdorff/Fréchet distance d have every bbox edge within d of each other,
+    so each track is only compared against same-title anchors whose min
+    longitude falls in a `bisect` window and whose other edges also agree.
+    Matches are confirmed with a direction-invariant discrete Fréchet test
+    on arc-length resampled vertices. Each group is anchored at its first
+    track (document order); later tracks join the first matching anchor.
+    """
+    lines: List[_FuzzyLine] = []
+    max_abs_lat = 0.0
+    for trk in tracks:
+        if len(trk.points) < 2:
+            continue
+        line = _FuzzyLine(trk)
+        lines.append(line)
+        max_abs_lat = max(max_abs_lat, abs(line.minlat), abs(line.maxlat))
+    if not lines:
+        return []
+
+    tol_lat = tolerance_m / _METERS_PER_DEG
+    tol_lon = tol_lat / math.cos(math.radians(min(89.0, max_abs_lat)))
+
+    # title -> anchors sorted by minlon (parallel key list for bisect)
+    anchor_keys: Dict[str, List[float]] = {}
+    anchors: Dict[str, List[_FuzzyLine]] = {}
+    members: Dict[int, List[Track]] = {}
+    seq: Dict[int, int] = {}
+    order: List[int] = []
+    for line in lines:
+        title = line.item.name
+        keys = anchor_keys.setdefault(title, [])
+        cands = anchors.setdefault(title, [])
+        lo = bisect.bisect_left(keys, line.minlon - tol_lon)
+        hi = bisect.bisect_right(keys, line.minlon + tol_lon)
+        match: Optional[_FuzzyLine] = None
+        # Earliest anchor wins, independent of its minlon position.
+        for cand in sorted(cands[lo:hi], key=lambda c: seq[id(c)]):
+            if (
+                abs(cand.maxlon - line.maxlon) <= tol_lon
+                and abs(cand.minlat - line.minlat) <= tol_lat
+                and abs(cand.maxlat - line.maxlat) <= tol_lat
+                and _lines_match(cand, line, tolerance_m)
+            ):
+                match = cand
+                break
+        if match is not None:
+            members[id(match)].append(line.item)
+            continue
+        pos = bisect.bisect_right(keys, line.minlon)
+        keys.insert(pos, line.minlon)
+        cands.insert(pos, line)
+        members[id(line)] = [line.item]
+        seq[id(line)] = len(order)
+        order.append(id(line))
+
+    return [members[k] for k in order if len(members[k]) > 1]
+
+
+class _ShapeGroup:
+    """Members of one dedup group plus the current best-scoring member."""
+
+    __slots__ = ("members", "best", "best_score")
+
+    def __init__(self, first: object, score: Tuple[int, int]) -> None:
+        self.members: List[object] = [first]
+        self.best = first
+        self.best_score = score
+
+
 def apply_shape_dedup(
     doc: MapDocument,
     *,
     trace: Any = None,
+    line_tolerance_m: Optional[float] = None,
 ) -> Tuple[ShapeDedupReport, List[object]]:
     """
     Deduplicate polygons and lines by fuzzy geometry signature + title.
@@ -137,7 +381,10 @@ def apply_shape_dedup(
        - Lines: Round coords to 6 decimals, treat forward/reverse as equivalent
     2. Group shapes/tracks by (signature, normalized_title)
     3. For each group, select best item (prefer notes + OnX_id present)
-    4. Remove duplicates from document and track them in report
+    4. Optionally (`line_tolerance_m`), group surviving same-title tracks whose
+       paths are within that many metres (bbox prefilter + discrete Fréchet on
+       resampled vertices; see `_fuzzy_line_groups`)
+    5. Remove duplicates from document and track them in report
 
     Tolerance:
     - Coordinates rounded to 6 decimal places (~0.1 meter precision at equator)
@@ -147,6 +394,7 @@ def apply_shape_dedup(
     Args:
         doc: MapDocument to deduplicate in-place
         trace: Optional trace context for debugging
+        line_tolerance_m: Optional tolerance in metres enabling fuzzy line dedup
 
     Returns:
         Tuple of (dedup_report, dropped_items_list)
@@ -163,43 +411,48 @@ def apply_shape_dedup(
         - Circular polygons are normalized to start at lexicographically smallest vertex
     """
     # Build groups
-    groups: Dict[Tuple[str, str, Tuple], List[object]] = {}
-    for item in list(doc.items):
+    def score(it: object) -> Tuple[int, int]:
+        # Prefer richer notes, then stable OnX_id presence.
+        notes = getattr(it, "notes", "") or ""
+        style = getattr(it, "style", None)
+        onx_id = getattr(style, "OnX_id", None) if style is not None else None
+        return (len(notes.strip()), 1 if onx_id else 0)
+
+    # Single pass: group by (kind, title, digest) and track each group's winner
+    # as members arrive (first-best wins ties, matching `max`). Keys hold a
+    # fixed-size digest rather than the full coordinate tuples.
+    groups: Dict[Tuple[str, str, bytes], _ShapeGroup] = {}
+    for item in doc.items:
         if isinstance(item, Shape):
             sig = polygon_signature(item)
             if sig is None:
                 continue
-            key = ("Polygon", item.name, sig)
-            groups.setdefault(key, []).append(item)
+            key = ("Polygon", item.name, signature_digest(sig))
         elif isinstance(item, Track):
             sig = line_signature(item)
             if sig is None:
                 continue
-            key = ("LineString", item.name, sig)
-            groups.setdefault(key, []).append(item)
+            key = ("LineString", item.name, signature_digest(sig))
+        else:
+            continue
+        sc = score(item)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = _ShapeGroup(item, sc)
+        else:
+            group.members.append(item)
+            if sc > group.best_score:
+                group.best = item
+                group.best_score = sc
 
     report_groups: List[ShapeDedupGroup] = []
     dropped: List[object] = []
 
-    def score(it: object) -> Tuple[int, int]:
-        # Prefer richer notes, then stable OnX_id presence.
-        notes = getattr(it, "notes", "") or ""
-        style = getattr(it, "style", None)
-        onx_id = getattr(style, "OnX_id", None) if style is not None else None
-        return (len(notes.strip()), 1 if onx_id else 0)
-
-    for (kind, title, sig), members in groups.items():
-        if len(members) <= 1:
-            continue
-
-        kept = max(members, key=score)
+    def record(
+        kind: str, title: str, members: List[object], kept: object, reason: str
+    ) -> None:
         dropped_members = [m for m in members if m is not kept]
-        for m in dropped_members:
-            dropped.append(m)
-
-        # Remove dropped from doc.items
-        drop_obj_ids = {id(m) for m in dropped_members}
-        doc.items = [i for i in doc.items if id(i) not in drop_obj_ids]
+        dropped.extend(dropped_members)
 
         kept_id = getattr(kept, "id", "")
         dropped_ids = [getattr(m, "id", "") for m in dropped_members]
@@ -209,7 +462,7 @@ def apply_shape_dedup(
                 title=title,
                 kept_id=kept_id,
                 dropped_ids=dropped_ids,
-                reason="fuzzy_geometry_signature_match",
+                reason=reason,
             )
         )
 
@@ -221,9 +474,32 @@ def apply_shape_dedup(
                     "title": title,
                     "kept_id": kept_id,
                     "dropped_ids": dropped_ids,
-                    "reason": "fuzzy_geometry_signature_match",
+                    "reason": reason,
                     "group_size": len(members),
                 }
             )
 
+    for (kind, title, _digest), group in groups.items():
+        if len(group.members) <= 1:
+            continue
+        record(kind, title, group.members, group.best, "fuzzy_geometry_signature_match")
+
+    if line_tolerance_m is not None and line_tolerance_m > 0:
+        # Opt-in second pass over the surviving tracks for re-recorded or
+        # resampled copies that the exact signature cannot catch.
+        gone = {id(m) for m in dropped}
+        survivors = [i for i in doc.tracks() if id(i) not in gone]
+        for members in _fuzzy_line_groups(survivors, float(line_tolerance_m)):
+            kept = max(members, key=score)
+            record(
+                "LineString",
+                members[0].name,
+                list(members),
+                kept,
+                "line_distance_within_tolerance",
+            )
+
+    # Remove all dropped items from doc.items in one pass.
+    doc.discard_items(dropped)
+
     return ShapeDedupReport(groups=report_groups), dropped
@@ -0,0 +1,317 @@
+"""
+Track simplification.
+
+Dense GPS recordings (a vertex every metre or so) inflate GPX output, force
+extra split parts and slow the OnX app down. This module removes vertices that
+do not change a line's shape by more than a tolerance in metres, keeping the
+elevation/time of every retained vertex.
+
+Two algorithms are offered:
+- "dp": Douglas–Peucker. A vertex is kept if it lies more than `tolerance_m`
+  from the simplified segment (distance to the segment, not the infinite
+  line, so out-and-back spurs survive).
+- "vw": Visvalingam–Whyatt. Vertices are removed smallest effective triangle
+  area first until every remaining area is at least `tolerance_m ** 2`.
+
+Both start with a linear radial-distance pass that drops vertices closer than
+`tolerance_m` to the previously kept one; on metre-spaced tracks that removes
+most points before the more expensive pass runs. Distances use a local
+equirectangular projection around the track's mean latitude, which is accurate
+to well under a percent at track scale.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Literal, Optional, Sequence
+
+from cairn.core.parser import ParsedData, ParsedFeature
+from cairn.model import MapDocument, TrackPoints
+
+SimplifyMethod = Literal["dp", "vw"]
+SIMPLIFY_METHODS = ("dp", "vw")
+
+_METERS_PER_DEG = math.pi * 6371008.8 / 180.0
+
+
+@dataclass
+class TrackSimplifyReport:
+    id: str
+    name: str
+    before: int
+    after: int
+
+    @property
+    def removed(self) -> int:
+        return self.before - self.after
+
+
+@dataclass
+class SimplifyReport:
+    method: str
+    tolerance_m: float
+    tracks: List[TrackSimplifyReport] = field(default_factory=list)
+
+    @property
+    def vertices_before(self) -> int:
+        return sum(t.before for t in self.tracks)
+
+    @property
+    def vertices_after(self) -> int:
+        return sum(t.after for t in self.tracks)
+
+    @property
+    def removed_count(self) -> int:
+        return self.vertices_before - self.vertices_after
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of vertices removed (0.0–1.0)."""
+        before = self.vertices_before
+        return (self.removed_count / before) if before else 0.0
+
+
+def _project(lons: Sequence[float], lats: Sequence[float]):
+    n = len(lats)
+    lat0 = math.radians(math.fsum(lats) / n) if n else 0.0
+    kx = _METERS_PER_DEG * math.cos(lat0)
+    ky = _METERS_PER_DEG
+    return [lon * kx for lon in lons], [lat * ky for lat in lats]
+
+
+def _radial_pass(xs: List[float], ys: List[float], tol: float) -> List[int]:
+    """Indices of vertices at least `tol` from the previously kept one (ends kept)."""
+    tol2 = tol * tol
+    last = len(xs) - 1
+    keep = [0]
+    px, py = xs[0], ys[0]
+    for i in range(1, last):
+        x, y = xs[i], ys[i]
+        dx, dy = x - px, y - py
+        if dx * dx + dy * dy >= tol2:
+            keep.append(i)
+            px, py = x, y
+    keep.append(last)
+    return keep
+
+
+def _douglas_peucker(xs: List[float], ys: List[float], tol: float) -> List[int]:
+    """Positions (into xs/ys) kept by Douglas–Peucker, in order."""
+    n = len(xs)
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        ax, ay, bx, by = xs[i], ys[i], xs[j], ys[j]
+        dx, dy = bx - ax, by - ay
+        seg2 = dx * dx + dy * dy
+        sx, sy = xs[i + 1 : j], ys[i + 1 : j]
+        if seg2 == 0.0:
+            # Closed loop segment: distance to the shared endpoint.
+            d = [(x - ax) * (x - ax) + (y - ay) * (y - ay) for x, y in zip(sx, sy)]
+            limit = tol * tol
+        else:
+            # |cross| is distance-to-line scaled by the segment length.
+            c = bx * ay - by * ax
+            d = [abs(dy * x - dx * y + c) for x, y in zip(sx, sy)]
+            seg_len = math.sqrt(seg2)
+            limit = tol * seg_len
+            if max(d) <= limit:
+                # Within the corridor; vertices projecting past an endpoint
+                # can still be far from the segment itself (out-and-back).
+                proj = [(x - ax) * dx + (y - ay) * dy for x, y in zip(sx, sy)]
+                if min(proj) < 0.0 or max(proj) > seg2:
+                    for k, t in enumerate(proj):
+                        if t < 0.0:
+                            d[k] = math.hypot(sx[k] - ax, sy[k] - ay) * seg_len
+                        elif t > seg2:
+                            d[k] = math.hypot(sx[k] - bx, sy[k] - by) * seg_len
+        m = max(d)
+        if m > limit:
+            k = i + 1 + d.index(m)
+            keep[k] = 1
+            stack.append((i, k))
+            stack.append((k, j))
+    return [i for i in range(n) if keep[i]]
+
+
+def _visvalingam(xs: List[float], ys: List[float], min_area: float) -> List[int]:
+    """Positions (into xs/ys) kept by Visvalingam–Whyatt, in order."""
+    n = len(xs)
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+
+    def tri(a: int, b: int, c: int) -> float:
+        return 0.5 * abs(
+            (xs[b] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[b] - ys[a])
+        )
+
+    area = [math.inf] * n
+    for i in range(1, n - 1):
+        area[i] = tri(i - 1, i, i + 1)
+    heap = [(area[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    removed = bytearray(n)
+    while heap:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != area[i]:
+            continue  # stale entry
+        if a >= min_area:
+            break
+        removed[i] = 1
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+        for k in (p, q):
+            if 0 < k < n - 1:
+                # Effective area never drops below the removed vertex's area.
+                area[k] = max(tri(prev[k], k, nxt[k]), a)
+                heapq.heappush(heap, (area[k], k))
+    return [i for i in range(n) if not removed[i]]
+
+
+def simplify_indices(
+    lons: Sequence[float],
+    lats: Sequence[float],
+    tolerance_m: float,
+    *,
+    method: SimplifyMethod = "dp",
+) -> List[int]:
+    """
+    Indices of the vertices to keep (ascending; first and last always kept).
+    """
+    if method not in SIMPLIFY_METHODS:
+        raise ValueError(
+            f"Unknown simplification method {method!r} (expected one of: {', '.join(SIMPLIFY_METHODS)})"
+        )
+    n = len(lons)
+    if n <= 2 or not tolerance_m or tolerance_m <= 0:
+        return list(range(n))
+
+    xs, ys = _project(lons, lats)
+    idx = _radial_pass(xs, ys, tolerance_m)
+    if len(idx) <= 2:
+        return idx
+    sub_x = [xs[i] for i in idx]
+    sub_y = [ys[i] for i in idx]
+    if method == "dp":
+        kept = _douglas_peucker(sub_x, sub_y, tolerance_m)
+    else:
+        kept = _visvalingam(sub_x, sub_y, tolerance_m * tolerance_m)
+    return [idx[k] for k in kept]
+
+
+def simplify_track_points(
+    points: TrackPoints, tolerance_m: float, *, method: SimplifyMethod = "dp"
+) -> TrackPoints:
+    """Simplified copy of `points` (the same object if nothing was removed)."""
+    idx = simplify_indices(points.lon, points.lat, tolerance_m, method=method)
+    if len(idx) == len(points):
+        return points
+    return points.take(idx)
+
+
+def apply_track_simplification(
+    doc: MapDocument,
+    tolerance_m: float,
+    *,
+    method: SimplifyMethod = "dp",
+    trace: Any = None,
+) -> SimplifyReport:
+    """
+    Simplify every Track in `doc` in place.
+    """
+    report = SimplifyReport(method=method, tolerance_m=float(tolerance_m))
+    for trk in doc.tracks():
+        before = len(trk.points)
+        trk.points = simplify_track_points(trk.points, tolerance_m, method=method)
+        after = len(trk.points)
+        report.tracks.append(
+            TrackSimplifyReport(id=trk.id, name=trk.name, before=before, after=after)
+        )
+        if trace is not None and after != before:
+            trace.emit(
+                {
+                    "event": "simplify.track",
+                    "id": trk.id,
+                    "name": trk.name,
+                    "before": before,
+                    "after": after,
+                }
+            )
+    return report
+
+
+def simplify_parsed_features(
+    features: Iterable[ParsedFeature],
+    tolerance_m: float,
+    *,
+    method: SimplifyMethod = "dp",
+    report: Optional[SimplifyReport] = None,
+) -> SimplifyReport:
+    """
+    Simplify LineString features in place (extra coordinate members such as
+    elevation are carried along with each retained vertex).
+
+    Pass `report` to accumulate results across several calls (e.g. folders).
+    """
+    if report is None:
+        report = SimplifyReport(method=method, tolerance_m=float(tolerance_m))
+    for feature in features:
+        if feature.geometry_type != "LineString":
+            continue
+        coords = feature.coordinates
+        if not coords:
+            continue
+        pts = [c for c in coords if isinstance(c, (list, tuple)) and len(c) >= 2]
+        before = len(coords)
+        if len(pts) == before:
+            idx = simplify_indices(
+                [c[0] for c in pts], [c[1] for c in pts], tolerance_m, method=method
+            )
+            if len(idx) != before:
+                feature.geometry["coordinates"] = [coords[i] for i in idx]
+        report.tracks.append(
+            TrackSimplifyReport(
+                id=str(feature.id or ""),
+                name=feature.title,
+                before=before,
+                after=len(feature.coordinates),
+            )
+        )
+    return report
+
+
+def simplify_parsed_data(
+    parsed_data: ParsedData,
+    tolerance_m: float,
+    *,
+    method: SimplifyMethod = "dp",
+) -> SimplifyReport:
+    """Simplify the tracks of every folder in `parsed_data` in place."""
+    report = SimplifyReport(method=method, tolerance_m=float(tolerance_m))
+    for folder in parsed_data.folders.values():
+        simplify_parsed_features(
+            folder.get("tracks", []), tolerance_m, method=method, report=report
+        )
+    simplify_parsed_features(
+        parsed_data.orphaned_features, tolerance_m, method=method, report=report
+    )
+    return report
+
+
+def normalize_simplify_method(method: Optional[str]) -> SimplifyMethod:
+    """Map user input (`dp`, `douglas-peucker`, `vw`, `visvalingam`, ...) to a method."""
+    raw = (method or "dp").strip().lower().replace("_", "-")
+    if raw in ("dp", "douglas-peucker", "rdp"):
+        return "dp"
+    if raw in ("vw", "visvalingam", "visvalingam-whyatt"):
+        return "vw"
+    raise ValueError(
+        f"Unknown simplification method {method!r} (expected one of: {', '.join(SIMPLIFY_METHODS)})"
+    )
@@ -3,41 +3,214 @@ Machine-parseable tracing for transformations.
 
 Trace files are JSON Lines (one JSON object per line). They are intentionally
 not optimized for human reading; they are optimized for replay and diffing.
+
+`TraceWriter` filters and JSON-encodes events in the caller's thread (so later
+mutation of an emitted payload can't leak into the trace) and hands the lines,
+in batches, to a background thread (bounded queue) that writes and compresses
+them. Run/stage events are handed off at once; item events wait for a full batch
+or for the writer to sit idle for `_FLUSH_INTERVAL_S`. Unclosed writers are
+closed at interpreter exit.
+
+- levels: "run" (run.*), "stage" (reports, inventories, warnings) and "item"
+  (one event per waypoint/track/feature, see `ITEM_EVENTS`)
+- `sample` keeps an evenly spaced fraction of each item event type
+- `.gz` / `.zst` paths are written gzip / zstd compressed (zstd needs the
+  optional `zstandard` package)
+
+`TraceReader` reads plain, gzip and zstd traces (detected from the file's magic
+bytes, not its name).
 """
 
 from __future__ import annotations
 
+import atexit
+import gzip
+import io
 import json
+import math
+import queue
+import threading
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+TRACE_LEVELS = ("run", "stage", "item")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Per-item events; everything else that is not `run.*` is stage level.
+ITEM_EVENTS = frozenset(
+    {
+        "input.wpt",
+        "input.trk",
+        "input.rte",
+        "input.kml.placemark",
+        "merge.add",
+        "merge.ignore",
+        "merge.prefer_polygon",
+        "dedup.group",
+        "shape_dedup.group",
+        "simplify.track",
+        "output.folder",
+        "output.feature",
+    }
+)
+
+DEFAULT_QUEUE_SIZE = 4096
+# Events per handoff to the writer thread, and how long the writer thread stays
+# idle before it picks up a partial batch itself.
+_BATCH_SIZE = 512
+_FLUSH_INTERVAL_S = 1.0
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_FLUSH = object()
+_CLOSE = object()
+
+
+def event_level(name: str) -> str:
+    """Trace level ("run", "stage" or "item") of an event name."""
+    if name.startswith("run."):
+        return "run"
+    if name in ITEM_EVENTS:
+        return "item"
+    return "stage"
+
+
+def _json_default(o: Any) -> Any:
+    if is_dataclass(o):
+        return asdict(o)
+    return str(o)
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, default=_json_default)
+
+
+def _import_zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd trace files need the optional 'zstandard' package (pip install zstandard)"
+        ) from e
+    return zstandard
+
+
+def _resolve_compression(path: Path, compression: Optional[str]) -> str:
+    if compression is None:
+        suffix = path.suffix.lower()
+        if suffix == ".gz":
+            return "gzip"
+        if suffix in (".zst", ".zstd"):
+            return "zstd"
+        return "none"
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown trace compression {compression!r} (expected one of {', '.join(COMPRESSIONS)})"
+        )
+    return compression
+
+
+def _open_sink(path: Path, compression: str) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        zstd = _import_zstd()
+        return zstd.ZstdCompressor().stream_writer(path.open("wb"), closefd=True)
+    return path.open("wb")
+
+
+def _open_source(path: Path) -> IO[str]:
+    with path.open("rb") as fh:
+        magic = fh.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        zstd = _import_zstd()
+        reader = zstd.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8")
+    return path.open("r", encoding="utf-8")
 
 
 class TraceWriter:
-    def __init__(self, path: str | Path):
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        level: str = "item",
+        sample: float = 1.0,
+        compression: Optional[str] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        if level not in TRACE_LEVELS:
+            raise ValueError(
+                f"Unknown trace level {level!r} (expected one of {', '.join(TRACE_LEVELS)})"
+            )
+        if not 0.0 < sample <= 1.0:
+            raise ValueError(f"Trace sample rate must be in (0, 1], got {sample!r}")
+
         self._path = Path(path)
-        self._fh = self._path.open("w", encoding="utf-8")
+        self._level = TRACE_LEVELS.index(level)
+        self._sample = sample
+        self._sample_counts: Dict[str, int] = {}
+        compression = _resolve_compression(self._path, compression)
+        self._fh = _open_sink(self._path, compression)
+
+        # Encoded lines are handed to the writer thread in batches; the queue
+        # holds at most ~queue_size events before emit() blocks. `_lock` guards
+        # `_pending`, which the writer thread also drains when idle.
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size // _BATCH_SIZE))
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="cairn-trace-writer", daemon=True
+        )
+        self._thread.start()
+        # The writer thread is a daemon; don't lose buffered events on exit.
+        atexit.register(self.close)
+
+        # Record how the trace was filtered so readers know what is missing.
+        if level != "item" or sample < 1.0:
+            self._put(
+                {
+                    "event": "trace.config",
+                    "level": level,
+                    "sample": sample,
+                    "compression": compression,
+                }
+            )
 
     @property
     def path(self) -> Path:
         return self._path
 
     def emit(self, event: Dict[str, Any]) -> None:
-        # Add a timestamp if caller didn't.
-        if "ts" not in event:
-            event = dict(event)
-            event["ts"] = datetime.now(timezone.utc).isoformat()
-
-        def default(o: Any) -> Any:
-            if is_dataclass(o):
-                return asdict(o)
-            return str(o)
+        name = str(event.get("event") or "")
+        level = event_level(name)
+        if TRACE_LEVELS.index(level) > self._level:
+            return
+        if level == "item" and self._sample < 1.0 and not self._keep_sample(name):
+            return
+        self._put(event, handoff=level != "item")
 
-        self._fh.write(json.dumps(event, ensure_ascii=False, default=default) + "\n")
-        self._fh.flush()
+    def flush(self) -> None:
+        """Block until every emitted event has been written and flushed."""
+        self._check()
+        self._handoff()
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._check()
 
     def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._handoff()
+        self._queue.put(_CLOSE)
+        self._thread.join()
         try:
             self._fh.close()
         except Exception:
@@ -49,15 +222,97 @@ class TraceWriter:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
+    def _keep_sample(self, name: str) -> bool:
+        # Deterministic, evenly spaced sampling per event type (keeps the first).
+        n = self._sample_counts.get(name, 0)
+        self._sample_counts[name] = n + 1
+        return math.floor(n * self._sample) != math.floor((n - 1) * self._sample)
+
+    def _put(self, event: Dict[str, Any], *, handoff: bool = True) -> None:
+        self._check()
+        # Add a timestamp if caller didn't.
+        if "ts" not in event:
+            event = {**event, "ts": datetime.now(timezone.utc).isoformat()}
+        line = _ENCODER.encode(event)
+        with self._lock:
+            self._pending.append(line)
+            if handoff or len(self._pending) >= _BATCH_SIZE:
+                self._handoff_locked()
+
+    def _handoff(self) -> None:
+        with self._lock:
+            self._handoff_locked()
+
+    def _handoff_locked(self) -> None:
+        # Queued under the lock so batches reach the writer in emit order. This
+        # may block on a full queue; the writer thread never waits on `_lock`.
+        if self._pending:
+            self._queue.put(self._pending)
+            self._pending = []
+
+    def _check(self) -> None:
+        if self._closed:
+            raise ValueError(f"Trace {self._path} is closed")
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            try:
+                item = q.get(timeout=_FLUSH_INTERVAL_S)
+            except queue.Empty:
+                # Caller went quiet mid-batch (long stage): write what it left.
+                # Never wait for the lock: a producer holding it may be blocked
+                # on the full queue, which only this thread drains.
+                if not self._lock.acquire(blocking=False):
+                    continue
+                try:
+                    if not q.empty():
+                        # A batch was queued meanwhile; write it first.
+                        continue
+                    stale, self._pending = self._pending, []
+                finally:
+                    self._lock.release()
+                if stale:
+                    self._write(stale, flush=True)
+                continue
+            try:
+                if item is _CLOSE or item is _FLUSH:
+                    self._write([], flush=True)
+                else:
+                    # Flush whenever we catch up, so an idle run's trace is on disk.
+                    self._write(item, flush=q.empty())
+            finally:
+                q.task_done()
+            if item is _CLOSE:
+                return
+
+    def _write(self, lines: List[str], *, flush: bool) -> None:
+        if self._error is not None:
+            # Keep draining so producers never block on a dead writer.
+            return
+        try:
+            if lines:
+                self._fh.write(("\n".join(lines) + "\n").encode("utf-8"))
+            if flush:
+                self._fh.flush()
+        except BaseException as e:
+            self._error = e
+
 
 class TraceReader:
     def __init__(self, path: str | Path):
         self._path = Path(path)
 
     def __iter__(self) -> Iterator[Dict[str, Any]]:
-        with self._path.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                yield json.loads(line)
+        with _open_source(self._path) as fh:
+            try:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    yield json.loads(line)
+            except EOFError:
+                # Compressed trace cut short (writer killed mid-run): keep what we have.
+                return
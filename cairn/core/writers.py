@@ -7,7 +7,8 @@ for waypoints and tracks, and KML 2.2 files for shapes (polygons).
 
 from __future__ import annotations
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 from pathlib import Path
@@ -20,6 +21,7 @@ from cairn.core.parser import ParsedFeature
 from cairn.core.mapper import map_icon, map_color
 from cairn.utils.utils import strip_html, natural_sort_key, sanitize_name_for_onx
 from cairn.core.config import IconMappingConfig, get_icon_color
+from cairn.core.precision import FULL_PRECISION, CoordinatePrecision
 from cairn.core.color_mapper import (
     ColorMapper,
     pattern_to_style,
@@ -62,6 +64,8 @@ def _agent_ndjson_log(payload: dict) -> None:
 # OnX import max GPX size is 4MB. Use a slightly lower default to avoid edge cases.
 DEFAULT_MAX_GPX_BYTES = int(math.floor(3.75 * 1024 * 1024))
 
+_GPX_OPEN_TAG = '<gpx xmlns="http://www.topografix.com/GPX/1/1" xmlns:onx="https://wwww.onxmaps.com/" version="1.1" creator="Cairn - CalTopo to OnX Migration Tool">'
+
 # Global change tracker for name sanitization
 # Format: {feature_type: [(original_name, sanitized_name), ...]}
 _name_changes: dict[str, list[tuple[str, str]]] = {"waypoints": [], "tracks": []}
@@ -84,6 +88,30 @@ def track_name_change(feature_type: str, original: str, sanitized: str) -> None:
         _name_changes[feature_type].append((original, sanitized))
 
 
+@contextmanager
+def capture_name_changes() -> Iterator[dict[str, list[tuple[str, str]]]]:
+    """
+    Record name changes made inside the block into a fresh per-job log.
+
+    The global tracker is restored on exit; callers fold the yielded log back
+    in with `merge_name_changes` (in job order, so parallel exports report the
+    same changes as sequential ones).
+    """
+    global _name_changes
+    outer = _name_changes
+    _name_changes = {"waypoints": [], "tracks": []}
+    try:
+        yield _name_changes
+    finally:
+        _name_changes = outer
+
+
+def merge_name_changes(changes: dict[str, list[tuple[str, str]]]) -> None:
+    """Append a per-job log (see `capture_name_changes`) to the global tracker."""
+    for feature_type, pairs in changes.items():
+        _name_changes.setdefault(feature_type, []).extend(pairs)
+
+
 def verify_gpx_waypoint_order(gpx_path: Path, max_items: int = 20) -> List[str]:
     """
     Read back waypoint order from a GPX file to verify it matches expected order.
@@ -303,6 +331,112 @@ def _write_gpx_parts(
     return written
 
 
+class _XmlPartWriter:
+    """
+    Stream XML item blocks (GPX <wpt>/<trk>, KML <Placemark>) straight to disk,
+    splitting into parts by byte size.
+
+    Each block is joined and UTF-8 encoded exactly once; the running byte count
+    of the open part decides when to roll over, using the same packing rule as
+    `_split_gpx_lines_by_bytes`. Output bytes match sep.join(header + items +
+    [footer]) per part.
+
+    The first part is written to `output_path`. If a second part is needed, the
+    first is renamed to `{stem}_1{suffix}` and later parts follow as `_2`, `_3`...
+    With `max_bytes=None` everything goes to a single file.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_path: Path,
+        header_lines: List[str],
+        footer_line: str,
+        max_bytes: Optional[int],
+        sep: str = "\n",
+        label: str = "GPX",
+    ) -> None:
+        self._output_path = output_path
+        self._sep = sep
+        self._label = label
+        self._header = sep.join(header_lines).encode("utf-8")
+        self._footer = (sep + (footer_line or "")).encode("utf-8")
+        self._max_bytes = max_bytes
+        self._paths: List[Path] = []
+        self._sizes: List[int] = []
+        self._counts: List[int] = []
+        self._fh = None
+        self._cur_size = 0
+        self._cur_items = 0
+
+        if max_bytes is not None:
+            header_footer_total = len(self._header) + len(self._footer)
+            if header_footer_total > max_bytes:
+                logger.warning(
+                    f"{label} header/footer alone exceeds max_bytes={max_bytes} ({header_footer_total} bytes). "
+                    f"Proceeding anyway."
+                )
+        self._open_part()
+
+    def _part_path(self, index: int) -> Path:
+        p = self._output_path
+        return p.with_name(f"{p.stem}_{index}{p.suffix}")
+
+    def _open_part(self) -> None:
+        n = len(self._paths) + 1
+        if n == 2:
+            # Splitting after all: the first part moves to its numbered name.
+            first = self._part_path(1)
+            self._paths[0].replace(first)
+            self._paths[0] = first
+        path = self._output_path if n == 1 else self._part_path(n)
+        self._fh = open(path, "wb")
+        self._fh.write(self._header)
+        self._paths.append(path)
+        self._cur_size = len(self._header)
+        self._cur_items = 0
+
+    def _close_part(self) -> None:
+        self._fh.write(self._footer)
+        self._fh.close()
+        self._fh = None
+        self._sizes.append(self._cur_size + len(self._footer))
+        self._counts.append(self._cur_items)
+
+    def add(self, block: List[str]) -> None:
+        """Append one item (a list of lines), rolling over first if needed."""
+        if not block:
+            return
+        sep = self._sep
+        data = (sep + sep.join(block)).encode("utf-8")
+        if self._max_bytes is not None:
+            candidate_total = self._cur_size + len(data) + len(self._footer)
+            if candidate_total > self._max_bytes and self._cur_items > 0:
+                self._close_part()
+                self._open_part()
+                candidate_total = self._cur_size + len(data) + len(self._footer)
+            if candidate_total > self._max_bytes:
+                logger.warning(
+                    f"A single {self._label} item exceeds max_bytes={self._max_bytes} ({candidate_total} bytes). "
+                    f"Writing it as a single-part file anyway."
+                )
+        self._fh.write(data)
+        self._cur_size += len(data)
+        self._cur_items += 1
+
+    def close(self) -> List[tuple[Path, int, int]]:
+        """Finish the open part and return (path, size_bytes, item_count) per part."""
+        if self._fh is not None:
+            self._close_part()
+        return list(zip(self._paths, self._sizes, self._counts))
+
+    def abort(self) -> None:
+        """Close the open part without a footer (used when writing fails)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
 def write_gpx_waypoints_maybe_split(
     features: List[ParsedFeature],
     output_path: Path,
@@ -313,10 +447,11 @@ def write_gpx_waypoints_maybe_split(
     config: Optional[IconMappingConfig] = None,
     split: bool = True,
     max_bytes: int = DEFAULT_MAX_GPX_BYTES,
+    precision: CoordinatePrecision = FULL_PRECISION,
 ) -> List[tuple[Path, int, int]]:
     """
     Write waypoints to GPX, automatically splitting into multiple files if the output
-    would exceed max_bytes. Preserves order.
+    would exceed max_bytes. Preserves order. `precision` controls lat/lon decimals.
 
     Returns list of (path, size_bytes, written_waypoint_count) for manifest.
     """
@@ -328,7 +463,7 @@ def write_gpx_waypoints_maybe_split(
 
     header_lines = [
         '<?xml version="1.0" encoding="UTF-8"?>',
-        '<gpx xmlns="http://www.topografix.com/GPX/1/1" xmlns:onx="https://wwww.onxmaps.com/" version="1.1" creator="Cairn - CalTopo to OnX Migration Tool">',
+        _GPX_OPEN_TAG,
         "  <metadata>",
         f"    <name>{escape(folder_name)}</name>",
         "  </metadata>",
@@ -351,9 +486,69 @@ def write_gpx_waypoints_maybe_split(
     )
     # endregion
 
-    item_blocks: List[List[str]] = []
+    writer = _XmlPartWriter(
+        output_path=output_path,
+        header_lines=header_lines,
+        footer_line=footer_line,
+        max_bytes=max_bytes if split else None,
+    )
+    try:
+        _stream_gpx_waypoint_blocks(
+            writer,
+            features,
+            add_timestamps=add_timestamps,
+            config=config,
+            precision=precision,
+        )
+    except BaseException:
+        writer.abort()
+        raise
+    out = writer.close()
+    written_count = sum(c for (_p, _s, c) in out)
+
+    # region agent log
+    _agent_ndjson_log(
+        {
+            "hypothesisId": "E",
+            "location": "cairn/core/writers.py:write_gpx_waypoints_maybe_split",
+            "message": (
+                "Waypoints GPX written (no split)"
+                if not split
+                else "Waypoints GPX written (single part)"
+                if len(out) == 1
+                else "Waypoints GPX written (split parts)"
+            ),
+            "data": {
+                "base_output_path": str(output_path),
+                "parts": [
+                    {"path": str(p), "size_bytes": int(s), "wpt_count": int(c)}
+                    for (p, s, c) in out
+                ],
+                "total_written_count": written_count,
+                "max_bytes": int(max_bytes),
+            },
+        }
+    )
+    # endregion
+    return out
+
+
+def _stream_gpx_waypoint_blocks(
+    writer: _XmlPartWriter,
+    features: List[ParsedFeature],
+    *,
+    add_timestamps: bool,
+    config: Optional[IconMappingConfig],
+    precision: CoordinatePrecision,
+) -> None:
+    """Render each valid waypoint feature as a <wpt> block and hand it to `writer`."""
+    from xml.sax.saxutils import escape
+
+    fmt_coord = precision.format_coord
+    # Quantize marker colors to the waypoint palette in one pass.
+    marker_colors = ColorMapper.map_waypoint_colors(f.color or "" for f in features)
     written_count = 0
-    for feature in features:
+    for feature, marker_color in zip(features, marker_colors):
         if not feature.coordinates or len(feature.coordinates) < 2:
             continue
 
@@ -386,7 +581,7 @@ def write_gpx_waypoints_maybe_split(
 
         # Waypoint color policy (unchanged)
         if feature.color:
-            onx_color = ColorMapper.map_waypoint_color(feature.color)
+            onx_color = marker_color
         else:
             onx_color = get_icon_color(
                 mapped_icon,
@@ -431,7 +626,7 @@ def write_gpx_waypoints_maybe_split(
         )
 
         block: List[str] = []
-        block.append(f'  <wpt lat="{lat}" lon="{lon}">')
+        block.append(f'  <wpt lat="{fmt_coord(lat)}" lon="{fmt_coord(lon)}">')
         block.append(f"    <name>{formatted_name}</name>")
         if add_timestamps:
             timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -456,98 +651,15 @@ def write_gpx_waypoints_maybe_split(
                             f"<onx:icon>{mapped_icon}</onx:icon>",
                             f"<onx:color>{onx_color}</onx:color>",
                         ],
-                        "xmlns_decl": header_lines[1],
+                        "xmlns_decl": _GPX_OPEN_TAG,
                     },
                 }
             )
         # endregion
 
-        item_blocks.append(block)
+        writer.add(block)
         written_count += 1
 
-    # If splitting disabled, keep legacy single-file behavior
-    if not split:
-        payload = (
-            header_lines + [ln for blk in item_blocks for ln in blk] + [footer_line]
-        )
-        output_path.write_text("\n".join(payload), encoding="utf-8")
-        # region agent log
-        _agent_ndjson_log(
-            {
-                "hypothesisId": "E",
-                "location": "cairn/core/writers.py:write_gpx_waypoints_maybe_split",
-                "message": "Waypoints GPX written (no split)",
-                "data": {
-                    "output_path": str(output_path),
-                    "size_bytes": int(output_path.stat().st_size),
-                    "written_count": written_count,
-                },
-            }
-        )
-        # endregion
-        return [(output_path, output_path.stat().st_size, written_count)]
-
-    # First check: would a single file exceed threshold?
-    full_payload = (
-        header_lines + [ln for blk in item_blocks for ln in blk] + [footer_line]
-    )
-    if _utf8_joined_size(full_payload) <= max_bytes:
-        output_path.write_text("\n".join(full_payload), encoding="utf-8")
-        # region agent log
-        _agent_ndjson_log(
-            {
-                "hypothesisId": "E",
-                "location": "cairn/core/writers.py:write_gpx_waypoints_maybe_split",
-                "message": "Waypoints GPX written (single part)",
-                "data": {
-                    "output_path": str(output_path),
-                    "size_bytes": int(output_path.stat().st_size),
-                    "written_count": written_count,
-                    "max_bytes": int(max_bytes),
-                },
-            }
-        )
-        # endregion
-        return [(output_path, output_path.stat().st_size, written_count)]
-
-    parts = _split_gpx_lines_by_bytes(
-        header_lines=header_lines,
-        item_blocks=item_blocks,
-        footer_line=footer_line,
-        max_bytes=max_bytes,
-    )
-    written = _write_gpx_parts(parts=parts, output_path=output_path)
-
-    # Distribute counts across parts based on item_blocks packing.
-    # We approximate by re-parsing: count <wpt> occurrences per part.
-    out: List[tuple[Path, int, int]] = []
-    for pth, sz in written:
-        try:
-            txt = pth.read_text(encoding="utf-8")
-            cnt = txt.count("<wpt ")
-        except Exception:
-            cnt = 0
-        out.append((pth, sz, cnt))
-    # region agent log
-    _agent_ndjson_log(
-        {
-            "hypothesisId": "E",
-            "location": "cairn/core/writers.py:write_gpx_waypoints_maybe_split",
-            "message": "Waypoints GPX written (split parts)",
-            "data": {
-                "base_output_path": str(output_path),
-                "parts": [
-                    {"path": str(p), "size_bytes": int(s), "wpt_count": int(c)}
-                    for (p, s, c) in out
-                ],
-                "total_written_count": written_count,
-                "max_bytes": int(max_bytes),
-            },
-        }
-    )
-    # endregion
-    return out
-
 
 def write_gpx_tracks_maybe_split(
     features: List[ParsedFeature],
@@ -557,10 +669,11 @@ def write_gpx_tracks_maybe_split(
     sort: bool = True,
     split: bool = True,
     max_bytes: int = DEFAULT_MAX_GPX_BYTES,
+    precision: CoordinatePrecision = FULL_PRECISION,
 ) -> List[tuple[Path, int, int]]:
     """
     Write tracks to GPX, automatically splitting into multiple files if the output
-    would exceed max_bytes. Preserves order.
+    would exceed max_bytes. Preserves order. `precision` controls lat/lon/ele decimals.
 
     Returns list of (path, size_bytes, written_track_count) for manifest.
     """
@@ -571,7 +684,7 @@ def write_gpx_tracks_maybe_split(
 
     header_lines = [
         '<?xml version="1.0" encoding="UTF-8"?>',
-        '<gpx xmlns="http://www.topografix.com/GPX/1/1" xmlns:onx="https://wwww.onxmaps.com/" version="1.1" creator="Cairn - CalTopo to OnX Migration Tool">',
+        _GPX_OPEN_TAG,
         "  <metadata>",
         f"    <name>{escape(folder_name)}</name>",
         "  </metadata>",
@@ -594,10 +707,35 @@ def write_gpx_tracks_maybe_split(
     )
     # endregion
 
-    item_blocks: List[List[str]] = []
-    written_count = 0
+    writer = _XmlPartWriter(
+        output_path=output_path,
+        header_lines=header_lines,
+        footer_line=footer_line,
+        max_bytes=max_bytes if split else None,
+    )
+    try:
+        _stream_gpx_track_blocks(writer, features, precision)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
 
-    for feature in features:
+def _stream_gpx_track_blocks(
+    writer: _XmlPartWriter,
+    features: List[ParsedFeature],
+    precision: CoordinatePrecision,
+) -> None:
+    """Render each track feature with coordinates as a <trk> block and hand it to `writer`."""
+    from xml.sax.saxutils import escape
+
+    fmt_coord = precision.format_coord
+    fmt_ele = precision.format_ele
+
+    # Map CalTopo stroke colors to the closest OnX colors in one pass.
+    track_colors = ColorMapper.map_track_colors(f.stroke or "" for f in features)
+    written_count = 0
+    for feature, mapped_color in zip(features, track_colors):
         if not feature.coordinates:
             continue
 
@@ -605,11 +743,7 @@ def write_gpx_tracks_maybe_split(
         if was_changed:
             track_name_change("tracks", feature.title, sanitized_track_name)
 
-        onx_color = (
-            ColorMapper.transform_color(feature.stroke)
-            if feature.stroke
-            else ColorMapper.DEFAULT_COLOR
-        )
+        onx_color = mapped_color if feature.stroke else ColorMapper.DEFAULT_COLOR
         onx_style = pattern_to_style(feature.pattern)
         onx_weight = stroke_width_to_weight(feature.stroke_width)
 
@@ -664,49 +798,19 @@ def write_gpx_tracks_maybe_split(
         for coord in feature.coordinates:
             if len(coord) >= 2:
                 lat, lon = coord[1], coord[0]
-                block.append(f'      <trkpt lat="{lat}" lon="{lon}">')
+                block.append(
+                    f'      <trkpt lat="{fmt_coord(lat)}" lon="{fmt_coord(lon)}">'
+                )
                 if len(coord) > 2:
-                    block.append(f"        <ele>{coord[2]}</ele>")
+                    block.append(f"        <ele>{fmt_ele(coord[2])}</ele>")
                 block.append("      </trkpt>")
 
         block.append("    </trkseg>")
         block.append("  </trk>")
 
-        item_blocks.append(block)
+        writer.add(block)
         written_count += 1
 
-    if not split:
-        payload = (
-            header_lines + [ln for blk in item_blocks for ln in blk] + [footer_line]
-        )
-        output_path.write_text("\n".join(payload), encoding="utf-8")
-        return [(output_path, output_path.stat().st_size, written_count)]
-
-    full_payload = (
-        header_lines + [ln for blk in item_blocks for ln in blk] + [footer_line]
-    )
-    if _utf8_joined_size(full_payload) <= max_bytes:
-        output_path.write_text("\n".join(full_payload), encoding="utf-8")
-        return [(output_path, output_path.stat().st_size, written_count)]
-
-    parts = _split_gpx_lines_by_bytes(
-        header_lines=header_lines,
-        item_blocks=item_blocks,
-        footer_line=footer_line,
-        max_bytes=max_bytes,
-    )
-    written = _write_gpx_parts(parts=parts, output_path=output_path)
-
-    out: List[tuple[Path, int, int]] = []
-    for pth, sz in written:
-        try:
-            txt = pth.read_text(encoding="utf-8")
-            cnt = txt.count("<trk>")
-        except Exception:
-            cnt = 0
-        out.append((pth, sz, cnt))
-    return out
-
 
 def verify_sanitization_preserves_sort_order(
     original_names: List[str], sanitized_names: List[str]
@@ -751,6 +855,7 @@ def write_gpx_waypoints(
     sort: bool = True,
     add_timestamps: bool = False,
     config: Optional[IconMappingConfig] = None,
+    precision: CoordinatePrecision = FULL_PRECISION,
 ) -> int:
     """
     Write waypoints to a GPX file with OnX namespace extensions.
@@ -761,6 +866,7 @@ def write_gpx_waypoints(
         folder_name: Name for the GPX metadata
         sort: If True (default), sort features using natural sort order
         add_timestamps: If True, add <time> elements to waypoints (for testing OnX sorting)
+        precision: Decimal places policy for lat/lon
 
     Returns:
         File size in bytes
@@ -782,14 +888,17 @@ def write_gpx_waypoints(
     # Build GPX manually to ensure proper namespace handling
     lines = [
         '<?xml version="1.0" encoding="UTF-8"?>',
-        '<gpx xmlns="http://www.topografix.com/GPX/1/1" xmlns:onx="https://wwww.onxmaps.com/" version="1.1" creator="Cairn - CalTopo to OnX Migration Tool">',
+        _GPX_OPEN_TAG,
         "  <metadata>",
         f"    <name>{folder_name}</name>",
         "  </metadata>",
     ]
 
+    # Quantize marker colors to the waypoint palette in one pass.
+    marker_colors = ColorMapper.map_waypoint_colors(f.color or "" for f in features)
+
     # Process waypoints
-    for feature in features:
+    for feature, marker_color in zip(features, marker_colors):
         if not feature.coordinates or len(feature.coordinates) < 2:
             continue
 
@@ -828,7 +937,9 @@ def write_gpx_waypoints(
 
         formatted_name = escape(formatted_name)
 
-        lines.append(f'  <wpt lat="{lat}" lon="{lon}">')
+        lines.append(
+            f'  <wpt lat="{precision.format_coord(lat)}" lon="{precision.format_coord(lon)}">'
+        )
         lines.append(f"    <name>{formatted_name}</name>")
 
         # Add timestamp if requested (for testing OnX sorting behavior)
@@ -845,7 +956,7 @@ def write_gpx_waypoints(
         #   OnX's official 10 waypoint colors (OnX ignores unsupported values).
         # - Otherwise, fall back to a default color per icon type.
         if feature.color:
-            onx_color = ColorMapper.map_waypoint_color(feature.color)
+            onx_color = marker_color
         else:
             onx_color = get_icon_color(
                 mapped_icon,
@@ -913,6 +1024,7 @@ def write_gpx_tracks(
     output_path: Path,
     folder_name: str,
     sort: bool = True,
+    precision: CoordinatePrecision = FULL_PRECISION,
 ) -> int:
     """
     Write tracks to a GPX file with OnX namespace extensions for color, style, and weight.
@@ -922,6 +1034,7 @@ def write_gpx_tracks(
         output_path: Path to write the GPX file
         folder_name: Name for the GPX metadata
         sort: If True (default), sort and reverse features for OnX display order
+        precision: Decimal places policy for lat/lon/elevation
 
     Returns:
         File size in bytes
@@ -938,14 +1051,17 @@ def write_gpx_tracks(
     # Build GPX manually with OnX namespace
     lines = [
         '<?xml version="1.0" encoding="UTF-8"?>',
-        '<gpx xmlns="http://www.topografix.com/GPX/1/1" xmlns:onx="https://wwww.onxmaps.com/" version="1.1" creator="Cairn - CalTopo to OnX Migration Tool">',
+        _GPX_OPEN_TAG,
         "  <metadata>",
         f"    <name>{escape(folder_name)}</name>",
         "  </metadata>",
     ]
 
+    # Map CalTopo stroke colors to the closest OnX colors in one pass.
+    track_colors = ColorMapper.map_track_colors(f.stroke or "" for f in features)
+
     # Process tracks
-    for feature in features:
+    for feature, mapped_color in zip(features, track_colors):
         if not feature.coordinates:
             continue
 
@@ -957,12 +1073,7 @@ def write_gpx_tracks(
         lines.append("  <trk>")
         lines.append(f"    <name>{escape(sanitized_track_name)}</name>")
 
-        # Map CalTopo stroke color to closest OnX color
-        onx_color = (
-            ColorMapper.transform_color(feature.stroke)
-            if feature.stroke
-            else ColorMapper.DEFAULT_COLOR
-        )
+        onx_color = mapped_color if feature.stroke else ColorMapper.DEFAULT_COLOR
         onx_style = pattern_to_style(feature.pattern)
         onx_weight = stroke_width_to_weight(feature.stroke_width)
 
@@ -999,11 +1110,13 @@ def write_gpx_tracks(
         for coord in feature.coordinates:
             if len(coord) >= 2:
                 lat, lon = coord[1], coord[0]
-                lines.append(f'      <trkpt lat="{lat}" lon="{lon}">')
+                lines.append(
+                    f'      <trkpt lat="{precision.format_coord(lat)}" lon="{precision.format_coord(lon)}">'
+                )
 
                 # Add elevation if present
                 if len(coord) > 2:
-                    lines.append(f"        <ele>{coord[2]}</ele>")
+                    lines.append(f"        <ele>{precision.format_ele(coord[2])}</ele>")
 
                 lines.append("      </trkpt>")
 
@@ -1018,85 +1131,162 @@ def write_gpx_tracks(
     return output_path.stat().st_size
 
 
-def write_kml_shapes(
-    features: List[ParsedFeature], output_path: Path, folder_name: str
-) -> int:
+# Matches the declaration the previous minidom-based writer produced.
+_KML_XML_DECL = '<?xml version="1.0" ?>'
+
+
+def _kml_text_element(pad: str, tag: str, text: Optional[str]) -> str:
     """
-    Write shapes (polygons) to a KML file.
+    One-line `<tag>text</tag>` with XML escaping (`<tag/>` when empty).
+
+    Line endings are normalized the way an XML parser would, so the output is
+    identical to the old ElementTree -> minidom round-trip.
+    """
+    from xml.sax.saxutils import escape
+
+    if not text:
+        return f"{pad}<{tag}/>"
+    text = str(text).replace("\r\n", "\n").replace("\r", "\n")
+    text = escape(text, {'"': "&quot;"})
+    return f"{pad}<{tag}>{text}</{tag}>"
+
+
+def _kml_placemark_lines(
+    feature: ParsedFeature, indent: bool, precision: CoordinatePrecision
+) -> List[str]:
+    """Render one shape feature as the lines of a KML <Placemark> (Document child)."""
+
+    def pad(depth: int) -> str:
+        return "  " * depth if indent else ""
+
+    lines = [f"{pad(2)}<Placemark>", _kml_text_element(pad(3), "name", feature.title)]
+    if feature.description:
+        lines.append(
+            _kml_text_element(pad(3), "description", strip_html(feature.description))
+        )
+
+    # Convert CalTopo hex color to KML format; fill is 50% opacity.
+    color_value = map_color(feature.color)
+    lines += [
+        f"{pad(3)}<Style>",
+        f"{pad(4)}<LineStyle>",
+        _kml_text_element(pad(5), "color", color_value),
+        f"{pad(5)}<width>2</width>",
+        f"{pad(4)}</LineStyle>",
+        f"{pad(4)}<PolyStyle>",
+        _kml_text_element(pad(5), "color", "7f" + color_value[2:]),
+        f"{pad(4)}</PolyStyle>",
+        f"{pad(3)}</Style>",
+    ]
+
+    # Format coordinates (KML format: lon,lat,elevation)
+    coords = (
+        feature.coordinates[0]
+        if isinstance(feature.coordinates[0][0], list)
+        else feature.coordinates
+    )
+    fmt_coord = precision.format_coord
+    fmt_ele = precision.format_ele
+    coord_text = " ".join(
+        f"{fmt_coord(coord[0])},{fmt_coord(coord[1])},"
+        f"{fmt_ele(coord[2]) if len(coord) > 2 else 0}"
+        for coord in coords
+        if len(coord) >= 2
+    )
+    lines += [
+        f"{pad(3)}<Polygon>",
+        f"{pad(4)}<outerBoundaryIs>",
+        f"{pad(5)}<LinearRing>",
+        _kml_text_element(pad(6), "coordinates", coord_text),
+        f"{pad(5)}</LinearRing>",
+        f"{pad(4)}</outerBoundaryIs>",
+        f"{pad(3)}</Polygon>",
+        f"{pad(2)}</Placemark>",
+    ]
+    return lines
+
+
+def write_kml_shapes_maybe_split(
+    features: List[ParsedFeature],
+    output_path: Path,
+    folder_name: str,
+    *,
+    split: bool = True,
+    max_bytes: int = DEFAULT_MAX_GPX_BYTES,
+    indent: bool = True,
+    precision: CoordinatePrecision = FULL_PRECISION,
+) -> List[tuple[Path, int, int]]:
+    """
+    Write shapes (polygons) to KML, automatically splitting into multiple files if
+    the output would exceed max_bytes. Preserves order.
+
+    Placemarks are streamed to disk one at a time (see `_XmlPartWriter`); part
+    naming and the size budget work exactly like the GPX writers.
 
     Args:
         features: List of shape features to write
         output_path: Path to write the KML file
         folder_name: Name for the document
+        split: Split into numbered parts when max_bytes would be exceeded
+        max_bytes: Byte budget per output file
+        indent: Pretty-print with two-space indentation (False writes compact XML)
+        precision: Decimal places policy for lon/lat/elevation
 
     Returns:
-        File size in bytes
+        List of (path, size_bytes, written_shape_count) for manifest.
     """
-    # Create KML root element
-    kml = ET.Element("kml")
-    kml.set("xmlns", "http://www.opengis.net/kml/2.2")
-
-    document = ET.SubElement(kml, "Document")
-
-    # Add document name
-    doc_name = ET.SubElement(document, "name")
-    doc_name.text = folder_name
-
-    # Process shapes
-    for feature in features:
-        if not feature.coordinates:
-            continue
+    nl = "\n" if indent else ""
+    writer = _XmlPartWriter(
+        output_path=output_path,
+        header_lines=[
+            _KML_XML_DECL + ("" if indent else "\n"),
+            '<kml xmlns="http://www.opengis.net/kml/2.2">',
+            ("  " if indent else "") + "<Document>",
+            _kml_text_element("    " if indent else "", "name", folder_name),
+        ],
+        footer_line=("  " if indent else "") + "</Document>" + nl + "</kml>\n",
+        max_bytes=max_bytes if split else None,
+        sep=nl,
+        label="KML",
+    )
+    try:
+        for feature in features:
+            if not feature.coordinates:
+                continue
+            writer.add(_kml_placemark_lines(feature, indent, precision))
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
 
-        placemark = ET.SubElement(document, "Placemark")
-
-        # Add name
-        name_elem = ET.SubElement(placemark, "name")
-        name_elem.text = feature.title
-
-        # Add description if present
-        if feature.description:
-            desc = ET.SubElement(placemark, "description")
-            desc.text = strip_html(feature.description)
-
-        # Add style
-        style = ET.SubElement(placemark, "Style")
-        line_style = ET.SubElement(style, "LineStyle")
-        line_color = ET.SubElement(line_style, "color")
-
-        # Convert CalTopo hex color to KML format
-        line_color.text = map_color(feature.color)
-        line_width = ET.SubElement(line_style, "width")
-        line_width.text = "2"
-
-        poly_style = ET.SubElement(style, "PolyStyle")
-        poly_color = ET.SubElement(poly_style, "color")
-        # Make fill semi-transparent
-        color_value = map_color(feature.color)
-        poly_color.text = "7f" + color_value[2:]  # 50% opacity
-
-        # Add polygon geometry
-        polygon = ET.SubElement(placemark, "Polygon")
-        outer_boundary = ET.SubElement(polygon, "outerBoundaryIs")
-        linear_ring = ET.SubElement(outer_boundary, "LinearRing")
-        coordinates_elem = ET.SubElement(linear_ring, "coordinates")
-
-        # Format coordinates (KML format: lon,lat,elevation)
-        coord_strings = []
-        coords = (
-            feature.coordinates[0]
-            if isinstance(feature.coordinates[0][0], list)
-            else feature.coordinates
-        )
-        for coord in coords:
-            if len(coord) >= 2:
-                lon, lat = coord[0], coord[1]
-                elevation = coord[2] if len(coord) > 2 else 0
-                coord_strings.append(f"{lon},{lat},{elevation}")
 
-        coordinates_elem.text = " ".join(coord_strings)
+def write_kml_shapes(
+    features: List[ParsedFeature],
+    output_path: Path,
+    folder_name: str,
+    *,
+    indent: bool = True,
+    precision: CoordinatePrecision = FULL_PRECISION,
+) -> int:
+    """
+    Write shapes (polygons) to a single KML file.
 
-    # Write to file
-    xml_string = prettify_xml(kml)
-    output_path.write_text(xml_string, encoding="utf-8")
+    Args:
+        features: List of shape features to write
+        output_path: Path to write the KML file
+        folder_name: Name for the document
+        indent: Pretty-print with two-space indentation (False writes compact XML)
+        precision: Decimal places policy for lon/lat/elevation
 
-    return output_path.stat().st_size
+    Returns:
+        File size in bytes
+    """
+    parts = write_kml_shapes_maybe_split(
+        features,
+        output_path,
+        folder_name,
+        split=False,
+        indent=indent,
+        precision=precision,
+    )
+    return parts[0][1]
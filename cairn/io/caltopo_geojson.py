@@ -14,13 +14,15 @@ Important notes:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 import hashlib
 import json
+import math
 
 from cairn.core.color_mapper import ColorMapper
-from cairn.core.icon_registry import IconRegistry
-from cairn.model import MapDocument, Shape, Track, Waypoint
+from cairn.core.icon_registry import IconRegistry, get_icon_registry
+from cairn.core.precision import FULL_PRECISION, CoordinatePrecision
+from cairn.model import MapDocument, Shape, Track, Waypoint, as_track_points
 
 
 _OnX_ICON_TO_CALTOPO_SYMBOL: Dict[str, str] = {
@@ -72,6 +74,7 @@ def _rgba_to_caltopo_hex(rgba: Optional[str]) -> Optional[str]:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+# Optional override (e.g. tests); otherwise the shared registry is used.
 _ICON_REGISTRY: Optional[IconRegistry] = None
 
 
@@ -82,27 +85,26 @@ def _get_icon_registry() -> Optional[IconRegistry]:
     This should never crash conversion; if the YAML cannot be loaded (e.g. in a
     stripped-down environment), we fall back to the legacy in-module mapping.
     """
-    global _ICON_REGISTRY
     if _ICON_REGISTRY is not None:
         return _ICON_REGISTRY
     try:
-        _ICON_REGISTRY = IconRegistry()
-        return _ICON_REGISTRY
+        return get_icon_registry()
     except Exception:
         return None
 
 
 def _map_onx_icon_to_caltopo_symbol(
     onx_icon: Optional[str],
+    reg: Optional[IconRegistry],
 ) -> Tuple[Optional[str], str]:
     """
     Returns:
       (mapped_symbol_or_None, mapping_source)
 
-    mapping_source is one of: 'direct', 'default', 'legacy'
+    mapping_source is one of: 'direct', 'default', 'legacy'.
+    `reg` is the registry from `_get_icon_registry()` (None: legacy mapping).
     """
     icon = (onx_icon or "").strip()
-    reg = _get_icon_registry()
     if reg is not None:
         symbol, src = reg.map_onx_icon_to_caltopo_symbol(icon or None)
         return (symbol or None), src
@@ -211,19 +213,141 @@ def _build_cairn_metadata(
     return meta
 
 
-def write_caltopo_geojson(
+class _RawCoordinates:
+    """
+    Geometry coordinates that are serialized straight from the model columns.
+
+    `rows()` yields positions (sequences of JSON number strings); with
+    `nesting=2` it yields rings, each an iterable of positions (GeoJSON Polygon).
+    """
+
+    __slots__ = ("rows", "nesting")
+
+    def __init__(self, rows: Any, nesting: int = 1) -> None:
+        self.rows = rows
+        self.nesting = nesting
+
+
+def _json_number(x: float) -> str:
+    # Same spelling as json.dumps (float repr, NaN/Infinity for non-finite).
+    if isinstance(x, float) and not math.isfinite(x):
+        if x != x:
+            return "NaN"
+        return "Infinity" if x > 0 else "-Infinity"
+    return repr(x)
+
+
+def _number_formatters(
+    precision: CoordinatePrecision,
+) -> Tuple[Callable[[float], str], Callable[[float], str]]:
+    """
+    (coordinate, elevation) formatters producing JSON number text under `precision`.
+    """
+
+    def wrap(fmt: Callable[[Any], str], decimals: Optional[int]) -> Callable[[float], str]:
+        if decimals is None:
+            return _json_number
+        return lambda x: fmt(x) if math.isfinite(x) else _json_number(x)
+
+    return (
+        wrap(precision.format_coord, precision.coord_decimals),
+        wrap(precision.format_ele, precision.ele_decimals),
+    )
+
+
+def _positions_json(positions: Iterable[Iterable[str]], depth: Optional[int]) -> str:
+    """
+    Encode a list of positions exactly as json.dumps would.
+
+    `depth` is the nesting level of the list inside the dumped object for
+    indent=2 output, or None for compact output.
+    """
+    if depth is None:
+        return (
+            "["
+            + ",".join("[" + ",".join(p) + "]" for p in positions)
+            + "]"
+        )
+    outer = "\n" + "  " * (depth + 1)
+    inner = "\n" + "  " * (depth + 2)
+    items = [
+        outer + "[" + inner + ("," + inner).join(p) + outer + "]"
+        for p in positions
+    ]
+    if not items:
+        return "[]"
+    return "[" + ",".join(items) + "\n" + "  " * depth + "]"
+
+
+def _raw_coordinates_json(coords: _RawCoordinates, depth: Optional[int]) -> str:
+    if coords.nesting == 1:
+        return _positions_json(coords.rows(), depth)
+    rings = [
+        _positions_json(ring, None if depth is None else depth + 1)
+        for ring in coords.rows()
+    ]
+    if not rings:
+        return "[]"
+    if depth is None:
+        return "[" + ",".join(rings) + "]"
+    outer = "\n" + "  " * (depth + 1)
+    return "[" + ",".join(outer + r for r in rings) + "\n" + "  " * depth + "]"
+
+
+# Stand-in for streamed coordinates while the rest of a feature goes through
+# json.dumps; NUL characters cannot come from parsed GPX/KML text.
+_COORDS_PLACEHOLDER = "\x00cairn:coordinates\x00"
+_COORDS_PLACEHOLDER_JSON = json.dumps(_COORDS_PLACEHOLDER)
+
+
+def _feature_json(feat: Dict[str, Any], *, compact: bool) -> str:
+    """
+    Serialize one feature as it appears inside the FeatureCollection.
+
+    Indented output is shifted two levels so it nests under "features".
+    """
+    geometry = feat.get("geometry")
+    raw = None
+    if geometry is not None and isinstance(geometry.get("coordinates"), _RawCoordinates):
+        raw = geometry["coordinates"]
+        geometry["coordinates"] = _COORDS_PLACEHOLDER
+    if compact:
+        text = json.dumps(feat, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(feat, ensure_ascii=False, indent=2)
+    if raw is not None:
+        geometry["coordinates"] = raw
+        # Feature -> geometry -> coordinates is nesting depth 2.
+        text = text.replace(
+            _COORDS_PLACEHOLDER_JSON,
+            _raw_coordinates_json(raw, None if compact else 2),
+            1,
+        )
+    if not compact:
+        text = text.replace("\n", "\n    ")
+    return text
+
+
+def _iter_caltopo_features(
     doc: MapDocument,
-    output_path: str | Path,
     *,
-    trace: Any = None,
-    description_mode: DescriptionMode = "notes_only",
-    route_color_strategy: RouteColorStrategy = "palette",
-) -> Path:
+    trace: Any,
+    description_mode: DescriptionMode,
+    route_color_strategy: RouteColorStrategy,
+    precision: CoordinatePrecision,
+) -> Iterator[Dict[str, Any]]:
     """
-    Write CalTopo GeoJSON to output_path.
+    Yield CalTopo features (folders first, then items) one at a time.
+
+    Track and polygon coordinates are `_RawCoordinates` views over the model
+    columns rather than materialized lists.
     """
-    out = Path(output_path)
-    features: List[Dict[str, Any]] = []
+    fmt_coord, fmt_ele = _number_formatters(precision)
+    # Resolved once per write: looking it up re-stats the mappings file.
+    reg = _get_icon_registry()
+    unknown_icon_policy = (
+        reg.policies.get("unknown_icon_handling") if reg is not None else None
+    )
 
     # Write folders first (CalTopo exports folders as geometry=null features).
     for folder in doc.folders:
@@ -231,17 +355,15 @@ def write_caltopo_geojson(
         # CalTopo doesn't need it, and it shows up empty because no item has folderId=OnX_import.
         if folder.id == "OnX_import":
             continue
-        features.append(
-            {
-                "type": "Feature",
-                "id": folder.id,
-                "geometry": None,
-                "properties": {
-                    "class": "Folder",
-                    "title": folder.name,
-                },
-            }
-        )
+        yield {
+            "type": "Feature",
+            "id": folder.id,
+            "geometry": None,
+            "properties": {
+                "class": "Folder",
+                "title": folder.name,
+            },
+        }
         if trace is not None:
             trace.emit(
                 {"event": "output.folder", "id": folder.id, "title": folder.name}
@@ -252,7 +374,9 @@ def write_caltopo_geojson(
         if isinstance(item, Waypoint):
             onx_color = item.style.OnX_color_rgba
             onx_icon = item.style.OnX_icon
-            mapped_symbol, mapping_source = _map_onx_icon_to_caltopo_symbol(onx_icon)
+            mapped_symbol, mapping_source = _map_onx_icon_to_caltopo_symbol(
+                onx_icon, reg
+            )
             symbol = item.style.caltopo_marker_symbol or mapped_symbol or "point"
 
             # User preference: if we can't determine an icon, use a dot but keep the provided color.
@@ -274,10 +398,6 @@ def write_caltopo_geojson(
 
             # If the icon is unknown (not mapped) and we're in notes-only mode, preserve the
             # original OnX icon name in the human-visible description for manual recovery.
-            reg = _get_icon_registry()
-            unknown_icon_policy = (
-                reg.policies.get("unknown_icon_handling") if reg is not None else None
-            )
             if (
                 description_mode == "notes_only"
                 and (onx_icon or "").strip()
@@ -303,7 +423,13 @@ def write_caltopo_geojson(
             feat = {
                 "type": "Feature",
                 "id": item.id,
-                "geometry": {"type": "Point", "coordinates": [item.lon, item.lat]},
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [
+                        precision.round_coord(item.lon),
+                        precision.round_coord(item.lat),
+                    ],
+                },
                 "properties": {
                     "class": "Marker",
                     "title": item.name,
@@ -314,7 +440,7 @@ def write_caltopo_geojson(
                     "cairn": cairn_meta,
                 },
             }
-            features.append(feat)
+            yield feat
             if trace is not None:
                 trace.emit(
                     {
@@ -367,14 +493,24 @@ def write_caltopo_geojson(
             )
 
             # Preserve elevation/time if present anywhere.
-            any_ele = any(p[2] is not None for p in item.points)
-            any_time = any(p[3] is not None for p in item.points)
-            coords: List[List[float]] = []
-            for lon, lat, ele, t_ms in item.points:
-                if any_ele or any_time:
-                    coords.append([lon, lat, float(ele or 0.0), float(t_ms or 0)])
-                else:
-                    coords.append([lon, lat])
+            # Missing ele/time are stored as 0 in the columns, matching the
+            # `ele or 0.0` / `t_ms or 0` padding used for 4D coordinates.
+            pts = as_track_points(item.points)
+            any_ele = pts.has_ele()
+            any_time = pts.has_time()
+            if any_ele or any_time:
+                coords = _RawCoordinates(
+                    lambda pts=pts: zip(
+                        map(fmt_coord, pts.lon),
+                        map(fmt_coord, pts.lat),
+                        map(fmt_ele, pts.ele),
+                        map(_json_number, map(float, pts.time)),
+                    )
+                )
+            else:
+                coords = _RawCoordinates(
+                    lambda pts=pts: zip(map(fmt_coord, pts.lon), map(fmt_coord, pts.lat))
+                )
 
             feat = {
                 "type": "Feature",
@@ -392,7 +528,7 @@ def write_caltopo_geojson(
             }
             if stroke is not None:
                 feat["properties"]["stroke"] = stroke
-            features.append(feat)
+            yield feat
             if trace is not None:
                 trace.emit(
                     {
@@ -404,7 +540,7 @@ def write_caltopo_geojson(
                         "stroke": stroke,
                         "stroke-width": stroke_width,
                         "pattern": pattern,
-                        "point_count": len(coords),
+                        "point_count": len(pts),
                         "coord_dim": 4 if (any_ele or any_time) else 2,
                     }
                 )
@@ -444,7 +580,13 @@ def write_caltopo_geojson(
             )
 
             # GeoJSON polygon: list of rings, each ring list of [lon,lat]
-            coords = [[[lon, lat] for (lon, lat) in ring] for ring in item.rings]
+            coords = _RawCoordinates(
+                lambda rings=item.rings: (
+                    ((fmt_coord(lon), fmt_coord(lat)) for (lon, lat) in ring)
+                    for ring in rings
+                ),
+                nesting=2,
+            )
             feat = {
                 "type": "Feature",
                 "id": item.id,
@@ -461,7 +603,7 @@ def write_caltopo_geojson(
             }
             if stroke is not None:
                 feat["properties"]["stroke"] = stroke
-            features.append(feat)
+            yield feat
             if trace is not None:
                 trace.emit(
                     {
@@ -473,8 +615,46 @@ def write_caltopo_geojson(
                     }
                 )
 
-    fc = {"type": "FeatureCollection", "features": features}
-    out.write_text(
-        json.dumps(fc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+
+def write_caltopo_geojson(
+    doc: MapDocument,
+    output_path: str | Path,
+    *,
+    trace: Any = None,
+    description_mode: DescriptionMode = "notes_only",
+    route_color_strategy: RouteColorStrategy = "palette",
+    compact: bool = False,
+    precision: CoordinatePrecision = FULL_PRECISION,
+) -> Path:
+    """
+    Write CalTopo GeoJSON to output_path.
+
+    The FeatureCollection is streamed one feature at a time, so peak memory is
+    a single serialized feature rather than the whole output. The default
+    output is indented by two spaces; `compact=True` writes minimal separators.
+    `precision` sets how many decimals are written for coordinates/elevation.
+    """
+    out = Path(output_path)
+    features = _iter_caltopo_features(
+        doc,
+        trace=trace,
+        description_mode=description_mode,
+        route_color_strategy=route_color_strategy,
+        precision=precision,
     )
+    with out.open("w", encoding="utf-8") as fh:
+        if compact:
+            fh.write('{"type":"FeatureCollection","features":[')
+            for n, feat in enumerate(features):
+                fh.write("," if n else "")
+                fh.write(_feature_json(feat, compact=True))
+            fh.write("]}\n")
+        else:
+            fh.write('{\n  "type": "FeatureCollection",\n  "features": [')
+            n = 0
+            for n, feat in enumerate(features, 1):
+                fh.write(",\n    " if n > 1 else "\n    ")
+                fh.write(_feature_json(feat, compact=False))
+            # json.dumps renders an empty list inline as [].
+            fh.write("\n  ]\n}\n" if n else "]\n}\n")
     return out
@@ -18,7 +18,7 @@ import uuid
 import xml.etree.ElementTree as ET
 
 from cairn.core.normalization import iso8601_to_epoch_ms, normalize_name
-from cairn.model import MapDocument, Style, Track, TrackPoint, Waypoint
+from cairn.model import MapDocument, Style, Track, TrackPoint, TrackPoints, Waypoint
 
 
 # OnX-exported GPX uses lowercase domain here (and commonly declares it as `xmlns:onx=...`).
@@ -120,13 +120,112 @@ def _get_onx_extension_text(elem: ET.Element, local_name: str) -> Optional[str]:
     return None
 
 
-def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
+_GPX_WPT = f"{{{_GPX_NS}}}wpt"
+_GPX_TRK = f"{{{_GPX_NS}}}trk"
+_GPX_RTE = f"{{{_GPX_NS}}}rte"
+_GPX_TRKSEG = f"{{{_GPX_NS}}}trkseg"
+_GPX_TRKPT = f"{{{_GPX_NS}}}trkpt"
+_GPX_RTEPT = f"{{{_GPX_NS}}}rtept"
+
+
+def _read_point(pt: ET.Element) -> Optional[TrackPoint]:
+    """
+    Convert a <trkpt>/<rtept> element into a TrackPoint, or None if invalid.
+    """
+    try:
+        plat = float(pt.attrib.get("lat"))
+        plon = float(pt.attrib.get("lon"))
+        # Skip invalid coordinates
+        if not (-90 <= plat <= 90) or not (-180 <= plon <= 180):
+            return None
+    except (ValueError, TypeError):
+        return None  # Skip invalid point
+
+    ele_elem = pt.find("gpx:ele", _NS)
+    try:
+        ele = float(ele_elem.text) if ele_elem is not None and ele_elem.text else None
+    except (ValueError, TypeError):
+        ele = None
+
+    time_elem = pt.find("gpx:time", _NS)
+    t_ms = (
+        iso8601_to_epoch_ms(time_elem.text)
+        if time_elem is not None and time_elem.text
+        else None
+    )
+    return (plon, plat, ele, t_ms)
+
+
+def _iter_gpx_features(p: Path):
+    """
+    Incrementally parse a GPX file, yielding `(element, TrackPoints)` for each
+    top-level <wpt>, <trk> and <rte> as soon as it closes.
+
+    Track/route points are converted (and their elements discarded) as each
+    <trkpt>/<rtept> closes, and finished top-level elements are detached from
+    the root, so memory stays bounded by a single feature's metadata rather
+    than the whole document tree. For <wpt>, `points` is always empty.
+
+    Raises:
+      ValueError: If the XML is malformed or the root element is not <gpx>
+    """
+    try:
+        context = ET.iterparse(str(p), events=("start", "end"))
+        stack: List[ET.Element] = []
+        points = TrackPoints()
+        for event, elem in context:
+            if event == "start":
+                if not stack:
+                    # Validate it's actually a GPX file before reading any further.
+                    if not (elem.tag.endswith("gpx") or "gpx" in elem.tag.lower()):
+                        raise ValueError(
+                            f"File does not appear to be a GPX file (root element: {elem.tag})\nFile: {p}"
+                        )
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            tag = elem.tag
+            if depth == 3 and tag == _GPX_TRKPT:
+                if stack[1].tag == _GPX_TRK and stack[2].tag == _GPX_TRKSEG:
+                    pt = _read_point(elem)
+                    if pt is not None:
+                        points.append(pt)
+                    stack[2].remove(elem)
+            elif depth == 2 and tag == _GPX_RTEPT:
+                if stack[1].tag == _GPX_RTE:
+                    pt = _read_point(elem)
+                    if pt is not None:
+                        points.append(pt)
+                    stack[1].remove(elem)
+            elif depth == 1:
+                if tag in (_GPX_WPT, _GPX_TRK, _GPX_RTE):
+                    yield elem, points
+                points = TrackPoints()
+                stack[0].remove(elem)
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid GPX file (XML parse error): {e}\nFile: {p}")
+    except (OSError, UnicodeError) as e:
+        raise ValueError(f"Failed to read GPX file: {e}\nFile: {p}")
+
+
+def read_onx_gpx(
+    path: str | Path, *, trace: Any = None, lean: bool = False
+) -> MapDocument:
     """
     Read an OnX GPX export.
 
+    The file is parsed incrementally (see `_iter_gpx_features`), so dense
+    multi-hundred-MB exports do not require holding the full XML tree.
+    Items and trace events are still ordered waypoints, tracks, then routes,
+    matching the historical whole-tree reader regardless of document order.
+
     Args:
       path: path to GPX
       trace: optional TraceWriter-like object with `emit(event: dict)` method
+      lean: skip keeping raw source duplicates (`extra["name_raw"/"desc_raw"]`
+        and `style.extra["desc_kv"]`); they only matter for trace/debug output
 
     Raises:
       ValueError: If the file is not a valid GPX file or is empty
@@ -137,21 +236,6 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
     if p.stat().st_size == 0:
         raise ValueError(f"GPX file is empty: {p}")
 
-    # Parse XML with error handling
-    try:
-        tree = ET.parse(p)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        raise ValueError(f"Invalid GPX file (XML parse error): {e}\nFile: {p}")
-    except Exception as e:
-        raise ValueError(f"Failed to read GPX file: {e}\nFile: {p}")
-
-    # Validate it's actually a GPX file
-    if not (root.tag.endswith("gpx") or "gpx" in root.tag.lower()):
-        raise ValueError(
-            f"File does not appear to be a GPX file (root element: {root.tag})\nFile: {p}"
-        )
-
     doc = MapDocument(metadata={"source": "OnX_gpx", "path": str(p)})
 
     # Default folder structure (value-add for CalTopo)
@@ -159,29 +243,40 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
     doc.ensure_folder("OnX_waypoints", "Waypoints", parent_id="OnX_import")
     doc.ensure_folder("OnX_tracks", "Tracks", parent_id="OnX_import")
 
-    # Waypoints
-    for idx, wpt in enumerate(root.findall("gpx:wpt", _NS)):
+    # Items go straight to per-kind lists (arrival order); trace events are only
+    # built and buffered when tracing, so untraced reads keep no per-item extras.
+    kinds = ("wpt", "trk", "rte")
+    items: Dict[str, List[Any]] = {kind: [] for kind in kinds}
+    seen: Dict[str, int] = {kind: 0 for kind in kinds}
+    events: Optional[Dict[str, List[dict]]] = (
+        {kind: [] for kind in kinds} if trace is not None else None
+    )
+
+    def read_waypoint(
+        wpt: ET.Element, *, idx: int, out_events: Optional[List[dict]]
+    ) -> Optional[Waypoint]:
         try:
             lat = float(wpt.attrib.get("lat"))
             lon = float(wpt.attrib.get("lon"))
         except (ValueError, TypeError) as e:
             # Skip waypoint with invalid coordinates but continue processing
-            if trace is not None:
-                trace.emit(
+            if out_events is not None:
+                out_events.append(
                     {
-                        "event": "input.wpt.error",
-                        "idx": idx,
-                        "error": f"Invalid coordinates: {e}",
+                    "event": "input.wpt.error",
+                    "idx": idx,
+                    "error": f"Invalid coordinates: {e}",
                         "lat_raw": wpt.attrib.get("lat"),
                         "lon_raw": wpt.attrib.get("lon"),
                     }
                 )
-            continue
+            return None
 
         # Validate coordinate ranges
         if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-            if trace is not None:
-                trace.emit(
+            # Continue processing but log the warning
+            if out_events is not None:
+                out_events.append(
                     {
                         "event": "input.wpt.warning",
                         "idx": idx,
@@ -190,8 +285,7 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
                         "lon": lon,
                     }
                 )
-            # Continue processing but log the warning
-            continue
+            return None
 
         name_elem = wpt.find("gpx:name", _NS)
         name_raw = name_elem.text if name_elem is not None and name_elem.text else ""
@@ -207,7 +301,8 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
         onx_id = kv.get("id")
 
         style = Style(OnX_icon=onx_icon, OnX_color_rgba=onx_color, OnX_id=onx_id)
-        style.extra["desc_kv"] = kv
+        if not lean:
+            style.extra["desc_kv"] = kv
 
         wp = Waypoint(
             id=onx_id or _stable_uuid_fallback(),
@@ -217,12 +312,10 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
             lat=lat,
             notes=normalize_name(notes) if notes else "",
             style=style,
-            extra={"name_raw": name_raw, "desc_raw": desc_raw},
+            extra={} if lean else {"name_raw": name_raw, "desc_raw": desc_raw},
         )
-        doc.add_item(wp)
-
-        if trace is not None:
-            trace.emit(
+        if out_events is not None:
+            out_events.append(
                 {
                     "event": "input.wpt",
                     "idx": idx,
@@ -233,11 +326,19 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
                     "OnX": {"id": onx_id, "icon": onx_icon, "color": onx_color},
                 }
             )
+        return wp
 
-    # Tracks
     def read_track_like(
-        track_elem: ET.Element, *, gpx_type: str, idx: int
+        track_elem: ET.Element,
+        points: TrackPoints,
+        *,
+        gpx_type: str,
+        idx: int,
+        out_events: Optional[List[dict]],
     ) -> Optional[Track]:
+        if not points:
+            return None
+
         name_elem = track_elem.find("gpx:name", _NS)
         name_raw = name_elem.text if name_elem is not None and name_elem.text else ""
         name = normalize_name(name_raw)
@@ -252,77 +353,14 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
         onx_weight = _get_onx_extension_text(ext, "weight") or kv.get("weight")
         onx_id = kv.get("id")
 
-        points: List[TrackPoint] = []
-
-        if gpx_type == "trk":
-            for seg in track_elem.findall("gpx:trkseg", _NS):
-                for pt in seg.findall("gpx:trkpt", _NS):
-                    try:
-                        plat = float(pt.attrib.get("lat"))
-                        plon = float(pt.attrib.get("lon"))
-                        # Skip invalid coordinates
-                        if not (-90 <= plat <= 90) or not (-180 <= plon <= 180):
-                            continue
-                    except (ValueError, TypeError):
-                        continue  # Skip invalid point
-
-                    ele_elem = pt.find("gpx:ele", _NS)
-                    try:
-                        ele = (
-                            float(ele_elem.text)
-                            if ele_elem is not None and ele_elem.text
-                            else None
-                        )
-                    except (ValueError, TypeError):
-                        ele = None
-
-                    time_elem = pt.find("gpx:time", _NS)
-                    t_ms = (
-                        iso8601_to_epoch_ms(time_elem.text)
-                        if time_elem is not None and time_elem.text
-                        else None
-                    )
-                    points.append((plon, plat, ele, t_ms))
-        else:
-            # Route: treat rtept as points (elevation often absent)
-            for pt in track_elem.findall("gpx:rtept", _NS):
-                try:
-                    plat = float(pt.attrib.get("lat"))
-                    plon = float(pt.attrib.get("lon"))
-                    # Skip invalid coordinates
-                    if not (-90 <= plat <= 90) or not (-180 <= plon <= 180):
-                        continue
-                except (ValueError, TypeError):
-                    continue  # Skip invalid point
-
-                ele_elem = pt.find("gpx:ele", _NS)
-                try:
-                    ele = (
-                        float(ele_elem.text)
-                        if ele_elem is not None and ele_elem.text
-                        else None
-                    )
-                except (ValueError, TypeError):
-                    ele = None
-
-                time_elem = pt.find("gpx:time", _NS)
-                t_ms = (
-                    iso8601_to_epoch_ms(time_elem.text)
-                    if time_elem is not None and time_elem.text
-                    else None
-                )
-                points.append((plon, plat, ele, t_ms))
-
-        if not points:
-            return None
-
         style = Style(
             OnX_color_rgba=onx_color,
             OnX_style=onx_style,
             OnX_weight=onx_weight,
             OnX_id=onx_id,
         )
-        style.extra["desc_kv"] = kv
+        if not lean:
+            style.extra["desc_kv"] = kv
         style.extra["gpx_type"] = gpx_type
 
         trk = Track(
@@ -332,11 +370,11 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
             points=points,
             notes=normalize_name(notes) if notes else "",
             style=style,
-            extra={"name_raw": name_raw, "desc_raw": desc_raw},
+            extra={} if lean else {"name_raw": name_raw, "desc_raw": desc_raw},
         )
 
-        if trace is not None:
-            trace.emit(
+        if out_events is not None:
+            out_events.append(
                 {
                     "event": "input.trk" if gpx_type == "trk" else "input.rte",
                     "idx": idx,
@@ -351,26 +389,39 @@ def read_onx_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:
                     },
                 }
             )
-
         return trk
 
-    trk_idx = 0
-    for trk in root.findall("gpx:trk", _NS):
-        t = read_track_like(trk, gpx_type="trk", idx=trk_idx)
-        if t is not None:
-            doc.add_item(t)
-        trk_idx += 1
+    for elem, points in _iter_gpx_features(p):
+        if elem.tag == _GPX_WPT:
+            kind = "wpt"
+        elif elem.tag == _GPX_TRK:
+            kind = "trk"
+        else:
+            kind = "rte"
+        idx = seen[kind]
+        seen[kind] = idx + 1
+        out_events = events[kind] if events is not None else None
+        if kind == "wpt":
+            item = read_waypoint(elem, idx=idx, out_events=out_events)
+        else:
+            item = read_track_like(
+                elem, points, gpx_type=kind, idx=idx, out_events=out_events
+            )
+        if item is not None:
+            items[kind].append(item)
 
-    rte_idx = 0
-    for rte in root.findall("gpx:rte", _NS):
-        t = read_track_like(rte, gpx_type="rte", idx=rte_idx)
-        if t is not None:
-            doc.add_item(t)
-        rte_idx += 1
+    for kind in kinds:
+        for item in items[kind]:
+            doc.add_item(item)
+        if events is not None:
+            for ev in events[kind]:
+                trace.emit(ev)
 
     return doc
 
 
 # Backward-compatible alias (old name with PascalCase)
-def read_OnX_gpx(path: str | Path, *, trace: Any = None) -> MapDocument:  # noqa: N802
-    return read_onx_gpx(path, trace=trace)
+def read_OnX_gpx(  # noqa: N802
+    path: str | Path, *, trace: Any = None, lean: bool = False
+) -> MapDocument:
+    return read_onx_gpx(path, trace=trace, lean=lean)
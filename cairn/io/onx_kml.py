@@ -13,12 +13,12 @@ Important observations (captured in docs):
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import uuid
 import xml.etree.ElementTree as ET
 
 from cairn.core.normalization import normalize_name
-from cairn.model import MapDocument, Shape, Style, Track, TrackPoint, Waypoint
+from cairn.model import MapDocument, RingPoints, Shape, Style, Track, TrackPoints, Waypoint
 
 
 _KML_NS = "http://www.opengis.net/kml/2.2"
@@ -35,17 +35,6 @@ def _text(elem: Optional[ET.Element]) -> str:
     return elem.text
 
 
-def _parse_extended_data(pm: ET.Element) -> Dict[str, str]:
-    kv: Dict[str, str] = {}
-    for d in pm.findall(".//kml:ExtendedData//kml:Data", _NS):
-        key = d.attrib.get("name")
-        if not key:
-            continue
-        val = _text(d.find("kml:value", _NS)).strip()
-        kv[key.strip().lower()] = val
-    return kv
-
-
 def _parse_kml_coords_list(text: str) -> List[Tuple[float, float, Optional[float]]]:
     """
     Parse KML coordinate lists with error handling.
@@ -75,13 +64,156 @@ def _parse_kml_coords_list(text: str) -> List[Tuple[float, float, Optional[float
     return pts
 
 
-def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
+_KML_PLACEMARK = f"{{{_KML_NS}}}Placemark"
+_KML_POINT = f"{{{_KML_NS}}}Point"
+_KML_LINESTRING = f"{{{_KML_NS}}}LineString"
+_KML_POLYGON = f"{{{_KML_NS}}}Polygon"
+_KML_OUTER = f"{{{_KML_NS}}}outerBoundaryIs"
+_KML_LINEARRING = f"{{{_KML_NS}}}LinearRing"
+_KML_COORDINATES = f"{{{_KML_NS}}}coordinates"
+_KML_EXTENDED_DATA = f"{{{_KML_NS}}}ExtendedData"
+_KML_DATA = f"{{{_KML_NS}}}Data"
+
+
+class _PlacemarkState:
+    """
+    Geometry and metadata captured from one Placemark's element stream.
+
+    Coordinate fields hold the text of the *first* matching <coordinates>
+    (None when absent), mirroring `find(".//kml:Point/kml:coordinates")` etc.
+    """
+
+    __slots__ = (
+        "idx",
+        "depth",
+        "name_raw",
+        "kv",
+        "has_point",
+        "has_line",
+        "has_polygon",
+        "point_coords",
+        "line_coords",
+        "outer_coords",
+    )
+
+    def __init__(self, idx: int, depth: int) -> None:
+        self.idx = idx
+        self.depth = depth
+        self.name_raw = ""
+        self.kv: Dict[str, str] = {}
+        self.has_point = False
+        self.has_line = False
+        self.has_polygon = False
+        self.point_coords: Optional[str] = None
+        self.line_coords: Optional[str] = None
+        self.outer_coords: Optional[str] = None
+
+
+def _iter_kml_placemarks(p: Path) -> Iterator[_PlacemarkState]:
+    """
+    Incrementally parse a KML file, yielding one `_PlacemarkState` per
+    <Placemark> as soon as it closes (indexed in document order).
+
+    Geometry type, coordinates and ExtendedData are recorded from start/end
+    events instead of per-placemark descendant searches. Closed placemarks,
+    and any element outside a placemark, are detached from their parent so
+    the tree never grows beyond the currently open placemark.
+
+    Raises:
+      ValueError: If the XML is malformed or the root element is not <kml>
+    """
+    stack: List[ET.Element] = []
+    open_pms: List[_PlacemarkState] = []
+    next_idx = 0
+    try:
+        for event, elem in ET.iterparse(str(p), events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if not stack:
+                    # Validate it's actually a KML file before reading any further.
+                    if not (tag.endswith("kml") or "kml" in tag.lower()):
+                        raise ValueError(
+                            f"File does not appear to be a KML file (root element: {tag})\nFile: {p}"
+                        )
+                stack.append(elem)
+                if tag == _KML_PLACEMARK:
+                    open_pms.append(_PlacemarkState(next_idx, len(stack) - 1))
+                    next_idx += 1
+                elif open_pms:
+                    if tag == _KML_POINT:
+                        for st in open_pms:
+                            st.has_point = True
+                    elif tag == _KML_LINESTRING:
+                        for st in open_pms:
+                            st.has_line = True
+                    elif tag == _KML_POLYGON:
+                        for st in open_pms:
+                            st.has_polygon = True
+                continue
+
+            stack.pop()
+
+            if tag == _KML_PLACEMARK:
+                st = open_pms.pop()
+                st.name_raw = _text(elem.find("kml:name", _NS))
+                yield st
+                if stack:
+                    stack[-1].remove(elem)
+                continue
+
+            if not open_pms:
+                if stack:
+                    stack[-1].remove(elem)
+                continue
+
+            if tag == _KML_COORDINATES and stack:
+                parent = stack[-1].tag
+                text = elem.text or ""
+                if parent == _KML_POINT:
+                    for st in open_pms:
+                        if st.point_coords is None:
+                            st.point_coords = text
+                elif parent == _KML_LINESTRING:
+                    for st in open_pms:
+                        if st.line_coords is None:
+                            st.line_coords = text
+                elif (
+                    parent == _KML_LINEARRING
+                    and len(stack) >= 3
+                    and stack[-2].tag == _KML_OUTER
+                    and stack[-3].tag == _KML_POLYGON
+                ):
+                    for st in open_pms:
+                        if st.outer_coords is None:
+                            st.outer_coords = text
+            elif tag == _KML_DATA:
+                key = elem.attrib.get("name")
+                if not key:
+                    continue
+                val = _text(elem.find("kml:value", _NS)).strip()
+                for st in open_pms:
+                    if any(e.tag == _KML_EXTENDED_DATA for e in stack[st.depth + 1 :]):
+                        st.kv[key.strip().lower()] = val
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid KML file (XML parse error): {e}\nFile: {p}")
+    except (OSError, UnicodeError) as e:
+        raise ValueError(f"Failed to read KML file: {e}\nFile: {p}")
+
+
+def read_onx_kml(
+    path: str | Path, *, trace: Any = None, lean: bool = False
+) -> MapDocument:
     """
     Read an OnX KML export.
 
+    Placemarks are converted as they are streamed (see `_iter_kml_placemarks`),
+    so deeply nested or very large KML does not need to be held in memory.
+
     Args:
       path: path to KML file
       trace: optional TraceWriter-like object with `emit(event: dict)` method
+      lean: skip keeping raw source duplicates (`extra["name_raw"]` and
+        `style.extra["extended_data"]`); they only matter for trace/debug output
 
     Raises:
       ValueError: If the file is not a valid KML file or is empty
@@ -92,44 +224,32 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
     if p.stat().st_size == 0:
         raise ValueError(f"KML file is empty: {p}")
 
-    # Parse XML with error handling
-    try:
-        root = ET.parse(p).getroot()
-    except ET.ParseError as e:
-        raise ValueError(f"Invalid KML file (XML parse error): {e}\nFile: {p}")
-    except Exception as e:
-        raise ValueError(f"Failed to read KML file: {e}\nFile: {p}")
-
-    # Validate it's actually a KML file
-    if not (root.tag.endswith("kml") or "kml" in root.tag.lower()):
-        raise ValueError(
-            f"File does not appear to be a KML file (root element: {root.tag})\nFile: {p}"
-        )
-
     doc = MapDocument(metadata={"source": "OnX_kml", "path": str(p)})
     doc.ensure_folder("OnX_import", "OnX Import")
     doc.ensure_folder("OnX_waypoints", "Waypoints", parent_id="OnX_import")
     doc.ensure_folder("OnX_tracks", "Tracks", parent_id="OnX_import")
     doc.ensure_folder("OnX_shapes", "Areas", parent_id="OnX_import")
 
-    placemarks = root.findall(".//kml:Placemark", _NS)
-    for idx, pm in enumerate(placemarks):
-        name_raw = _text(pm.find("kml:name", _NS))
+    for pm in _iter_kml_placemarks(p):
+        idx = pm.idx
+        name_raw = pm.name_raw
         name = normalize_name(name_raw)
 
-        kv = _parse_extended_data(pm)
+        kv = pm.kv
         onx_id = kv.get("id") or kv.get("OnX:id")
         onx_icon = kv.get("icon")
         onx_color = kv.get("color")
         notes = kv.get("notes", "")
 
         style = Style(OnX_id=onx_id, OnX_icon=onx_icon, OnX_color_rgba=onx_color)
-        style.extra["extended_data"] = dict(kv)
+        raw_extra: Dict[str, Any] = {}
+        if not lean:
+            style.extra["extended_data"] = dict(kv)
+            raw_extra["name_raw"] = name_raw
 
         # Geometry dispatch
-        if pm.find(".//kml:Point", _NS) is not None:
-            coord_text = _text(pm.find(".//kml:Point/kml:coordinates", _NS))
-            pts = _parse_kml_coords_list(coord_text)
+        if pm.has_point:
+            pts = _parse_kml_coords_list(pm.point_coords or "")
             if not pts:
                 continue
             lon, lat, _alt = pts[0]
@@ -141,7 +261,7 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
                 lat=lat,
                 notes=normalize_name(notes),
                 style=style,
-                extra={"name_raw": name_raw},
+                extra=dict(raw_extra),
             )
             doc.add_item(wp)
             if trace is not None:
@@ -157,14 +277,13 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
                 )
             continue
 
-        if pm.find(".//kml:LineString", _NS) is not None:
-            coord_text = _text(pm.find(".//kml:LineString/kml:coordinates", _NS))
-            pts = _parse_kml_coords_list(coord_text)
+        if pm.has_line:
+            pts = _parse_kml_coords_list(pm.line_coords or "")
             if not pts:
                 continue
-            points: List[TrackPoint] = [
-                (lon, lat, alt, None) for (lon, lat, alt) in pts
-            ]
+            points = TrackPoints()
+            for lon, lat, alt in pts:
+                points.add(lon, lat, alt)
             trk = Track(
                 id=onx_id or _uuid_fallback(),
                 folder_id="OnX_tracks",
@@ -172,7 +291,7 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
                 points=points,
                 notes=normalize_name(notes),
                 style=style,
-                extra={"name_raw": name_raw, "kml_geom": "LineString"},
+                extra={**raw_extra, "kml_geom": "LineString"},
             )
             doc.add_item(trk)
             if trace is not None:
@@ -189,18 +308,12 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
                 )
             continue
 
-        if pm.find(".//kml:Polygon", _NS) is not None:
+        if pm.has_polygon:
             # Prefer outer boundary ring.
-            outer = _text(
-                pm.find(
-                    ".//kml:Polygon/kml:outerBoundaryIs/kml:LinearRing/kml:coordinates",
-                    _NS,
-                )
-            )
-            ring_pts = _parse_kml_coords_list(outer)
+            ring_pts = _parse_kml_coords_list(pm.outer_coords or "")
             if not ring_pts:
                 continue
-            ring = [(lon, lat) for (lon, lat, _alt) in ring_pts]
+            ring = RingPoints((lon, lat) for (lon, lat, _alt) in ring_pts)
             shp = Shape(
                 id=onx_id or _uuid_fallback(),
                 folder_id="OnX_shapes",
@@ -208,7 +321,7 @@ def read_onx_kml(path: str | Path, *, trace: Any = None) -> MapDocument:
                 rings=[ring],
                 notes=normalize_name(notes),
                 style=style,
-                extra={"name_raw": name_raw, "kml_geom": "Polygon"},
+                extra={**raw_extra, "kml_geom": "Polygon"},
             )
             doc.add_item(shp)
             if trace is not None:
@@ -11,14 +11,39 @@ some fields. We preserve source-specific metadata in `Style` and `metadata`.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Tuple
+import sys
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 
 GeometryType = Literal["Point", "LineString", "Polygon"]
 
 
-@dataclass
+def _slotted(cls: type) -> type:
+    """
+    Dataclass decorator that also gives the class `__slots__`.
+
+    Model objects are created by the hundred-thousand for large libraries, so
+    dropping the per-instance `__dict__` matters. `dataclass(slots=True)` only
+    exists on Python 3.10+, so older interpreters rebuild the class by hand.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    cls = dataclass(cls)
+    names = tuple(f.name for f in fields(cls))
+    ns = dict(cls.__dict__)
+    for name in names:
+        ns.pop(name, None)
+    ns.pop("__dict__", None)
+    ns.pop("__weakref__", None)
+    ns["__slots__"] = names
+    new_cls = type(cls)(cls.__name__, cls.__bases__, ns)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+@_slotted
 class Style:
     """
     Shared styling/metadata container.
@@ -45,7 +70,7 @@ class Style:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@_slotted
 class Folder:
     id: str
     name: str
@@ -53,7 +78,7 @@ class Folder:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@_slotted
 class Waypoint:
     id: str
     folder_id: Optional[str]
@@ -81,26 +106,224 @@ can embed `[lon, lat, ele, epoch_ms]` in coordinates arrays.
 """
 
 
-@dataclass
+class TrackPoints:
+    """
+    Compact column store for track vertices.
+
+    Coordinates live in parallel `array('d')` columns (lon/lat/ele) plus an
+    `array('q')` column for epoch ms, with `bytearray` validity masks for the
+    optional ele/time values. That is ~35 bytes per vertex (34 of data plus
+    array growth slack) instead of a 4-tuple plus boxed floats.
+
+    The container still behaves like a sequence of `TrackPoint` tuples:
+    iteration, indexing, slicing, `len()` and equality against plain lists of
+    tuples all work, so existing callers need not change. Hot paths should
+    read the columns directly.
+    """
+
+    __slots__ = ("lon", "lat", "ele", "time", "ele_mask", "time_mask")
+
+    def __init__(self, points: Iterable[TrackPoint] = ()) -> None:
+        self.lon = array("d")
+        self.lat = array("d")
+        self.ele = array("d")
+        self.time = array("q")
+        self.ele_mask = bytearray()
+        self.time_mask = bytearray()
+        self.extend(points)
+
+    def add(
+        self,
+        lon: float,
+        lat: float,
+        ele: Optional[float] = None,
+        t_ms: Optional[int] = None,
+    ) -> None:
+        """Append one vertex from scalar values (no tuple allocation)."""
+        self.lon.append(lon)
+        self.lat.append(lat)
+        if ele is None:
+            self.ele.append(0.0)
+            self.ele_mask.append(0)
+        else:
+            self.ele.append(ele)
+            self.ele_mask.append(1)
+        if t_ms is None:
+            self.time.append(0)
+            self.time_mask.append(0)
+        else:
+            self.time.append(int(t_ms))
+            self.time_mask.append(1)
+
+    def append(self, point: TrackPoint) -> None:
+        lon, lat, ele, t_ms = point
+        self.add(lon, lat, ele, t_ms)
+
+    def extend(self, points: Iterable[TrackPoint]) -> None:
+        if isinstance(points, TrackPoints):
+            self.lon.extend(points.lon)
+            self.lat.extend(points.lat)
+            self.ele.extend(points.ele)
+            self.time.extend(points.time)
+            self.ele_mask.extend(points.ele_mask)
+            self.time_mask.extend(points.time_mask)
+            return
+        add = self.add
+        for lon, lat, ele, t_ms in points:
+            add(lon, lat, ele, t_ms)
+
+    def has_ele(self) -> bool:
+        """True if any vertex carries an elevation."""
+        return any(self.ele_mask)
+
+    def has_time(self) -> bool:
+        """True if any vertex carries a timestamp."""
+        return any(self.time_mask)
+
+    def __len__(self) -> int:
+        return len(self.lon)
+
+    def take(self, indices: Iterable[int]) -> "TrackPoints":
+        """New TrackPoints holding the vertices at `indices` (all columns)."""
+        idx = list(indices)
+        out = TrackPoints()
+        out.lon = array("d", [self.lon[i] for i in idx])
+        out.lat = array("d", [self.lat[i] for i in idx])
+        out.ele = array("d", [self.ele[i] for i in idx])
+        out.time = array("q", [self.time[i] for i in idx])
+        out.ele_mask = bytearray(self.ele_mask[i] for i in idx)
+        out.time_mask = bytearray(self.time_mask[i] for i in idx)
+        return out
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            out = TrackPoints()
+            out.lon = self.lon[index]
+            out.lat = self.lat[index]
+            out.ele = self.ele[index]
+            out.time = self.time[index]
+            out.ele_mask = self.ele_mask[index]
+            out.time_mask = self.time_mask[index]
+            return out
+        return (
+            self.lon[index],
+            self.lat[index],
+            self.ele[index] if self.ele_mask[index] else None,
+            self.time[index] if self.time_mask[index] else None,
+        )
+
+    def __iter__(self) -> Iterator[TrackPoint]:
+        for lon, lat, ele, has_e, t_ms, has_t in zip(
+            self.lon, self.lat, self.ele, self.ele_mask, self.time, self.time_mask
+        ):
+            yield (lon, lat, ele if has_e else None, t_ms if has_t else None)
+
+    def __reversed__(self) -> Iterator[TrackPoint]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TrackPoints):
+            return (
+                self.lon == other.lon
+                and self.lat == other.lat
+                and self.ele_mask == other.ele_mask
+                and self.time_mask == other.time_mask
+                and list(self) == list(other)
+            )
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(
+                tuple(a) == b for a, b in zip(other, self)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TrackPoints({list(self)!r})"
+
+
+def as_track_points(points: Iterable[TrackPoint]) -> TrackPoints:
+    """Return `points` as a TrackPoints container (no copy if it already is one)."""
+    return points if isinstance(points, TrackPoints) else TrackPoints(points)
+
+
+@_slotted
 class Track:
     id: str
     folder_id: Optional[str]
     name: str
-    points: List[TrackPoint]
+    points: TrackPoints
     notes: str = ""
     style: Style = field(default_factory=Style)
     source_ids: List[str] = field(default_factory=list)
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Accept plain lists of TrackPoint tuples for convenience.
+        self.points = as_track_points(self.points)
+
     @property
     def geometry_type(self) -> GeometryType:
         return "LineString"
 
 
-PolygonRing = List[Tuple[float, float]]
+class RingPoints:
+    """
+    Compact `(lon, lat)` ring backed by parallel `array('d')` columns.
+
+    Sequence-compatible with the historical `List[Tuple[float, float]]`.
+    """
 
+    __slots__ = ("lon", "lat")
 
-@dataclass
+    def __init__(self, points: Iterable[Tuple[float, float]] = ()) -> None:
+        self.lon = array("d")
+        self.lat = array("d")
+        for pt in points:
+            self.lon.append(pt[0])
+            self.lat.append(pt[1])
+
+    def append(self, point: Tuple[float, float]) -> None:
+        self.lon.append(point[0])
+        self.lat.append(point[1])
+
+    def __len__(self) -> int:
+        return len(self.lon)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            out = RingPoints()
+            out.lon = self.lon[index]
+            out.lat = self.lat[index]
+            return out
+        return (self.lon[index], self.lat[index])
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        return zip(self.lon, self.lat)
+
+    def __reversed__(self) -> Iterator[Tuple[float, float]]:
+        return zip(reversed(self.lon), reversed(self.lat))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RingPoints):
+            return self.lon == other.lon and self.lat == other.lat
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(
+                tuple(a) == b for a, b in zip(other, self)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RingPoints({list(self)!r})"
+
+
+PolygonRing = RingPoints
+
+
+@_slotted
 class Shape:
     id: str
     folder_id: Optional[str]
@@ -111,6 +334,10 @@ class Shape:
     source_ids: List[str] = field(default_factory=list)
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Accept plain lists of (lon, lat) tuples for convenience.
+        self.rings = [r if isinstance(r, RingPoints) else RingPoints(r) for r in self.rings]
+
     @property
     def geometry_type(self) -> GeometryType:
         return "Polygon"
@@ -123,17 +350,79 @@ Item = Waypoint | Track | Shape
 class MapDocument:
     """
     Canonical representation of a user map, with optional folder structure.
+
+    Folder-id, item-id and per-type indexes are maintained incrementally by
+    `ensure_folder`, `add_item` and `remove_items`/`discard_items`. Code that
+    reassigns or appends to `items`/`folders` directly is still supported: the
+    indexes are rebuilt when the list object changes and extended when it
+    grows. (In-place element replacement, e.g. `doc.items[i] = x`, is not
+    detected; use the methods above instead.)
     """
 
     folders: List[Folder] = field(default_factory=list)
     items: List[Item] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Lazily-synchronized indexes (see class docstring).
+    _folder_index: Dict[str, Folder] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _folders_seen: Optional[List[Folder]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _folders_count: int = field(default=0, init=False, repr=False, compare=False)
+    _item_index: Dict[str, Item] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_type: Dict[type, List[Item]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _items_seen: Optional[List[Item]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _items_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _sync_folders(self) -> None:
+        folders = self.folders
+        if self._folders_seen is not folders or self._folders_count > len(folders):
+            # Hold a reference to the indexed list so its id can't be recycled.
+            self._folders_seen = folders
+            self._folders_count = 0
+            self._folder_index = {}
+        index = self._folder_index
+        for f in folders[self._folders_count :]:
+            index.setdefault(f.id, f)
+        self._folders_count = len(folders)
+
+    def _sync_items(self) -> None:
+        items = self.items
+        if self._items_seen is not items or self._items_count > len(items):
+            self._items_seen = items
+            self._items_count = 0
+            self._item_index = {}
+            self._by_type = {Waypoint: [], Track: [], Shape: []}
+        for item in items[self._items_count :]:
+            self._index_item(item)
+        self._items_count = len(items)
+
+    def _index_item(self, item: Item) -> None:
+        self._item_index.setdefault(item.id, item)
+        for kind in (Waypoint, Track, Shape):
+            if isinstance(item, kind):
+                self._by_type[kind].append(item)
+                break
+
+    # ------------------------------------------------------------------
+    # Folders
+    # ------------------------------------------------------------------
+
     def get_folder(self, folder_id: str) -> Optional[Folder]:
-        for f in self.folders:
-            if f.id == folder_id:
-                return f
-        return None
+        self._sync_folders()
+        return self._folder_index.get(folder_id)
 
     def ensure_folder(
         self, folder_id: str, name: str, parent_id: Optional[str] = None
@@ -143,16 +432,78 @@ class MapDocument:
             return existing
         f = Folder(id=folder_id, name=name, parent_id=parent_id)
         self.folders.append(f)
+        self._folder_index[folder_id] = f
+        self._folders_count += 1
         return f
 
+    # ------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------
+
     def add_item(self, item: Item) -> None:
+        self._sync_items()
         self.items.append(item)
+        self._index_item(item)
+        self._items_count += 1
+
+    def get_item(self, item_id: str) -> Optional[Item]:
+        """Return the first item with `item_id`, or None."""
+        self._sync_items()
+        return self._item_index.get(item_id)
+
+    def remove_items(
+        self, ids: Iterable[str], *, kind: Optional[type] = None
+    ) -> List[Item]:
+        """
+        Remove every item whose id is in `ids` in a single pass.
+
+        Args:
+            ids: Item ids to remove
+            kind: Optional item class (e.g. `Waypoint`); when given, only items
+                of that type are removed
+
+        Returns:
+            The removed items, in document order
+        """
+        id_set = set(ids)
+        if not id_set:
+            return []
+        return self._remove_where(
+            lambda i: i.id in id_set and (kind is None or isinstance(i, kind))
+        )
+
+    def discard_items(self, items: Iterable[Item]) -> List[Item]:
+        """
+        Remove these exact item objects (matched by identity, not equality).
+
+        Returns:
+            The removed items, in document order
+        """
+        obj_ids = {id(i) for i in items}
+        if not obj_ids:
+            return []
+        return self._remove_where(lambda i: id(i) in obj_ids)
+
+    def _remove_where(self, pred: Any) -> List[Item]:
+        kept: List[Item] = []
+        removed: List[Item] = []
+        for item in self.items:
+            (removed if pred(item) else kept).append(item)
+        if removed:
+            # Rebind rather than mutate so any outstanding typed views stay stable.
+            self.items = kept
+            self._sync_items()
+        return removed
+
+    def _of_type(self, kind: type) -> List[Any]:
+        self._sync_items()
+        return list(self._by_type.get(kind, ()))
 
     def waypoints(self) -> List[Waypoint]:
-        return [i for i in self.items if isinstance(i, Waypoint)]
+        return self._of_type(Waypoint)
 
     def tracks(self) -> List[Track]:
-        return [i for i in self.items if isinstance(i, Track)]
+        return self._of_type(Track)
 
     def shapes(self) -> List[Shape]:
-        return [i for i in self.items if isinstance(i, Shape)]
+        return self._of_type(Shape)
@@ -1543,7 +1543,7 @@ class CairnTuiApp(App):
         # User selected an icon - save the mapping
         symbol, _ = self._unmapped_symbols[self._unmapped_index]
         try:
-            save_user_mapping(symbol, result)
+            save_user_mapping(symbol, result, config=self._config)
         except Exception as e:
             self.push_screen(InfoModal(f"Error saving mapping: {e}", title="Error"))
             return
@@ -2367,13 +2367,15 @@ class CairnTuiApp(App):
             table = DataTable(id="routes_table")
             table.add_columns("Selected", "Name", "Color", "Pattern", "Width")
             q = (self._routes_filter or "").strip().lower()
-            for i, trk in enumerate(tracks):
+            colors = ColorMapper.map_track_colors(
+                str(getattr(trk, "stroke", "") or "") for trk in tracks
+            )
+            for i, (trk, rgba) in enumerate(zip(tracks, colors)):
                 name = str(getattr(trk, "title", "") or "Untitled")
                 if q and q not in name.lower():
                     continue
                 key = self._feature_row_key(trk, str(i))
                 sel = "●" if key in self._selected_route_keys else " "
-                rgba = ColorMapper.map_track_color(str(getattr(trk, "stroke", "") or ""))
                 table.add_row(
                     sel,
                     name,
@@ -2743,9 +2745,11 @@ class CairnTuiApp(App):
                     self._datatable_clear_rows(trk_table)
                 except Exception:
                     pass
-            for i, trk in enumerate(tracks):
+            colors = ColorMapper.map_track_colors(
+                str(getattr(trk, "stroke", "") or "") for trk in tracks
+            )
+            for i, (trk, rgba) in enumerate(zip(tracks, colors)):
                 name0 = str(getattr(trk, "title", "") or "Untitled")
-                rgba = ColorMapper.map_track_color(str(getattr(trk, "stroke", "") or ""))
                 desc0 = str(getattr(trk, "description", "") or "")
                 desc0 = " ".join(desc0.split())
                 try:
@@ -161,7 +161,9 @@ class TableManagerProtocol(Protocol):
         """Resolve the OnX icon for a waypoint."""
         ...
 
-    def resolved_waypoint_color(self, wp: object, icon: str) -> str:
+    def resolved_waypoint_color(
+        self, wp: object, icon: str, *, marker_color: Optional[str] = None
+    ) -> str:
         """Resolve the OnX color for a waypoint."""
         ...
 
@@ -140,7 +140,9 @@ class TableManager:
         sym0 = str(getattr(wp, "symbol", "") or "")
         return map_icon(title0, desc0, sym0, self.app._config)
 
-    def resolved_waypoint_color(self, wp: Any, icon: str) -> str:
+    def resolved_waypoint_color(
+        self, wp: Any, icon: str, *, marker_color: Optional[str] = None
+    ) -> str:
         """Resolve the OnX color for a waypoint.
 
         Mirrors cairn/core/writers.py policy.
@@ -148,6 +150,8 @@ class TableManager:
         Args:
             wp: Waypoint feature object (ParsedFeature or similar)
             icon: Icon name (used for default color lookup)
+            marker_color: The waypoint's color already mapped to the waypoint
+                palette (see `ColorMapper.map_waypoint_colors`), if known
 
         Returns:
             RGBA color string
@@ -155,6 +159,8 @@ class TableManager:
         # Mirror cairn/core/writers.py policy.
         mc_raw = str(getattr(wp, "color", "") or "").strip()
         if mc_raw:
+            if marker_color is not None:
+                return marker_color
             return ColorMapper.map_waypoint_color(mc_raw)
         return get_icon_color(
             icon,
@@ -427,15 +433,19 @@ class TableManager:
 
             # Sort waypoints alphabetically by name (case-insensitive)
             waypoints = sorted(waypoints, key=lambda wp: str(getattr(wp, "title", "") or "Untitled").lower())
+            # Quantize marker colors to the waypoint palette in one pass.
+            marker_colors = ColorMapper.map_waypoint_colors(
+                str(getattr(wp, "color", "") or "").strip() for wp in waypoints
+            )
 
-            for i, wp in enumerate(waypoints):
+            for i, (wp, marker_color) in enumerate(zip(waypoints, marker_colors)):
                 key = self._feature_row_key(wp, str(i))
                 title0 = str(getattr(wp, "title", "") or "Untitled")
                 if q and q not in title0.lower():
                     continue
                 sel = "●" if key in self.app._selected_waypoint_keys else " "
                 mapped = self.resolved_waypoint_icon(wp)
-                rgba = self.resolved_waypoint_color(wp, mapped)
+                rgba = self.resolved_waypoint_color(wp, mapped, marker_color=marker_color)
                 try:
                     table.add_row(sel, title0, mapped, self.color_chip(rgba), key=key)
                 except Exception:
@@ -488,13 +498,15 @@ class TableManager:
             # Sort routes alphabetically by name (case-insensitive)
             tracks = sorted(tracks, key=lambda trk: str(getattr(trk, "title", "") or "Untitled").lower())
 
-            for i, trk in enumerate(tracks):
+            colors = ColorMapper.map_track_colors(
+                str(getattr(trk, "stroke", "") or "") for trk in tracks
+            )
+            for i, (trk, rgba) in enumerate(zip(tracks, colors)):
                 key = self._feature_row_key(trk, str(i))
                 name = str(getattr(trk, "title", "") or "Untitled")
                 if q and q not in name.lower():
                     continue
                 sel = "●" if key in self.app._selected_route_keys else " "
-                rgba = ColorMapper.map_track_color(str(getattr(trk, "stroke", "") or ""))
                 try:
                     color_cell = self.color_chip(rgba)
                 except Exception:
@@ -333,3 +333,94 @@ def test_unicode_names(tmp_path):
     # Unicode should be preserved
     feature = result["features"][0]
     assert "name" in feature["properties"] or "title" in feature["properties"]
+
+
+def test_output_matches_json_dumps_layout(tmp_path):
+    """Streamed output should be byte-identical to json.dumps(indent=2)."""
+    doc = MapDocument(metadata={"source": "OnX_gpx"})
+    doc.ensure_folder("f1", "Folder")
+    doc.add_item(Waypoint(id="w1", folder_id="f1", name="Pt", lon=-105.5, lat=40.25))
+    doc.add_item(
+        Track(
+            id="t1",
+            folder_id="f1",
+            name="Trk",
+            points=[(-105.0, 40.0, 2500.5, 1700000000000), (-105.1, 40.1, None, None)],
+        )
+    )
+    doc.add_item(
+        Shape(
+            id="s1",
+            folder_id="f1",
+            name="Area",
+            rings=[[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 0.0)], [(0.5, 0.5)]],
+        )
+    )
+
+    output_path = tmp_path / "out.json"
+    write_caltopo_geojson(doc, output_path)
+
+    text = output_path.read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), ensure_ascii=False, indent=2) + "\n"
+    data = json.loads(text)
+    track = next(f for f in data["features"] if f["id"] == "t1")
+    assert track["geometry"]["coordinates"] == [
+        [-105.0, 40.0, 2500.5, 1700000000000.0],
+        [-105.1, 40.1, 0.0, 0.0],
+    ]
+    shape = next(f for f in data["features"] if f["id"] == "s1")
+    assert shape["geometry"]["coordinates"][1] == [[0.5, 0.5]]
+
+
+def test_compact_mode(tmp_path):
+    """Compact mode writes the same collection without indentation."""
+    doc = MapDocument(metadata={"source": "OnX_gpx"})
+    doc.ensure_folder("f1", "Folder")
+    doc.add_item(
+        Track(
+            id="t1",
+            folder_id="f1",
+            name="Trk",
+            points=[(-105.0, 40.0, None, None), (-105.1, 40.1, None, None)],
+        )
+    )
+    pretty = tmp_path / "pretty.json"
+    compact = tmp_path / "compact.json"
+
+    write_caltopo_geojson(doc, pretty)
+    write_caltopo_geojson(doc, compact, compact=True)
+
+    text = compact.read_text(encoding="utf-8")
+    assert "\n" not in text.rstrip("\n")
+    assert '"coordinates":[[-105.0,40.0],[-105.1,40.1]]' in text
+    assert json.loads(text) == json.loads(pretty.read_text(encoding="utf-8"))
+
+
+def test_icon_registry_resolved_once_per_write(tmp_path, monkeypatch):
+    """The registry lookup stats the mappings file, so it must not run per waypoint."""
+    from cairn.io import caltopo_geojson
+
+    calls = []
+    real = caltopo_geojson.get_icon_registry
+
+    def counting_get_icon_registry():
+        calls.append(1)
+        return real()
+
+    monkeypatch.setattr(caltopo_geojson, "get_icon_registry", counting_get_icon_registry)
+
+    doc = MapDocument()
+    for i in range(5):
+        doc.add_item(
+            Waypoint(
+                id=f"w{i}",
+                folder_id=None,
+                name=f"Point {i}",
+                lon=-120.0,
+                lat=45.0,
+                style=Style(OnX_icon="Hazard" if i % 2 else "NotARealIcon"),
+            )
+        )
+
+    write_caltopo_geojson(doc, tmp_path / "output.json")
+    assert len(calls) == 1
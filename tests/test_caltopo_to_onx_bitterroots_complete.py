@@ -128,3 +128,29 @@ def test_bitterroots_complete_caltopo_to_onx_export_standardizes_icons_and_track
         "<name>Avy hazard area</name>",
         "<onx:icon>Hazard</onx:icon>",
     )
+
+
+def test_bitterroots_complete_parallel_export_matches_sequential(tmp_path: Path) -> None:
+    from cairn.core.precision import CoordinatePrecision
+    from cairn.core.writers import get_name_changes
+
+    cfg = load_config(None)
+    precision = CoordinatePrecision(coord_decimals=6)
+    results = {}
+    for jobs in (1, 3):
+        out_dir = tmp_path / f"jobs{jobs}"
+        out_dir.mkdir()
+        manifest = process_and_write_files(
+            parse_geojson(FIXTURE),
+            out_dir,
+            sort=True,
+            skip_confirmation=True,
+            config=cfg,
+            precision=precision,
+            jobs=jobs,
+        )
+        files = {p.name: p.read_bytes() for p in sorted(out_dir.iterdir())}
+        results[jobs] = (manifest, files, get_name_changes())
+
+    assert len(results[1][0]) > 3
+    assert results[3] == results[1]
@@ -0,0 +1,92 @@
+"""Startup cost guards for the lazily-loaded CLI.
+
+Budgets are cumulative `python -X importtime` microseconds, set well above what the
+commands cost locally so they only trip when a heavy import sneaks back in.
+"""
+
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+from cairn.cli import LAZY_COMMANDS
+
+
+# module -> cumulative import budget (µs), measured after `import cairn.cli`
+COMMAND_BUDGETS_US = {
+    "cairn.commands.tui_cmd": 20_000,
+    "cairn.commands.catalog_cmd": 100_000,
+    "cairn.commands.config_cmd": 200_000,
+    "cairn.commands.migrate_cmd": 400_000,
+    "cairn.commands.convert_cmd": 400_000,
+}
+CLI_BUDGET_US = 150_000
+
+# Never needed just to build the command tree.
+HEAVY_MODULES = ("textual", "yaml", "rich.progress", "cairn.core.config", "cairn.tui")
+
+
+def _run(code: str, *, importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    return subprocess.run(args, capture_output=True, text=True, timeout=60, check=True)
+
+
+def _importtime(code: str) -> Dict[str, int]:
+    """Cumulative import time (µs) per module for running `code` in a fresh interpreter."""
+    out: Dict[str, int] = {}
+    for line in _run(code, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        out[name.strip()] = int(cumulative)
+    return out
+
+
+def _loaded_after(argv: List[str]) -> List[str]:
+    code = (
+        "import json, sys\n"
+        "from typer.testing import CliRunner\n"
+        "from cairn.cli import app\n"
+        f"result = CliRunner().invoke(app, {argv!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    return json.loads(_run(code).stdout)
+
+
+def test_cli_import_is_light():
+    times = _importtime("import cairn.cli")
+    assert times["cairn.cli"] <= CLI_BUDGET_US
+    assert not [m for m in times if m.startswith("cairn.commands.")]
+    assert not [m for m in times if m.startswith(HEAVY_MODULES)]
+
+
+def test_top_level_help_does_not_import_commands():
+    loaded = _loaded_after(["--help"])
+    assert not [m for m in loaded if m.startswith("cairn.commands.")]
+    assert not [m for m in loaded if m.startswith(HEAVY_MODULES)]
+
+
+def test_subcommand_loads_only_its_module():
+    loaded = _loaded_after(["catalog", "--help"])
+    assert [m for m in loaded if m.startswith("cairn.commands.")] == [
+        "cairn.commands.catalog_cmd"
+    ]
+    assert "cairn.core.icon_registry" not in loaded
+
+
+@pytest.mark.parametrize("module", sorted(COMMAND_BUDGETS_US))
+def test_command_import_budget(module: str):
+    times = _importtime(f"import cairn.cli\nimport {module}")
+    assert times[module] <= COMMAND_BUDGETS_US[module]
+
+
+def test_tui_command_defers_textual():
+    times = _importtime("import cairn.cli\nimport cairn.commands.tui_cmd")
+    assert not [m for m in times if m.startswith(("textual", "cairn.tui"))]
+
+
+def test_every_lazy_command_has_a_budget():
+    assert {spec.module for spec in LAZY_COMMANDS.values()} == set(COMMAND_BUDGETS_US)
@@ -18,3 +18,34 @@ def test_track_color_quantizes_hex_to_track_palette():
 def test_waypoint_color_exact_match_roundtrips():
     assert ColorMapper.map_waypoint_color("FF0000") == "rgba(255,0,0,1)"
     assert ColorMapper.map_waypoint_color("rgba(132,212,0,1)") == "rgba(132,212,0,1)"
+
+
+def test_color_mapping_is_memoized_per_raw_string():
+    ColorMapper.map_waypoint_color.cache_clear()
+    for _ in range(3):
+        assert ColorMapper.map_waypoint_color("#FF00FF") == "rgba(128,0,128,1)"
+    info = ColorMapper.map_waypoint_color.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    # Track and waypoint palettes are cached independently.
+    assert ColorMapper.map_track_color("#FF00FF") == "rgba(255,0,255,1)"
+
+
+def test_palette_lookup_table_matches_exact_nearest_color():
+    for palette in (ColorMapper.TRACK_PALETTE, ColorMapper.WAYPOINT_PALETTE):
+        # Stride 5 hits every cell and both sides of most cell boundaries.
+        for r in range(0, 256, 5):
+            for g in range(0, 256, 5):
+                for b in range(0, 256, 5):
+                    assert ColorMapper._lookup(r, g, b, palette) is (
+                        ColorMapper._find_closest_in_palette(r, g, b, palette)
+                    )
+
+
+def test_batch_color_mapping_matches_scalar():
+    raw = ["#FF00FF", "", "rgb(0, 122, 255)", "#FF00FF", "nope", "rgba(300,0,0,1)"]
+    assert ColorMapper.map_waypoint_colors(raw) == [
+        ColorMapper.map_waypoint_color(c) for c in raw
+    ]
+    assert ColorMapper.map_track_colors(iter(raw)) == [
+        ColorMapper.map_track_color(c) for c in raw
+    ]
@@ -464,3 +464,41 @@ def test_dedup_empty_list():
     assert len(dropped) == 0
     assert report.dropped_count == 0
     assert report.group_count == 0
+
+
+def test_radius_dedup_catches_rounding_boundary_pair():
+    """Two copies ~0.2m apart across a 6-decimal boundary merge in radius mode."""
+    wp1 = Waypoint(id="a", folder_id="f", name="Camp", lon=-114.0, lat=45.0000004)
+    wp2 = Waypoint(id="b", folder_id="f", name="camp", lon=-114.0, lat=45.0000006)
+
+    _, dropped_exact, _ = dedupe_waypoints([wp1, wp2])
+    assert dropped_exact == []
+
+    kept, dropped, report = dedupe_waypoints([wp1, wp2], radius_m=1.0)
+    assert [w.id for w in kept] == ["a"]
+    assert [w.id for w in dropped] == ["b"]
+    assert report.groups[0].key == waypoint_dedup_key(wp1)
+    assert report.groups[0].dropped_ids == ["b"]
+
+
+def test_radius_dedup_respects_name_and_distance():
+    """Different names or points outside the radius are never merged."""
+    base = Waypoint(id="a", folder_id="f", name="Camp", lon=-114.0, lat=45.0)
+    far = Waypoint(id="b", folder_id="f", name="Camp", lon=-114.0, lat=45.0001)  # ~11m
+    other = Waypoint(id="c", folder_id="f", name="Lake", lon=-114.0, lat=45.0)
+    near = Waypoint(id="d", folder_id="f", name="Camp", lon=-114.00003, lat=45.0)  # ~2.4m
+
+    kept, dropped, report = dedupe_waypoints([base, far, other, near], radius_m=5.0)
+    assert [w.id for w in kept] == ["a", "b", "c"]
+    assert [w.id for w in dropped] == ["d"]
+    assert report.group_count == 1
+
+
+def test_apply_waypoint_dedup_radius_mode():
+    doc = MapDocument()
+    doc.add_item(Waypoint(id="a", folder_id="f", name="Camp", lon=10.0, lat=60.0))
+    doc.add_item(Waypoint(id="b", folder_id="f", name="Camp", lon=10.00001, lat=60.0))
+
+    report = apply_waypoint_dedup(doc, radius_m=2.0)
+    assert report.dropped_count == 1
+    assert [w.id for w in doc.waypoints()] == ["a"]
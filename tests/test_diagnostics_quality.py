@@ -20,3 +20,39 @@ def test_check_data_quality_detects_empty_names_duplicates_and_suspicious_coords
     assert any("Near (0,0)" in r for r in reasons)
     assert any("Out of valid range" in r for r in reasons)
     assert ("t1", "EmptyTrack") in warnings["empty_tracks"]
+
+
+def test_ingest_collector_matches_separate_walks(tmp_path):
+    import yaml
+
+    from cairn.core.diagnostics import IngestCollector
+    from cairn.core.icon_registry import IconRegistry
+
+    mappings = tmp_path / "icon_mappings.yaml"
+    mappings.write_text(
+        yaml.dump(
+            {
+                "version": 1,
+                "onx_to_caltopo": {"default_symbol": "point", "icon_map": {"Hazard": "danger"}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    reg = IconRegistry(mappings_path=mappings, catalog_path=tmp_path / "catalog.yaml")
+
+    doc = MapDocument(metadata={})
+    doc.ensure_folder("f", "F")
+    doc.add_item(Waypoint(id="w1", folder_id="f", name="Dup", lon=0.0, lat=0.0, style=Style(OnX_icon="Hazard", OnX_color_rgba="rgba(255,0,0,1)")))
+    doc.add_item(Waypoint(id="w2", folder_id="f", name="Dup", lon=1.0, lat=1.0, style=Style(OnX_icon="Hazard")))
+    doc.add_item(Waypoint(id="w3", folder_id="f", name="", lon=2.0, lat=2.0, style=Style()))
+    doc.add_item(Track(id="t1", folder_id="f", name="Dup", points=[], style=Style()))
+
+    collected = IngestCollector.from_document(doc)
+
+    assert collected.quality.warnings() == check_data_quality(doc)
+    assert collected.icons.inventory() == reg.collect_onx_icon_inventory(doc)
+    assert collected.icons.mapping_rows(reg) == reg.collect_onx_icon_mapping_rows(doc)
+    assert [(r.incoming, r.mapped, r.count) for r in collected.icons.mapping_rows(reg)] == [
+        ("Hazard", "danger", 2),
+        ("(missing)", "point", 1),
+    ]
@@ -93,3 +93,35 @@ def test_split_tracks_gpx_by_bytes_preserves_order_and_onx_metadata(tmp_path: Pa
         assert "<trk>" in t
         assert "<desc>" in t and "style=" in t and "weight=" in t
         assert "<onx:color>" in t and "<onx:style>" in t and "<onx:weight>" in t
+
+
+def test_split_parts_report_exact_counts_and_sizes(tmp_path: Path):
+    features = [_mk_waypoint(i, f"WP{i}") for i in range(10)]
+    out = tmp_path / "Days_Waypoints.gpx"
+
+    parts = write_gpx_waypoints_maybe_split(
+        features, out, "Days", sort=False, split=True, max_bytes=2500
+    )
+
+    assert len(parts) >= 2
+    assert [p.name for p, _, _ in parts] == [
+        f"Days_Waypoints_{i}.gpx" for i in range(1, len(parts) + 1)
+    ]
+    assert sum(c for _, _, c in parts) == 10
+    for pth, size, count in parts:
+        data = pth.read_bytes()
+        assert size == len(data) <= 2500
+        assert data.decode("utf-8").count("<wpt ") == count
+        assert not data.endswith(b"\n")
+
+
+def test_unsplit_output_keeps_base_filename(tmp_path: Path):
+    features = [_mk_track(i, f"Track{i}") for i in range(5)]
+    out = tmp_path / "Days_Tracks.gpx"
+
+    parts = write_gpx_tracks_maybe_split(
+        features, out, "Days", sort=False, split=False, max_bytes=200
+    )
+
+    assert parts == [(out, out.stat().st_size, 5)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Days_Tracks.gpx"]
@@ -1,9 +1,18 @@
 import json
+import os
+import multiprocessing
 from pathlib import Path
 
 import yaml
 
-from cairn.core.icon_registry import IconRegistry
+from cairn.core import icon_mapping_data
+from cairn.core.icon_catalog import (
+    append_catalog_entries,
+    compact_catalog,
+    journal_path,
+    read_catalog,
+)
+from cairn.core.icon_registry import IconRegistry, get_icon_registry
 from cairn.core.config import IconMappingConfig
 from cairn.core.parser import parse_geojson
 from cairn.model import MapDocument, Style, Waypoint
@@ -77,10 +86,72 @@ def test_catalog_merge_appends_counts(tmp_path: Path):
     # Append again
     reg.append_onx_icon_inventory_to_catalog(inv)
 
-    data = yaml.safe_load(catalog.read_text(encoding="utf-8"))
+    data = reg.read_catalog()
     assert data["version"] == 1
     assert data["observed_onx_icons"]["Hazard"]["count"] == 2
 
+    # Appends go to the journal; the YAML snapshot is only written on compaction.
+    assert not catalog.exists()
+    assert reg.compact_catalog() == 2
+    data = yaml.safe_load(catalog.read_text(encoding="utf-8"))
+    assert data["observed_onx_icons"]["Hazard"] == {"count": 2, "examples": ["A1"]}
+    assert data["journal_offset"] == journal_path(catalog).stat().st_size
+
+
+def test_catalog_compaction_is_incremental(tmp_path: Path):
+    catalog = tmp_path / "icon_catalog.yaml"
+
+    append_catalog_entries(catalog, "observed_onx_icons", [("Hazard", 1, ["A"])])
+    assert compact_catalog(catalog) == 1
+    # Nothing new: no-op, snapshot untouched.
+    before = catalog.read_text(encoding="utf-8")
+    assert compact_catalog(catalog) == 0
+    assert catalog.read_text(encoding="utf-8") == before
+
+    append_catalog_entries(catalog, "observed_onx_icons", [("Hazard", 2, ["B"])])
+    append_catalog_entries(catalog, "observed_onx_icons", [("Camp", 1, [])])
+    assert read_catalog(catalog)["observed_onx_icons"]["Hazard"]["count"] == 3
+    assert compact_catalog(catalog) == 2
+    data = yaml.safe_load(catalog.read_text(encoding="utf-8"))
+    assert data["observed_onx_icons"]["Hazard"] == {"count": 3, "examples": ["A", "B"]}
+    assert data["observed_onx_icons"]["Camp"]["count"] == 1
+
+
+def test_catalog_refolds_journal_from_a_different_checkout(tmp_path: Path):
+    catalog = tmp_path / "icon_catalog.yaml"
+    append_catalog_entries(catalog, "observed_onx_icons", [("Hazard", 1, [])])
+    append_catalog_entries(catalog, "observed_onx_icons", [("Hazard", 1, [])])
+    compact_catalog(catalog)
+
+    # Snapshot kept, journal replaced (e.g. committed YAML, fresh clone).
+    journal_path(catalog).unlink()
+    append_catalog_entries(catalog, "observed_onx_icons", [("Camp", 5, [])])
+    data = read_catalog(catalog)
+    assert data["observed_onx_icons"]["Hazard"]["count"] == 2
+    assert data["observed_onx_icons"]["Camp"]["count"] == 5
+
+
+def _append_many(catalog: str, n: int) -> None:
+    for _ in range(n):
+        append_catalog_entries(
+            Path(catalog), "observed_onx_icons", [("Hazard", 1, [])], auto_compact=False
+        )
+
+
+def test_catalog_concurrent_writers_do_not_lose_counts(tmp_path: Path):
+    catalog = tmp_path / "icon_catalog.yaml"
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_append_many, args=(str(catalog), 50)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    assert all(p.exitcode == 0 for p in procs)
+
+    assert compact_catalog(catalog) == 200
+    data = yaml.safe_load(catalog.read_text(encoding="utf-8"))
+    assert data["observed_onx_icons"]["Hazard"]["count"] == 200
+
 
 def test_collect_caltopo_to_onx_rows_uses_config_and_emits_onx_colors(tmp_path: Path):
     # Minimal GeoJSON with two markers, one with a marker-color.
@@ -141,3 +212,48 @@ def test_collect_caltopo_to_onx_rows_uses_config_and_emits_onx_colors(tmp_path:
     skull_rows = [r for r in rows if r.incoming == "skull" and r.mapped == "Hazard"]
     assert skull_rows
     assert "rgba(255,0,0,1)" in skull_rows[0].colors
+
+
+def test_shared_registry_is_reused_until_mappings_change(tmp_path: Path):
+    mappings = tmp_path / "icon_mappings.yaml"
+    catalog = tmp_path / "icon_catalog.yaml"
+    _write_minimal_mappings(mappings)
+
+    reg = get_icon_registry(mappings_path=mappings, catalog_path=catalog)
+    assert get_icon_registry(mappings_path=mappings, catalog_path=catalog) is reg
+
+    data = yaml.safe_load(mappings.read_text(encoding="utf-8"))
+    data["onx_to_caltopo"]["icon_map"]["Hazard"] = "skull"
+    mappings.write_text(yaml.dump(data, sort_keys=False), encoding="utf-8")
+    st = mappings.stat()
+    os.utime(mappings, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    fresh = get_icon_registry(mappings_path=mappings, catalog_path=catalog)
+    assert fresh is not reg
+    assert fresh.map_onx_icon_to_caltopo_symbol("Hazard") == ("skull", "direct")
+
+
+def test_compiled_artifact_skips_yaml_parsing(tmp_path: Path, monkeypatch):
+    mappings = tmp_path / "icon_mappings.yaml"
+    _write_minimal_mappings(mappings)
+    icon_mapping_data.clear_cache()
+
+    first = icon_mapping_data.load_mappings_data(mappings)
+    artifact = icon_mapping_data.compiled_artifact_path(mappings.resolve())
+    assert artifact.exists()
+
+    icon_mapping_data.clear_cache()
+
+    def _fail(*_a, **_k):
+        raise AssertionError("YAML should not be parsed when the artifact is current")
+
+    monkeypatch.setattr(icon_mapping_data.yaml, "safe_load", _fail)
+    assert icon_mapping_data.load_mappings_data(mappings) == first
+
+    # Editing the YAML invalidates the artifact (content hash mismatch) and rebuilds it.
+    monkeypatch.undo()
+    icon_mapping_data.clear_cache()
+    old_digest = json.loads(artifact.read_text(encoding="utf-8"))["sha256"]
+    mappings.write_text(mappings.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    assert icon_mapping_data.load_mappings_data(mappings) == first
+    assert json.loads(artifact.read_text(encoding="utf-8"))["sha256"] != old_digest
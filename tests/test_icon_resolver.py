@@ -55,3 +55,49 @@ def test_keyword_tie_breaks_by_priority_order():
     decision = resolver.resolve("Trailhead parking", "", "")
     assert decision.icon == "Parking"
 
+
+def test_symbol_substring_prefers_longest_then_lexicographic_key():
+    resolver = IconResolver(
+        symbol_map={"he": "A", "she": "B", "hers": "C", "is": "D"},
+        keyword_map={},
+        default_icon="Location",
+        generic_symbols=set(),
+    )
+    # 'ushers' contains 'she', 'he' and 'hers' (overlapping); the longest key wins.
+    decision = resolver.resolve("", "", "ushers")
+    assert decision.icon == "C"
+    assert decision.matched_terms == ("hers",)
+    assert decision.reasons == ("symbol substring match 'hers' in 'ushers' → 'C'",)
+
+
+def test_phrase_keywords_match_as_substrings_and_ties_keep_priority_order():
+    resolver = IconResolver(
+        symbol_map={},
+        keyword_map={
+            "Water Source": ["spring", "water source"],
+            "Campsite": ["camp", "spring"],
+        },
+        default_icon="Location",
+        generic_symbols=set(),
+    )
+    decision = resolver.resolve("Camp by the spring", "", "")
+    assert decision.icon == "Campsite"
+    assert decision.matched_terms == ("camp", "spring")
+
+    decision = resolver.resolve("Spring", "", "")
+    assert decision.icon == "Water Source"  # tie: first configured icon wins
+
+    decision = resolver.resolve("Main water sources", "", "")
+    assert decision.icon == "Water Source"
+    assert decision.reasons == ("keyword matches for 'Water Source': water source",)
+
+
+def test_resolve_many_matches_resolve():
+    resolver = IconResolver(
+        symbol_map={"skull": "Hazard"},
+        keyword_map={"Campsite": ["camp"]},
+        default_icon="Location",
+        generic_symbols=set(),
+    )
+    items = [("Base Camp", "", ""), ("x", "", "skull"), ("Base Camp", None, None)]
+    assert resolver.resolve_many(items) == [resolver.resolve(*i) for i in items]
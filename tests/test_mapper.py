@@ -477,3 +477,58 @@ class TestIconEmojiConfigRemoved:
             load_config(cfg)
 
         assert "icon_emojis" in str(e.value)
+
+
+class TestIconDecisionCache:
+    """map_icon memoizes decisions per config and invalidates on mapping changes."""
+
+    def test_repeated_inputs_hit_cache_and_still_track_unmapped(self, tmp_path):
+        from cairn.core.mapper import config_icon_resolver
+
+        config = load_config(tmp_path / "missing.yaml")
+        for _ in range(3):
+            assert map_icon("Spot", "", "mystery-symbol", config) == "Location"
+
+        info = config_icon_resolver(config).cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+        assert config.unmapped_symbols["mystery-symbol"] == ["Spot"] * 3
+
+    def test_set_symbol_mapping_invalidates_cached_decisions(self, tmp_path):
+        config = load_config(tmp_path / "missing.yaml")
+        assert map_icon("Spot", "", "mystery-symbol", config) == "Location"
+        version = config.mapping_version
+
+        config.set_symbol_mapping("Mystery-Symbol", "Camp")
+
+        assert config.mapping_version > version
+        assert map_icon("Spot", "", "mystery-symbol", config) == "Camp"
+
+    def test_save_user_mapping_updates_loaded_config(self, tmp_path):
+        from cairn.core.config import save_user_mapping
+
+        config = load_config(tmp_path / "missing.yaml")
+        assert map_icon("Spot", "", "mystery-symbol", config) == "Location"
+
+        save_user_mapping(
+            "mystery-symbol", "Hazard", tmp_path / "cairn_config.yaml", config=config
+        )
+
+        assert map_icon("Spot", "", "mystery-symbol", config) == "Hazard"
+
+    def test_reassigning_keyword_map_invalidates(self, tmp_path):
+        config = load_config(tmp_path / "missing.yaml")
+        assert map_icon("Zebra crossing", "", "", config) == "Location"
+
+        config.keyword_map = {**config.keyword_map, "Hazard": ["zebra"]}
+
+        assert map_icon("Zebra crossing", "", "", config) == "Hazard"
+
+    def test_config_with_cached_resolver_pickles(self, tmp_path):
+        import pickle
+
+        config = load_config(tmp_path / "missing.yaml")
+        map_icon("Tent site", "", "", config)
+
+        clone = pickle.loads(pickle.dumps(config))
+
+        assert map_icon("Tent site", "", "", clone) == "Camp"
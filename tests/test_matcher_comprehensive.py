@@ -340,3 +340,20 @@ def test_empty_string_input(matcher):
     assert len(matches) == 3
     # But scores should be low or varied
     # (exact behavior depends on implementation)
+
+
+@pytest.mark.parametrize(
+    "symbol",
+    ["camp", "marker-climb-2", "tent", "hot spring", "xyz", "avy_path", "", "summit peak"],
+)
+@pytest.mark.parametrize("top_n", [1, 3, 50])
+def test_pruned_matches_equal_exhaustive_scoring(matcher, valid_icons, symbol, top_n):
+    """Pruned search returns exactly the stable-sorted top N of the reference scores."""
+    normalized = matcher._normalize_symbol(symbol)
+    expected = sorted(
+        ((icon, matcher._calculate_similarity(normalized, icon)) for icon in valid_icons),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:top_n]
+
+    assert matcher.find_best_matches(symbol, top_n=top_n) == expected
@@ -68,3 +68,29 @@ def test_migrate_caltopo_accepts_gpx_file(tmp_path: Path):
     out_dir = tmp_path / "caltopo_ready"
     assert out_dir.exists()
     assert list(out_dir.glob("*.json")), "Expected GeoJSON outputs in caltopo_ready/"
+
+
+def test_migrate_caltopo_applies_config_precision(tmp_path: Path):
+    in_file = tmp_path / "export.gpx"
+    in_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1">
+  <wpt lat="45.1234567" lon="-120.7654321"><name>Camp</name></wpt>
+</gpx>
+""",
+        encoding="utf-8",
+    )
+    cfg = tmp_path / "cairn_config.yaml"
+    cfg.write_text("coordinate_decimals: 3\n", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["migrate", "caltopo", str(in_file), "--config", str(cfg), "--no-trace"],
+        input="\n\n\n",
+    )
+    assert result.exit_code == 0, result.stdout
+
+    out = next((tmp_path / "caltopo_ready").glob("export.json"))
+    features = json.loads(out.read_text(encoding="utf-8"))["features"]
+    coords = [f["geometry"]["coordinates"] for f in features if f.get("geometry")]
+    assert coords == [[-120.765, 45.123]]
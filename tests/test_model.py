@@ -0,0 +1,108 @@
+"""Tests for the compact geometry containers in cairn.model."""
+
+import copy
+import pickle
+
+from cairn.model import (
+    Folder,
+    MapDocument,
+    RingPoints,
+    Shape,
+    Track,
+    TrackPoints,
+    Waypoint,
+    as_track_points,
+)
+
+
+def test_track_points_round_trip_tuples():
+    pts = [(-114.0, 45.0, 10.0, 1700000000000), (-114.1, 45.1, None, None)]
+    tp = TrackPoints(pts)
+
+    assert len(tp) == 2
+    assert list(tp) == pts
+    assert tp[1] == (-114.1, 45.1, None, None)
+    assert tp[-1] == pts[-1]
+    assert tp == pts
+    assert tp[:1] == pts[:1]
+    assert list(reversed(tp)) == pts[::-1]
+    assert tp.has_ele() and tp.has_time()
+
+
+def test_track_points_columns_pad_missing_values():
+    tp = TrackPoints()
+    tp.add(1.0, 2.0)
+    tp.append((3.0, 4.0, 5.0, None))
+
+    assert list(tp.lon) == [1.0, 3.0]
+    assert list(tp.ele) == [0.0, 5.0]
+    assert list(tp.ele_mask) == [0, 1]
+    assert not tp.has_time()
+
+
+def test_track_coerces_list_points():
+    trk = Track(id="t", folder_id=None, name="T", points=[(1.0, 2.0, None, None)])
+    assert isinstance(trk.points, TrackPoints)
+    assert as_track_points(trk.points) is trk.points
+    assert trk.points == [(1.0, 2.0, None, None)]
+
+
+def test_shape_coerces_rings():
+    shp = Shape(id="s", folder_id=None, name="S", rings=[[(0.0, 0.0), (1.0, 1.0)]])
+    assert isinstance(shp.rings[0], RingPoints)
+    assert shp.rings == [[(0.0, 0.0), (1.0, 1.0)]]
+    assert list(reversed(shp.rings[0])) == [(1.0, 1.0), (0.0, 0.0)]
+
+
+def test_containers_copy_and_pickle():
+    trk = Track(id="t", folder_id=None, name="T", points=[(1.0, 2.0, 3.0, 4)])
+    assert copy.deepcopy(trk) == trk
+    assert pickle.loads(pickle.dumps(trk)) == trk
+
+
+def test_model_objects_have_no_instance_dict():
+    trk = Track(id="t", folder_id=None, name="T", points=[])
+    assert not hasattr(trk, "__dict__")
+    assert not hasattr(trk.style, "__dict__")
+
+
+def _wp(id_: str) -> Waypoint:
+    return Waypoint(id=id_, folder_id=None, name=id_, lon=0.0, lat=0.0)
+
+
+def test_map_document_indexes_follow_add_and_remove():
+    doc = MapDocument()
+    doc.ensure_folder("f1", "One")
+    assert doc.ensure_folder("f1", "Other").name == "One"
+    assert len(doc.folders) == 1
+
+    trk = Track(id="t1", folder_id=None, name="T", points=[])
+    for item in (_wp("a"), trk, _wp("b"), _wp("c")):
+        doc.add_item(item)
+
+    assert [w.id for w in doc.waypoints()] == ["a", "b", "c"]
+    assert doc.get_item("t1") is trk
+
+    removed = doc.remove_items({"a", "c", "missing"})
+    assert [i.id for i in removed] == ["a", "c"]
+    assert [i.id for i in doc.items] == ["t1", "b"]
+    assert doc.get_item("a") is None
+    assert doc.remove_items({"t1"}, kind=Waypoint) == []
+
+    doc.discard_items([trk])
+    assert doc.tracks() == []
+
+
+def test_map_document_tolerates_direct_list_mutation():
+    doc = MapDocument(folders=[Folder(id="f", name="F")], items=[_wp("a")])
+    assert doc.get_folder("f").name == "F"
+    assert [w.id for w in doc.waypoints()] == ["a"]
+
+    doc.items.append(_wp("b"))
+    doc.folders.append(Folder(id="g", name="G"))
+    assert [w.id for w in doc.waypoints()] == ["a", "b"]
+    assert doc.get_folder("g") is not None
+
+    doc.items = [_wp("z")]
+    assert doc.get_item("a") is None
+    assert [w.id for w in doc.waypoints()] == ["z"]
@@ -100,3 +100,80 @@ def test_read_OnX_gpx_reads_onx_extensions_from_fixture() -> None:
     # First waypoint in the fixture includes both color and icon in <extensions>.
     assert wpts[0].style.OnX_color_rgba is not None
     assert wpts[0].style.OnX_icon is not None
+
+
+def test_read_OnX_gpx_orders_items_by_kind_regardless_of_document_order(tmp_path: Path):
+    # GPX 1.1 schema order is wpt, rte, trk; output stays wpt, trk, rte.
+    p = tmp_path / "mixed.gpx"
+    p.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1">
+  <rte><name>R</name><rtept lat="45.0" lon="-114.0"/><rtept lat="bad" lon="-114.1"/></rte>
+  <trk><name>T</name>
+    <trkseg><trkpt lat="45.0" lon="-114.0"><ele>10</ele></trkpt></trkseg>
+    <trkseg><trkpt lat="45.1" lon="-114.1"/><trkpt lat="95.0" lon="-114.1"/></trkseg>
+  </trk>
+  <trk><name>Empty</name><trkseg/></trk>
+  <wpt lat="45.0" lon="-114.0"><name>W</name></wpt>
+</gpx>
+""",
+        encoding="utf-8",
+    )
+    trace = _Trace()
+    doc = read_onx_gpx(p, trace=trace)
+
+    assert [i.name for i in doc.items] == ["W", "T", "R"]
+    trk = doc.tracks()[0]
+    assert trk.points == [(-114.0, 45.0, 10.0, None), (-114.1, 45.1, None, None)]
+    assert [(e["event"], e["idx"]) for e in trace.events] == [
+        ("input.wpt", 0),
+        ("input.trk", 0),
+        ("input.rte", 0),
+    ]
+    assert trace.events[2]["point_count"] == 1
+
+
+def test_read_OnX_gpx_lean_drops_raw_duplicates(tmp_path: Path):
+    p = tmp_path / "lean.gpx"
+    p.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1">
+  <wpt lat="45.0" lon="-114.0"><name>W</name><desc>id=abc
+icon=Camp</desc></wpt>
+</gpx>
+""",
+        encoding="utf-8",
+    )
+    full = read_onx_gpx(p).waypoints()[0]
+    lean = read_onx_gpx(p, lean=True).waypoints()[0]
+
+    assert full.extra["desc_raw"] and full.style.extra["desc_kv"]["icon"] == "Camp"
+    assert lean.extra == {} and "desc_kv" not in lean.style.extra
+    assert (lean.id, lean.name, lean.style.OnX_icon) == ("abc", "W", "Camp")
+
+
+def test_read_OnX_gpx_trace_events_match_untraced_items(tmp_path: Path):
+    p = tmp_path / "mixed.gpx"
+    p.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1">
+  <trk><name>T1</name><trkseg><trkpt lat="45.0" lon="-120.0"/><trkpt lat="45.1" lon="-120.1"/></trkseg></trk>
+  <wpt lat="45.0" lon="-120.0"><name>A</name></wpt>
+  <wpt lat="91.0" lon="0.0"><name>OOR</name></wpt>
+  <wpt lat="45.2" lon="-120.2"><name>B</name></wpt>
+</gpx>
+""",
+        encoding="utf-8",
+    )
+    trace = _Trace()
+    traced = read_onx_gpx(p, trace=trace)
+    plain = read_onx_gpx(p)
+
+    assert [i.name for i in traced.items] == [i.name for i in plain.items] == ["A", "B", "T1"]
+    # Events stay grouped by kind; idx counts every element of that kind.
+    assert [(e["event"], e["idx"]) for e in trace.events] == [
+        ("input.wpt", 0),
+        ("input.wpt.warning", 1),
+        ("input.wpt", 2),
+        ("input.trk", 0),
+    ]
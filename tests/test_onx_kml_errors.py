@@ -422,3 +422,37 @@ def test_kml_point_without_name(tmp_path):
 
     # Should create waypoint with empty or default name
     assert len(doc.waypoints()) == 1
+
+
+def test_kml_streaming_dispatch_in_nested_folders(tmp_path):
+    """Geometry precedence, ExtendedData and outer-ring selection survive deep nesting."""
+    kml_file = tmp_path / "nested.kml"
+    kml_file.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+    <kml xmlns="http://www.opengis.net/kml/2.2"><Document>
+      <Folder><Folder><Folder>
+        <Placemark>
+          <name>Multi</name>
+          <ExtendedData><Data name="ID"><value> abc </value></Data></ExtendedData>
+          <MultiGeometry>
+            <LineString><coordinates>-114,45 -114.1,45.1</coordinates></LineString>
+            <Point><coordinates>-113,44</coordinates></Point>
+          </MultiGeometry>
+        </Placemark>
+        <Placemark>
+          <name>Area</name>
+          <Polygon>
+            <innerBoundaryIs><LinearRing><coordinates>0,0 1,1 0,0</coordinates></LinearRing></innerBoundaryIs>
+            <outerBoundaryIs><LinearRing><coordinates>-1,1 -2,2 -3,1 -1,1</coordinates></LinearRing></outerBoundaryIs>
+          </Polygon>
+        </Placemark>
+      </Folder></Folder></Folder>
+    </Document></kml>""")
+
+    doc = read_onx_kml(str(kml_file))
+
+    # Point wins over LineString, exactly as the original dispatch order.
+    wp = doc.waypoints()[0]
+    assert (wp.id, wp.lon, wp.lat) == ("abc", -113.0, 44.0)
+    assert doc.tracks() == []
+    shp = doc.shapes()[0]
+    assert shp.rings == [[(-1.0, 1.0), (-2.0, 2.0), (-3.0, 1.0), (-1.0, 1.0)]]
@@ -8,6 +8,7 @@ from cairn.core.parser import (
     ParsedFeature,
     ParsedData,
     parse_geojson,
+    iter_geojson_features,
     get_file_summary,
 )
 
@@ -257,6 +258,94 @@ class TestParseGeojson:
             assert len(result.folders) == 1
 
 
+class TestStreamingParse:
+    """Tests for the incremental GeoJSON reader."""
+
+    @staticmethod
+    def _folder_view(parsed):
+        return {
+            fid: (
+                data["name"],
+                [f.id for f in data["waypoints"]],
+                [f.id for f in data["tracks"]],
+                [f.id for f in data["shapes"]],
+            )
+            for fid, data in parsed.folders.items()
+        }
+
+    def test_streaming_matches_full_load(
+        self,
+        tmp_path,
+        sample_folder_feature,
+        sample_marker_feature,
+        sample_line_feature,
+        sample_shape_feature,
+    ):
+        """Streaming and full-load parsing organize features identically."""
+        orphan = dict(sample_marker_feature, id="orphan-1")
+        orphan["properties"] = {
+            k: v for k, v in sample_marker_feature["properties"].items() if k != "folderId"
+        }
+        # Folder appears after its children to exercise the deferred id pass.
+        geojson = {
+            "features": [
+                sample_marker_feature,
+                sample_line_feature,
+                orphan,
+                sample_shape_feature,
+                sample_folder_feature,
+            ],
+            "type": "FeatureCollection",
+        }
+        p = tmp_path / "export.json"
+        p.write_text(json.dumps(geojson, indent=2), encoding="utf-8")
+
+        full = parse_geojson(p, streaming=False)
+        streamed = parse_geojson(p, streaming=True)
+        assert self._folder_view(streamed) == self._folder_view(full)
+        assert "orphaned_features" in streamed.folders
+
+    def test_iter_features_small_chunks(self, tmp_path, sample_marker_feature, sample_line_feature):
+        """Values straddling read boundaries decode correctly."""
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [sample_marker_feature, sample_line_feature, 12345, None],
+        }
+        p = tmp_path / "export.json"
+        p.write_text(json.dumps(geojson), encoding="utf-8")
+
+        feats = list(iter_geojson_features(p, chunk_size=3))
+        assert [f.id for f in feats] == ["marker-1", "line-1"]
+        assert feats[1].coordinates == [[-114.5, 45.5], [-114.6, 45.6]]
+
+    def test_streaming_empty_features(self, tmp_path):
+        p = tmp_path / "empty.json"
+        p.write_text(json.dumps({"type": "FeatureCollection", "features": []}), encoding="utf-8")
+        with pytest.raises(ValueError, match="No features found"):
+            parse_geojson(p, streaming=True)
+
+    def test_streaming_wrong_type(self, tmp_path, sample_marker_feature):
+        p = tmp_path / "feature.json"
+        p.write_text(
+            json.dumps({"type": "Feature", "features": [sample_marker_feature]}),
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match="FeatureCollection"):
+            parse_geojson(p, streaming=True)
+
+    def test_streaming_top_level_array(self, tmp_path):
+        p = tmp_path / "array.json"
+        p.write_text("[1, 2]", encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON object at the top level"):
+            parse_geojson(p, streaming=True)
+
+    def test_streaming_malformed_json(self, tmp_path):
+        p = tmp_path / "bad.json"
+        p.write_text('{"type": "FeatureCollection", "features": [{"id": 1} {"id": 2}]}', encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON parse error"):
+            parse_geojson(p, streaming=True)
+
+
 class TestGetFileSummary:
     """Tests for get_file_summary function."""
 
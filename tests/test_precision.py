@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from cairn.core.config import IconMappingConfig
+from cairn.core.parser import ParsedFeature
+from cairn.core.precision import FULL_PRECISION, CoordinatePrecision, resolve_precision
+from cairn.core.writers import write_gpx_tracks_maybe_split, write_kml_shapes
+from cairn.io.caltopo_geojson import write_caltopo_geojson
+from cairn.model import MapDocument, Track, Waypoint
+
+
+def test_full_precision_matches_float_repr():
+    assert FULL_PRECISION.is_full
+    assert FULL_PRECISION.format_coord(1 / 3) == repr(1 / 3)
+    assert FULL_PRECISION.format_ele(-107) == "-107"
+
+
+def test_fixed_formatting_rounds_and_trims_zeros():
+    p = CoordinatePrecision(coord_decimals=6, ele_decimals=1)
+    assert p.format_coord(-105.1234567) == "-105.123457"
+    assert p.format_coord(40.25) == "40.25"
+    assert p.format_coord(40.0) == "40.0"
+    assert p.format_ele(2500.55) == "2500.6"
+    assert p.format_ele(None) == "None"
+    assert p.round_coord(-105.1234567) == -105.123457
+
+
+@pytest.mark.parametrize("bad", [-1, 16, 2.5, True])
+def test_invalid_decimals_rejected(bad):
+    with pytest.raises(ValueError):
+        CoordinatePrecision(coord_decimals=bad)
+
+
+def test_resolve_precision_flags_override_config(tmp_path: Path):
+    cfg_path = tmp_path / "cairn_config.yaml"
+    cfg_path.write_text("coordinate_decimals: 5\nelevation_decimals: 0\n", encoding="utf-8")
+    config = IconMappingConfig(cfg_path)
+
+    assert resolve_precision(config=config) == CoordinatePrecision(5, 0)
+    assert resolve_precision(7, None, config=config) == CoordinatePrecision(7, 0)
+    assert resolve_precision() is FULL_PRECISION
+
+
+def test_invalid_config_value_fails_at_load(tmp_path: Path):
+    cfg_path = tmp_path / "cairn_config.yaml"
+    cfg_path.write_text("coordinate_decimals: 99\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        IconMappingConfig(cfg_path)
+
+
+def test_gpx_and_kml_writers_apply_precision(tmp_path: Path):
+    feature = ParsedFeature(
+        {
+            "id": "t1",
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[-107.123456789, 37.987654321, 1234.5678]],
+            },
+            "properties": {"class": "Shape", "title": "T"},
+        }
+    )
+    precision = CoordinatePrecision(coord_decimals=5, ele_decimals=1)
+
+    [(gpx, _, _)] = write_gpx_tracks_maybe_split(
+        [feature], tmp_path / "t.gpx", "F", precision=precision
+    )
+    text = gpx.read_text(encoding="utf-8")
+    assert '<trkpt lat="37.98765" lon="-107.12346">' in text
+    assert "<ele>1234.6</ele>" in text
+
+    kml = tmp_path / "s.kml"
+    write_kml_shapes([feature], kml, "F", precision=precision)
+    assert "<coordinates>-107.12346,37.98765,1234.6</coordinates>" in kml.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_geojson_writer_applies_precision(tmp_path: Path):
+    doc = MapDocument(metadata={"source": "OnX_gpx"})
+    doc.ensure_folder("f", "F")
+    doc.add_item(Waypoint(id="w", folder_id="f", name="W", lon=-105.1234567, lat=40.7654321))
+    doc.add_item(
+        Track(
+            id="t",
+            folder_id="f",
+            name="T",
+            points=[(-105.1234567, 40.7654321, 2500.55, 1700000000000)],
+        )
+    )
+    out = tmp_path / "out.json"
+
+    write_caltopo_geojson(doc, out, precision=CoordinatePrecision(6, 1))
+
+    data = json.loads(out.read_text(encoding="utf-8"))
+    by_id = {f["id"]: f for f in data["features"]}
+    assert by_id["w"]["geometry"]["coordinates"] == [-105.123457, 40.765432]
+    assert by_id["t"]["geometry"]["coordinates"] == [
+        [-105.123457, 40.765432, 2500.6, 1700000000000.0]
+    ]
@@ -464,3 +464,92 @@ def test_coordinate_rounding_tolerance():
     # Should be deduplicated (same after rounding to 6 decimals)
     assert len(doc.shapes()) == 1
     assert report.dropped_count == 1
+
+
+def test_min_rotation_matches_brute_force_with_repeats():
+    """Linear-time rotation agrees with exhaustive search on periodic input."""
+    seq = [(1, 0), (0, 1), (1, 0), (0, 1), (0, 0), (1, 0), (0, 1)]
+    brute = min(tuple(seq[i:] + seq[:i]) for i in range(len(seq)))
+    assert _min_rotation(seq) == brute
+
+
+def test_signature_digest_is_compact_and_stable():
+    """Digest equality mirrors signature equality, including -0.0 vs 0.0."""
+    from cairn.core.shape_dedup import signature_digest
+
+    a = ("LineString", ((0.0, 1.0), (2.0, 3.0)))
+    b = ("LineString", ((-0.0, 1.0), (2.0, 3.0)))
+    c = ("LineString", ((0.0, 1.0), (2.0, 3.5)))
+    assert len(signature_digest(a)) == 16
+    assert signature_digest(a) == signature_digest(b)
+    assert signature_digest(a) != signature_digest(c)
+    assert signature_digest(("Polygon", a[1], c[1])) != signature_digest(("Polygon", c[1], a[1]))
+
+
+def test_shape_dedup_many_groups_preserves_order_and_report():
+    """Winner selection and removal across many groups keep document order."""
+    doc = MapDocument()
+    for g in range(50):
+        for k in range(3):
+            doc.add_item(
+                Track(
+                    id=f"t{g}-{k}",
+                    folder_id="f1",
+                    name=f"Line {g}",
+                    points=[(g, 0.0, None, None), (g, 1.0, None, None)],
+                    # The middle copy has the richest notes and should win.
+                    notes="best" if k == 1 else "",
+                )
+            )
+
+    report, dropped = apply_shape_dedup(doc)
+
+    assert [i.id for i in doc.items] == [f"t{g}-1" for g in range(50)]
+    assert [grp.kept_id for grp in report.groups] == [f"t{g}-1" for g in range(50)]
+    assert report.groups[0].dropped_ids == ["t0-0", "t0-2"]
+    assert len(dropped) == 100
+
+
+def _zigzag(n: int, offset: float = 0.0):
+    return [(-114.0 + i * 1e-4, 45.0 + (i % 2) * 5e-5 + offset, None, None) for i in range(n)]
+
+
+def test_fuzzy_line_dedup_is_opt_in_and_catches_resampled_copies():
+    """A resampled, slightly offset, reversed copy is dropped only in fuzzy mode."""
+    base = _zigzag(60)
+    copy_pts = list(reversed(base[::2] + [base[-1]]))
+    copy_pts = [(lon, lat + 2e-5, e, t) for lon, lat, e, t in copy_pts]  # ~2m north
+
+    def make_doc():
+        doc = MapDocument()
+        doc.add_item(Track(id="a", folder_id="f", name="Ridge", points=base))
+        doc.add_item(Track(id="b", folder_id="f", name="Ridge", points=copy_pts, notes="more"))
+        return doc
+
+    doc = make_doc()
+    report, dropped = apply_shape_dedup(doc)
+    assert dropped == [] and report.groups == []
+
+    doc = make_doc()
+    report, dropped = apply_shape_dedup(doc, line_tolerance_m=10.0)
+    assert [i.id for i in doc.items] == ["b"]
+    assert [i.id for i in dropped] == ["a"]
+    grp = report.groups[0]
+    assert (grp.kind, grp.title, grp.kept_id, grp.reason) == (
+        "LineString",
+        "Ridge",
+        "b",
+        "line_distance_within_tolerance",
+    )
+
+
+def test_fuzzy_line_dedup_rejects_distinct_paths_and_titles():
+    """Lines farther apart than the tolerance, or with other titles, survive."""
+    doc = MapDocument()
+    doc.add_item(Track(id="a", folder_id="f", name="Ridge", points=_zigzag(40)))
+    doc.add_item(Track(id="b", folder_id="f", name="Ridge", points=_zigzag(40, offset=5e-4)))  # ~55m
+    doc.add_item(Track(id="c", folder_id="f", name="Valley", points=_zigzag(40, offset=1e-5)))
+
+    report, dropped = apply_shape_dedup(doc, line_tolerance_m=10.0)
+    assert dropped == []
+    assert [i.id for i in doc.items] == ["a", "b", "c"]
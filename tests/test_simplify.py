@@ -0,0 +1,151 @@
+import math
+
+import pytest
+
+from cairn.core.parser import ParsedFeature
+from cairn.core.simplify import (
+    apply_track_simplification,
+    normalize_simplify_method,
+    simplify_indices,
+    simplify_parsed_features,
+    simplify_track_points,
+)
+from cairn.model import MapDocument, Track, TrackPoints
+
+# ~1 m in degrees of latitude.
+_M = 1.0 / 111195.0
+
+
+def _zigzag(n: int, amplitude_m: float):
+    """A straight northward line with +/- amplitude_m east-west jitter."""
+    lons = [(-1) ** i * amplitude_m * _M for i in range(n)]
+    lats = [45.0 + i * _M for i in range(n)]
+    return lons, lats
+
+
+def _track_points(lons, lats) -> TrackPoints:
+    pts = TrackPoints()
+    for i, (lon, lat) in enumerate(zip(lons, lats)):
+        pts.append(
+            (
+                lon,
+                lat,
+                1000.0 + i if i % 3 else None,
+                1_700_000_000_000 + i * 1000,
+            )
+        )
+    return pts
+
+
+def test_jitter_below_tolerance_collapses_to_endpoints():
+    lons, lats = _zigzag(2000, 0.2)
+    assert simplify_indices(lons, lats, 1.0, method="dp") == [0, 1999]
+
+
+def test_visvalingam_removes_most_jitter():
+    # VW bounds triangle area (tolerance**2), not offset, so a little jitter
+    # survives along long bases; it must still drop the bulk of the vertices.
+    lons, lats = _zigzag(2000, 0.2)
+    idx = simplify_indices(lons, lats, 1.0, method="vw")
+    assert idx[0] == 0 and idx[-1] == 1999
+    assert len(idx) < 2000 * 0.15
+    assert idx == sorted(set(idx))
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_corners_survive(method):
+    # An L-shape sampled every metre: 500 m north then 500 m east.
+    lons = [0.0] * 500 + [i * _M for i in range(1, 501)]
+    lats = [45.0 + i * _M for i in range(500)] + [45.0 + 499 * _M] * 500
+    idx = simplify_indices(lons, lats, 2.0, method=method)
+    assert idx[0] == 0 and idx[-1] == 999
+    assert len(idx) <= 5
+    assert any(abs(i - 499) <= 3 for i in idx)
+
+
+def test_douglas_peucker_keeps_out_and_back_turnaround():
+    # Walk 300 m north and come back: every vertex is on the start→end line,
+    # so only segment distance (not line distance) keeps the turnaround.
+    lats = [45.0 + i * 5 * _M for i in range(61)] + [
+        45.0 + i * 5 * _M for i in range(59, -1, -1)
+    ]
+    lons = [0.0] * len(lats)
+    idx = simplify_indices(lons, lats, 5.0, method="dp")
+    assert 60 in idx
+
+
+def test_zero_tolerance_and_short_lines_are_untouched():
+    lons, lats = _zigzag(50, 0.2)
+    assert simplify_indices(lons, lats, 0) == list(range(50))
+    assert simplify_indices(lons[:2], lats[:2], 10.0) == [0, 1]
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError, match="simplification method"):
+        simplify_indices([0.0, 1.0, 2.0], [0.0, 0.0, 0.0], 1.0, method="xx")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        normalize_simplify_method("bogus")
+    assert normalize_simplify_method("Visvalingam") == "vw"
+    assert normalize_simplify_method(None) == "dp"
+
+
+def test_retained_points_keep_elevation_and_time():
+    lons = [0.0] * 500 + [i * _M for i in range(1, 501)]
+    lats = [45.0 + i * _M for i in range(500)] + [45.0 + 499 * _M] * 500
+    pts = _track_points(lons, lats)
+    out = simplify_track_points(pts, 2.0)
+    idx = simplify_indices(lons, lats, 2.0)
+    assert len(out) == len(idx)
+    for k, i in enumerate(idx):
+        assert out[k] == pts[i]
+
+
+def test_apply_track_simplification_reports_per_track_reduction():
+    lons, lats = _zigzag(1000, 0.2)
+    doc = MapDocument()
+    doc.add_item(Track(id="t1", folder_id="f", name="Jitter", points=_track_points(lons, lats)))
+    doc.add_item(
+        Track(id="t2", folder_id="f", name="Short", points=_track_points(lons[:2], lats[:2]))
+    )
+
+    events = []
+
+    class _Trace:
+        def emit(self, event):
+            events.append(event)
+
+    report = apply_track_simplification(doc, 1.0, trace=_Trace())
+
+    by_id = {t.id: t for t in report.tracks}
+    assert (by_id["t1"].before, by_id["t1"].after) == (1000, 2)
+    assert (by_id["t2"].before, by_id["t2"].after) == (2, 2)
+    assert report.removed_count == 998
+    assert math.isclose(report.reduction, 998 / 1002)
+    assert [e["id"] for e in events] == ["t1"]
+    assert len(doc.tracks()[0].points) == 2
+
+
+def test_simplify_parsed_features_keeps_full_coordinate_entries():
+    lons, lats = _zigzag(300, 0.2)
+    coords = [[lon, lat, 1000 + i] for i, (lon, lat) in enumerate(zip(lons, lats))]
+    line = ParsedFeature(
+        {
+            "id": "l1",
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": coords},
+            "properties": {"class": "Shape", "title": "Line"},
+        }
+    )
+    point = ParsedFeature(
+        {
+            "id": "p1",
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0.0, 45.0]},
+            "properties": {"class": "Marker", "title": "Point"},
+        }
+    )
+
+    report = simplify_parsed_features([line, point], 1.0)
+
+    assert line.coordinates == [coords[0], coords[-1]]
+    assert [(t.id, t.before, t.after) for t in report.tracks] == [("l1", 300, 2)]
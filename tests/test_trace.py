@@ -0,0 +1,209 @@
+import gzip
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import typer
+
+from cairn.commands.convert_cmd import resolve_trace_options
+from cairn.core.trace import TraceReader, TraceWriter, event_level
+
+
+def _emit_items(trace: TraceWriter, n: int) -> None:
+    for i in range(n):
+        trace.emit({"event": "input.wpt", "i": i})
+
+
+def test_trace_roundtrip_preserves_order_and_adds_ts(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    with TraceWriter(path) as trace:
+        trace.emit({"event": "run.start"})
+        _emit_items(trace, 2000)
+        trace.emit({"event": "run.end", "ts": "fixed"})
+
+    events = list(TraceReader(path))
+    assert [e["event"] for e in events[:2]] == ["run.start", "input.wpt"]
+    assert [e["i"] for e in events[1:-1]] == list(range(2000))
+    assert all("ts" in e for e in events)
+    assert events[-1]["ts"] == "fixed"
+
+
+def test_trace_emit_copies_event(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    event = {"event": "input.wpt", "name": "A"}
+    with TraceWriter(path) as trace:
+        trace.emit(event)
+        event["name"] = "B"
+    assert next(iter(TraceReader(path)))["name"] == "A"
+    assert "ts" not in event
+
+
+def test_trace_flush_makes_events_visible(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    trace = TraceWriter(path)
+    try:
+        trace.emit({"event": "run.start"})
+        trace.flush()
+        assert [e["event"] for e in TraceReader(path)] == ["run.start"]
+    finally:
+        trace.close()
+    with pytest.raises(ValueError):
+        trace.emit({"event": "run.end"})
+
+
+def test_trace_gzip_by_suffix_and_reader_sniffs_format(tmp_path: Path):
+    path = tmp_path / "trace.jsonl.gz"
+    with TraceWriter(path) as trace:
+        _emit_items(trace, 100)
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+    # Detected from content, not the file name.
+    renamed = path.rename(tmp_path / "trace.jsonl")
+    assert [e["i"] for e in TraceReader(renamed)] == list(range(100))
+
+
+def test_trace_reader_reads_legacy_plain_jsonl(tmp_path: Path):
+    path = tmp_path / "legacy.jsonl"
+    path.write_text('{"event": "run.start"}\n\n{"event": "run.end"}\n', encoding="utf-8")
+    assert [e["event"] for e in TraceReader(path)] == ["run.start", "run.end"]
+
+
+def test_trace_reader_tolerates_truncated_gzip(tmp_path: Path):
+    path = tmp_path / "trace.jsonl.gz"
+    lines = "".join(json.dumps({"event": "input.wpt", "i": i}) + "\n" for i in range(500))
+    data = gzip.compress(lines.encode("utf-8"))
+    path.write_bytes(data[: len(data) // 2])
+    events = list(TraceReader(path))
+    assert [e["i"] for e in events] == list(range(len(events)))
+
+
+def test_trace_zstd_roundtrip(tmp_path: Path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "trace.jsonl.zst"
+    with TraceWriter(path) as trace:
+        _emit_items(trace, 100)
+    assert [e["i"] for e in TraceReader(path)] == list(range(100))
+
+
+def test_trace_levels_filter_events(tmp_path: Path):
+    assert event_level("run.start") == "run"
+    assert event_level("dedup.report") == "stage"
+    assert event_level("input.wpt.warning") == "stage"
+    assert event_level("output.feature") == "item"
+
+    path = tmp_path / "trace.jsonl"
+    with TraceWriter(path, level="stage") as trace:
+        trace.emit({"event": "run.start"})
+        trace.emit({"event": "input.wpt"})
+        trace.emit({"event": "dedup.report"})
+    events = list(TraceReader(path))
+    assert [e["event"] for e in events] == ["trace.config", "run.start", "dedup.report"]
+    assert events[0]["level"] == "stage"
+
+    with TraceWriter(path, level="run") as trace:
+        trace.emit({"event": "run.start"})
+        trace.emit({"event": "dedup.report"})
+    assert [e["event"] for e in TraceReader(path)] == ["trace.config", "run.start"]
+
+
+def test_trace_sampling_is_deterministic_per_event_type(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    with TraceWriter(path, sample=0.1) as trace:
+        for i in range(100):
+            trace.emit({"event": "input.wpt", "i": i})
+            trace.emit({"event": "output.feature", "i": i})
+            trace.emit({"event": "input.wpt.warning", "i": i})
+    events = list(TraceReader(path))
+    by_type = {}
+    for e in events[1:]:
+        by_type.setdefault(e["event"], []).append(e["i"])
+    assert by_type["input.wpt"] == list(range(0, 100, 10))
+    assert by_type["output.feature"] == list(range(0, 100, 10))
+    # Stage-level events are never sampled.
+    assert by_type["input.wpt.warning"] == list(range(100))
+
+
+def test_trace_rejects_bad_options(tmp_path: Path):
+    with pytest.raises(ValueError):
+        TraceWriter(tmp_path / "a.jsonl", level="verbose")
+    with pytest.raises(ValueError):
+        TraceWriter(tmp_path / "b.jsonl", sample=0)
+    with pytest.raises(ValueError):
+        TraceWriter(tmp_path / "c.jsonl", compression="lz4")
+
+    assert resolve_trace_options(" Stage ", 0.5) == ("stage", 0.5)
+    with pytest.raises(typer.BadParameter):
+        resolve_trace_options("verbose", 1.0)
+    with pytest.raises(typer.BadParameter):
+        resolve_trace_options("item", 1.5)
+
+
+def test_trace_encodes_at_emit_time(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    payload = [1]
+    with TraceWriter(path) as trace:
+        trace.emit({"event": "input.wpt", "l": payload})
+        payload.append(2)
+    assert next(iter(TraceReader(path)))["l"] == [1]
+
+
+def _wait_for_events(path: Path, n: int, timeout: float = 5.0) -> list:
+    deadline = time.monotonic() + timeout
+    while True:
+        events = list(TraceReader(path)) if path.stat().st_size else []
+        if len(events) >= n or time.monotonic() > deadline:
+            return events
+        time.sleep(0.05)
+
+
+def test_trace_stage_events_and_idle_items_reach_disk_without_close(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    trace = TraceWriter(path)
+    try:
+        trace.emit({"event": "run.start"})
+        assert [e["event"] for e in _wait_for_events(path, 1)] == ["run.start"]
+
+        # A partial item batch is written once the caller goes quiet.
+        _emit_items(trace, 3)
+        assert len(_wait_for_events(path, 4)) == 4
+    finally:
+        trace.close()
+
+
+def test_trace_unclosed_writer_is_flushed_at_exit(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    code = (
+        "import sys\n"
+        "from cairn.core.trace import TraceWriter\n"
+        f"trace = TraceWriter({str(path)!r})\n"
+        "for i in range(11):\n"
+        "    trace.emit({'event': 'input.wpt', 'i': i})\n"
+        "sys.exit(3)\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run([sys.executable, "-c", code], cwd=repo_root, timeout=60)
+    assert proc.returncode == 3
+    assert [e["i"] for e in TraceReader(path)] == list(range(11))
+
+
+def test_trace_idle_drain_does_not_deadlock_with_blocked_producer(tmp_path: Path, monkeypatch):
+    from cairn.core import trace as trace_mod
+
+    monkeypatch.setattr(trace_mod, "_FLUSH_INTERVAL_S", 0.01)
+    path = tmp_path / "trace.jsonl"
+    # Queue holds a single batch.
+    trace = TraceWriter(path, queue_size=trace_mod._BATCH_SIZE)
+    try:
+        # Act as a producer mid-handoff: hold the lock while the writer idles
+        # out, then block on the full queue. The writer must keep draining.
+        with trace._lock:
+            time.sleep(0.1)
+            trace._queue.put(['{"event":"a"}'], timeout=5)
+            trace._queue.put(['{"event":"b"}'], timeout=5)
+            trace._queue.put(['{"event":"c"}'], timeout=5)
+    finally:
+        trace.close()
+    assert [e["event"] for e in TraceReader(path)] == ["a", "b", "c"]
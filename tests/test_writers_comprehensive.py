@@ -11,6 +11,8 @@ from cairn.core.parser import ParsedFeature
 from cairn.core.writers import (
     get_name_changes,
     clear_name_changes,
+    capture_name_changes,
+    merge_name_changes,
     track_name_change,
     verify_gpx_waypoint_order,
     log_waypoint_order,
@@ -22,6 +24,7 @@ from cairn.core.writers import (
     write_gpx_waypoints_maybe_split,
     write_gpx_tracks_maybe_split,
     write_kml_shapes,
+    write_kml_shapes_maybe_split,
     verify_sanitization_preserves_sort_order,
 )
 from cairn.core.config import load_config
@@ -70,6 +73,21 @@ def test_clear_name_changes_resets_both_types():
     assert len(changes["tracks"]) == 0
 
 
+def test_capture_name_changes_isolates_and_merges_per_job_log():
+    """Changes inside a capture go to the job log until merged back."""
+    clear_name_changes()
+    track_name_change("waypoints", "A/1", "A_1")
+    with capture_name_changes() as job_changes:
+        track_name_change("tracks", "T/1", "T_1")
+    assert job_changes == {"waypoints": [], "tracks": [("T/1", "T_1")]}
+    assert get_name_changes()["tracks"] == []
+
+    merge_name_changes(job_changes)
+    changes = get_name_changes()
+    assert changes["waypoints"] == [("A/1", "A_1")]
+    assert changes["tracks"] == [("T/1", "T_1")]
+
+
 # ===== GPX Waypoint Order Verification Tests =====
 
 
@@ -634,6 +652,72 @@ def test_write_kml_shapes_includes_elevation(tmp_path):
     assert "1000" in content
 
 
+def _kml_square(title, description=None):
+    props = {"title": title, "stroke": "#FF0000"}
+    if description is not None:
+        props["description"] = description
+    return ParsedFeature({
+        "properties": props,
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [-114.0, 45.0], [-114.1, 45.0], [-114.1, 45.1], [-114.0, 45.0]
+            ]]
+        }
+    })
+
+
+def test_write_kml_shapes_escapes_text(tmp_path):
+    """Test that names and descriptions are XML-escaped."""
+    output_path = tmp_path / "shapes.kml"
+
+    write_kml_shapes([_kml_square('A & B <x> "q"', "1 < 2")], output_path, "R&D")
+
+    root = ET.parse(output_path).getroot()
+    ns = {"kml": "http://www.opengis.net/kml/2.2"}
+    assert root.find("kml:Document/kml:name", ns).text == "R&D"
+    pm = root.find("kml:Document/kml:Placemark", ns)
+    assert pm.find("kml:name", ns).text == 'A & B <x> "q"'
+    assert pm.find("kml:description", ns).text == "1 < 2"
+
+
+def test_write_kml_shapes_compact_mode(tmp_path):
+    """Test that indent=False writes the same document without whitespace."""
+    pretty = tmp_path / "pretty.kml"
+    compact = tmp_path / "compact.kml"
+    features = [_kml_square("Area 1"), _kml_square("Area 2", "notes")]
+
+    write_kml_shapes(features, pretty, "Test")
+    size = write_kml_shapes(features, compact, "Test", indent=False)
+
+    assert size == compact.stat().st_size < pretty.stat().st_size
+    assert "\n  " not in compact.read_text(encoding="utf-8")
+
+    def tree(elem):
+        return (elem.tag, (elem.text or "").strip(), [tree(c) for c in elem])
+
+    assert tree(ET.parse(pretty).getroot()) == tree(ET.parse(compact).getroot())
+
+
+def test_write_kml_shapes_maybe_split_by_bytes(tmp_path):
+    """Test that KML output splits into numbered parts with exact counts."""
+    features = [_kml_square(f"Area {i}", "x" * 300) for i in range(8)]
+    output_path = tmp_path / "shapes.kml"
+
+    parts = write_kml_shapes_maybe_split(
+        features, output_path, "Test", max_bytes=2000
+    )
+
+    assert len(parts) > 1
+    assert not output_path.exists()
+    assert parts[0][0].name == "shapes_1.kml"
+    assert sum(count for _, _, count in parts) == 8
+    for path, size, count in parts:
+        assert size == path.stat().st_size <= 2000
+        root = ET.parse(path).getroot()
+        assert len(root.findall(".//{http://www.opengis.net/kml/2.2}Placemark")) == count
+
+
 # ===== Verify Sanitization Tests =====
 
 